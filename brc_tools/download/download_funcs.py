@@ -3,10 +3,6 @@ import os
 import datetime
 import socket
 
-import pytz
-
-import numpy as np
-import pandas as pd
 import requests
 from synoptic.services import Metadata, TimeSeries
 
@@ -3,7 +3,6 @@ import os
 import sys
 import datetime
 import time
-import pytz
 import json
 from pathlib import Path
 
@@ -11,7 +10,6 @@ import numpy as np
 from scipy.signal import medfilt
 import matplotlib.pyplot as plt
 import polars as pl
-import pandas as pd
 
 from synoptic.services import Metadata, Latest, TimeSeries
 
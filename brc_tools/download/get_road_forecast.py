@@ -13,9 +13,10 @@ from pathlib import Path
 import numpy as np
 
 from brc_tools.download.hrrr_access import (
-    extract_nearest_values,
+    extract_point_values,
     fetch_hourly_datasets,
     get_latest_hrrr_init,
+    nearest_grid_index,
 )
 from brc_tools.download.hrrr_config import (
     DEFAULT_HRRR_PRODUCT,
@@ -149,20 +150,26 @@ def build_route_forecasts(
     """Extract derived road forecast fields for each configured waypoint."""
     query_aliases = list(ROAD_FORECAST_QUERY_MAP)
     forecasts_by_route: dict[str, dict[int, list[dict[str, float | str | None]]]] = {}
+    # Every forecast hour is on the same HRRR grid, so each waypoint's nearest
+    # cell is searched once on the first available hour and reused for the rest
+    # instead of rescanning the full grid per hour.
+    grid = next((ds for ds in hour_datasets.values() if ds is not None), None)
 
     for route_id, corridor in ROAD_CORRIDORS.items():
         waypoint_forecasts: dict[int, list[dict[str, float | str | None]]] = {}
         for waypoint_index, waypoint in enumerate(corridor["waypoints"]):
+            if grid is not None:
+                y_idx, x_idx = nearest_grid_index(grid, waypoint["lat"], waypoint["lon"])
             hourly_values = []
             for hour in range(1, max_fxx + 1):
                 ds = hour_datasets.get(hour)
                 if ds is None:
                     hourly_values.append(derive_road_fields({}))
                     continue
-                raw = extract_nearest_values(
+                raw = extract_point_values(
                     ds,
-                    waypoint["lat"],
-                    waypoint["lon"],
+                    y_idx=y_idx,
+                    x_idx=x_idx,
                     aliases=query_aliases,
                 )
                 hourly_values.append(derive_road_fields(raw))
@@ -5,6 +5,7 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Mapping
 
@@ -12,10 +13,13 @@ import numpy as np
 import xarray as xr
 from herbie import Herbie
 
+from brc_tools.utils.grib import CFGRIB_INDEXPATH
+
 LOG = logging.getLogger(__name__)
 
 _GRIB_MAGIC = b"GRIB"
 _MIN_GRIB_SIZE = 1000
+DEFAULT_FETCH_WORKERS = 4
 _DEFAULT_CACHE_DIR = (
     Path(os.environ.get("BRC_TOOLS_HRRR_CACHE", ""))
     if os.environ.get("BRC_TOOLS_HRRR_CACHE")
@@ -152,12 +156,17 @@ def fetch_hour_dataset(
     if not _validate_cached_grib(getattr(herbie_obj, "grib", None)):
         _purge_cached_files(herbie_obj)
 
+    # A subset Herbie deletes after reading would leave its index orphaned, so the
+    # index is only persisted for subsets that stay on disk.
+    xr_kwargs = {} if remove_grib else {"backend_kwargs": {"indexpath": CFGRIB_INDEXPATH}}
     datasets: list[xr.Dataset] = []
     for alias, search_string in query_map.items():
         last_exc: Exception | None = None
         for attempt in range(1, retries + 1):
             try:
-                raw_ds = herbie_obj.xarray(search_string, remove_grib=remove_grib)
+                raw_ds = herbie_obj.xarray(
+                    search_string, remove_grib=remove_grib, **xr_kwargs
+                )
                 renamed = _rename_data_var(raw_ds, alias)
                 normalized = _normalize_hour_dataset(renamed, init_time, fxx)
                 datasets.append(normalized[[alias]])
@@ -194,12 +203,18 @@ def fetch_hourly_datasets(
     product: str = "sfc",
     cache_dir: str | os.PathLike[str] | None = None,
     remove_grib: bool = True,
+    workers: int = DEFAULT_FETCH_WORKERS,
 ) -> dict[int, xr.Dataset]:
-    """Fetch multiple HRRR forecast hours, skipping hours that fail."""
-    datasets: dict[int, xr.Dataset] = {}
-    for fxx in range(1, max_fxx + 1):
+    """Fetch multiple HRRR forecast hours, skipping hours that fail.
+
+    Each hour is its own GRIB file with its own Herbie object, so up to
+    ``workers`` hours download and decode concurrently on threads.  The result
+    is keyed and ordered by forecast hour regardless of completion order.
+    """
+
+    def _fetch(fxx: int) -> xr.Dataset | None:
         try:
-            datasets[fxx] = fetch_hour_dataset(
+            ds = fetch_hour_dataset(
                 init_time,
                 fxx,
                 query_map,
@@ -207,10 +222,16 @@ def fetch_hourly_datasets(
                 cache_dir=cache_dir,
                 remove_grib=remove_grib,
             )
-            LOG.info("Fetched HRRR hour f%03d with %d fields", fxx, len(datasets[fxx].data_vars))
         except Exception as exc:  # pragma: no cover - depends on Herbie/network state
             LOG.warning("Skipping HRRR hour f%03d: %s", fxx, exc)
-    return datasets
+            return None
+        LOG.info("Fetched HRRR hour f%03d with %d fields", fxx, len(ds.data_vars))
+        return ds
+
+    hours = list(range(1, max_fxx + 1))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(hours) or 1))) as pool:
+        fetched = list(pool.map(_fetch, hours))
+    return {fxx: ds for fxx, ds in zip(hours, fetched, strict=True) if ds is not None}
 
 
 def nearest_grid_index(ds: xr.Dataset, lat: float, lon: float) -> tuple[int, int]:
@@ -240,15 +261,15 @@ def extract_point_values(
         if alias not in ds.data_vars:
             continue
         arr = ds[alias]
-        indexers = {}
-        if "time" in arr.dims:
-            indexers["time"] = 0
+        # One isel covers the time pick, the grid point and any other
+        # length-1 dims, instead of indexing and then squeezing
+        indexers = {d: 0 for d in arr.dims if d == "time" or arr.sizes[d] == 1}
         if "y" in arr.dims:
             indexers["y"] = y_idx
         if "x" in arr.dims:
             indexers["x"] = x_idx
 
-        point = arr.isel(**indexers).squeeze(drop=True)
+        point = arr.isel(indexers, drop=True)
         if point.size != 1:
             continue
 
@@ -6,10 +6,12 @@ import socket
 import os
 import requests
 
-import numpy as np
-import pandas as pd
 
 def clean_dataframe_for_json(df):
+    # Local import: the NWP exporters use this module only to upload JSON, and
+    # should not pay for loading pandas to do it.
+    import pandas as pd
+
     # If the dataframe is a Polars dataframe, convert it to Pandas.
     if hasattr(df, "to_pandas"):
         df = df.to_pandas()
@@ -1,9 +1,13 @@
-"""GRIB cache validation and cleanup helpers."""
+"""GRIB cache validation and cleanup helpers, plus the decoded-tile cache."""
 
+import hashlib
 import logging
 import os
+import threading
 from pathlib import Path
 
+import xarray as xr
+
 logger = logging.getLogger(__name__)
 
 _GRIB_MAGIC = b"GRIB"
@@ -41,3 +45,47 @@ def purge_cached_files(herbie_inst):
                 os.remove(path)
             except FileNotFoundError:
                 pass
+
+
+def decoded_tile_path(cache_dir, *parts) -> Path:
+    """Where one decoded, cropped field is kept, keyed by everything that shapes it.
+
+    ``parts`` are the fetch inputs -- model, member, init, fxx, product, search,
+    output name, bbox, crop method -- stringified into a short hash so a changed
+    region or level never aliases an older tile.
+    """
+    key = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"tile_{key}.nc"
+
+
+def read_decoded_tile(path: Path):
+    """The cached tile at ``path`` loaded into memory, or ``None`` on a miss.
+
+    An unreadable tile (truncated by a killed job, say) counts as a miss and is
+    removed so the next fetch rewrites it.
+    """
+    if not path.exists():
+        return None
+    try:
+        with xr.open_dataset(path) as ds:
+            return ds.load()
+    except Exception as exc:  # noqa: BLE001 - any bad tile -> refetch
+        logger.warning("Dropping unreadable decoded tile %s: %s", path.name, exc)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def write_decoded_tile(ds, path: Path) -> None:
+    """Write ``ds`` to ``path`` atomically (readers never see a partial file)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        ds.to_netcdf(tmp)
+        os.replace(tmp, path)
+    except Exception as exc:  # noqa: BLE001 - caching is best-effort
+        logger.warning("Could not cache decoded tile %s: %s", path.name, exc)
+        if tmp.exists():
+            tmp.unlink()
@@ -18,7 +18,9 @@ from herbie import Herbie
 
 from brc_tools.nwp._crop import nearest_point_value
 from brc_tools.nwp.derived import crosswind_kt, headwind_kt, wind_direction, wind_speed, KT_PER_MS
+from brc_tools.nwp.point_extract import valid_times_iso
 from brc_tools.nwp.source import load_lookups
+from brc_tools.utils.grib import CFGRIB_INDEXPATH
 
 LOG = logging.getLogger(__name__)
 
@@ -27,6 +29,13 @@ DEFAULT_MAX_FXX = 6
 SEARCH_U10 = "UGRD:10 m above ground"
 SEARCH_V10 = "VGRD:10 m above ground"
 SEARCH_GUST = "GUST:surface"
+# One regex for all three, so each forecast hour is subset and opened once.
+SEARCH_WINDS = f"(?:{SEARCH_U10}|{SEARCH_V10}|{SEARCH_GUST})"
+
+# cfgrib short names for each field, in order of preference
+_U10_NAMES = ("u10", "UGRD")
+_V10_NAMES = ("v10", "VGRD")
+_GUST_NAMES = ("gust", "GUST", "i10fg", "fg10")
 
 
 def fetch_airport_winds(
@@ -43,16 +52,7 @@ def fetch_airport_winds(
     slices: list[xr.Dataset] = []
     for fxx in forecast_hours:
         H = Herbie(init_time, model="hrrr", product=product, fxx=int(fxx))
-        pieces: list[xr.Dataset] = []
-        for search in (SEARCH_U10, SEARCH_V10, SEARCH_GUST):
-            try:
-                piece = H.xarray(search, remove_grib=False)
-            except Exception as exc:
-                LOG.warning("Herbie fetch failed f%03d %r: %s", int(fxx), search, exc)
-                continue
-            if isinstance(piece, list):
-                piece = xr.merge(piece, compat="override", combine_attrs="drop")
-            pieces.append(_clean_dataset(piece))
+        pieces = _wind_pieces(H, int(fxx))
         if not pieces:
             continue
         slices.append(xr.merge(pieces, compat="override", combine_attrs="drop"))
@@ -82,9 +82,9 @@ def build_airport_crosswind_payload(
 
     pt = nearest_point_value(ds, lat, lon, method="kdtree_2d")
 
-    u = np.asarray(pt["u10"].values if "u10" in pt.data_vars else pt["UGRD"].values)
-    v = np.asarray(pt["v10"].values if "v10" in pt.data_vars else pt["VGRD"].values)
-    gust_ms = _get_gust_ms(pt)
+    u = _pick_var(pt, _U10_NAMES, required=True)
+    v = _pick_var(pt, _V10_NAMES, required=True)
+    gust_ms = _pick_var(pt, _GUST_NAMES)
 
     speed_kt = wind_speed(u, v) * KT_PER_MS
     dir_deg = wind_direction(u, v)
@@ -147,6 +147,33 @@ def _airport_config(airport: str) -> dict[str, object]:
     return airports[airport]
 
 
+def _wind_pieces(H: Herbie, fxx: int) -> list[xr.Dataset]:
+    """U/V/gust for one forecast hour, from a single combined Herbie search.
+
+    Falls back to one search per field if the combined read fails, so a single
+    bad message still costs only that field rather than the whole hour.
+    """
+    try:
+        got = H.xarray(SEARCH_WINDS, remove_grib=False,
+                       backend_kwargs={"indexpath": CFGRIB_INDEXPATH})
+        return [_clean_dataset(p) for p in (got if isinstance(got, list) else [got])]
+    except Exception as exc:
+        LOG.warning("Combined Herbie fetch failed f%03d: %s; retrying per field", fxx, exc)
+
+    pieces: list[xr.Dataset] = []
+    for search in (SEARCH_U10, SEARCH_V10, SEARCH_GUST):
+        try:
+            piece = H.xarray(search, remove_grib=False,
+                             backend_kwargs={"indexpath": CFGRIB_INDEXPATH})
+        except Exception as exc:
+            LOG.warning("Herbie fetch failed f%03d %r: %s", fxx, search, exc)
+            continue
+        if isinstance(piece, list):
+            piece = xr.merge(piece, compat="override", combine_attrs="drop")
+        pieces.append(_clean_dataset(piece))
+    return pieces
+
+
 def _clean_dataset(ds: xr.Dataset) -> xr.Dataset:
     keep = {"time", "valid_time", "step", "latitude", "longitude", "y", "x"}
     drop = [n for n in ds.coords if n not in keep and n not in ds.dims]
@@ -163,11 +190,15 @@ def _clean_dataset(ds: xr.Dataset) -> xr.Dataset:
     return ds
 
 
-def _get_gust_ms(pt: xr.Dataset) -> np.ndarray | None:
-    for name in ("gust", "GUST", "i10fg", "fg10"):
-        if name in pt.data_vars:
-            return np.asarray(pt[name].values)
-    return None
+def _pick_var(pt: xr.Dataset, names: tuple[str, ...], *,
+              required: bool = False) -> np.ndarray | None:
+    """Values of the first of ``names`` present in ``pt`` (``None`` if none are)."""
+    name = next((n for n in names if n in pt.data_vars), None)
+    if name is None:
+        if required:
+            raise KeyError(f"none of {names} in dataset (have {list(pt.data_vars)})")
+        return None
+    return np.asarray(pt[name].values)
 
 
 def _nan_like(arr: np.ndarray) -> np.ndarray:
@@ -187,26 +218,17 @@ def _round_series(values: np.ndarray, precision: int) -> list[float | None]:
 
 def _time_axes(
     pt: xr.Dataset, init_time: dt.datetime
-) -> tuple[list[str], list[int]]:
+) -> tuple[list[str | None], list[int | None]]:
     init_utc = _ensure_utc(init_time)
     init_np = np.datetime64(init_utc.replace(tzinfo=None))
-    valid_times: list[str] = []
-    forecast_minutes: list[int] = []
     if "time" not in pt.coords:
-        return valid_times, forecast_minutes
-    for value in np.atleast_1d(pt["time"].values):
-        valid_times.append(_np_isoz(value))
-        delta_min = int((value - init_np) / np.timedelta64(1, "m"))
-        forecast_minutes.append(delta_min)
-    return valid_times, forecast_minutes
-
-
-def _np_isoz(value: np.datetime64) -> str:
-    seconds = value.astype("datetime64[s]").astype(int)
-    return (
-        dt.datetime.fromtimestamp(int(seconds), tz=dt.timezone.utc)
-        .strftime("%Y-%m-%dT%H:%M:%SZ")
-    )
+        return [], []
+    # The time coordinate is naive UTC already, so both axes come straight from
+    # datetime64 arithmetic -- no per-step round trip through an aware datetime.
+    times = np.atleast_1d(pt["time"].values).astype("datetime64[s]")
+    minutes = (times - init_np) / np.timedelta64(1, "m")
+    forecast_minutes = [None if np.isnan(m) else int(m) for m in minutes]
+    return valid_times_iso(pt), forecast_minutes
 
 
 def _ensure_utc(value: dt.datetime) -> dt.datetime:
@@ -6,6 +6,7 @@ import argparse
 import datetime as dt
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
@@ -14,6 +15,7 @@ import xarray as xr
 
 from brc_tools.nwp import NWPSource
 from brc_tools.nwp.derived import temp_K_to_C
+from brc_tools.nwp.point_extract import valid_times_iso
 from brc_tools.nwp.source import load_lookups
 
 LOG = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ DEFAULT_REGION = "uinta_basin"
 DEFAULT_MAX_FXX = 18
 DEFAULT_RUN_COUNT = 3
 DEFAULT_STRIDE = 2
+DEFAULT_RUN_WORKERS = 3
 DEFAULT_UPLOAD_BUCKET = "forecasts"
 # staging dir for generated JSON — runtime output stays out of the repo checkout
 DEFAULT_OUTPUT_DIR = Path("~/.cache/brc-tools/basinwx").expanduser()
@@ -103,18 +106,20 @@ def prepare_surface_dataset(ds: xr.Dataset) -> xr.Dataset:
 
     rain_flag = _maybe_field(ds, "categorical_rain", template, 0.0)
     snow_flag = _maybe_field(ds, "categorical_snow", template, 0.0)
-    precip = _maybe_field(ds, "precip_1hr", template, 0.0).clip(min=0.0)
-    snowfall = _maybe_field(ds, "snowfall_1hr", template, 0.0).clip(min=0.0)
+    precip = _maybe_field(ds, "precip_1hr", template, 0.0)
+    snowfall = _maybe_field(ds, "snowfall_1hr", template, 0.0)
 
-    rainfall_mm = precip.where(rain_flag >= 0.5, 0.0)
-    snowfall_mm = (snowfall * 1000.0).where(snow_flag >= 0.5, 0.0)
+    # _maybe_field hands back a fresh float array, so clip, scale and mask it in
+    # place rather than chaining .clip/.where into a new DataArray per step.
+    rainfall_mm = precip.copy(data=_partition(precip.values, rain_flag.values))
+    snowfall_mm = snowfall.copy(data=_partition(snowfall.values, snow_flag.values, 1000.0))
 
     prepared = xr.Dataset(coords=ds.coords)
     prepared["temperature_2m_c"] = temp_K_to_C(template).astype(float)
     prepared["wind_u_10m_ms"] = _maybe_field(ds, "wind_u_10m", template, np.nan)
     prepared["wind_v_10m_ms"] = _maybe_field(ds, "wind_v_10m", template, np.nan)
-    prepared["rainfall_1h_mm"] = rainfall_mm.astype(float)
-    prepared["snowfall_1h_mm"] = snowfall_mm.astype(float)
+    prepared["rainfall_1h_mm"] = rainfall_mm
+    prepared["snowfall_1h_mm"] = snowfall_mm
 
     for name, spec in FIELD_SPECS.items():
         prepared[name].attrs.update(
@@ -143,13 +148,12 @@ def build_surface_payload(
 ) -> dict[str, object]:
     """Serialize a reduced HRRR surface dataset into the BasinWX JSON contract."""
     lat_grid, lon_grid = _extract_grid(ds)
-    valid_times = [_isoformat_utc(_to_datetime(value)) for value in ds.time.values]
+    valid_times = valid_times_iso(ds)
     init_utc = _ensure_utc(init_time)
     init_np = np.datetime64(init_utc.replace(tzinfo=None))
-    forecast_hours = [
-        int((value - init_np) / np.timedelta64(1, "h"))
-        for value in ds.time.values
-    ]
+    forecast_hours = (
+        ((ds.time.values - init_np) / np.timedelta64(1, "h")).astype(int).tolist()
+    )
 
     field_shape = [int(ds.sizes["time"]), int(lat_grid.shape[0]), int(lat_grid.shape[1])]
 
@@ -202,44 +206,73 @@ def export_latest_surface_layers(
     upload: bool = False,
     upload_bucket: str = DEFAULT_UPLOAD_BUCKET,
     server_url: str | None = None,
+    run_workers: int = DEFAULT_RUN_WORKERS,
 ) -> list[Path]:
-    """Export the latest HRRR surface layers and a run index file."""
+    """Export the latest HRRR surface layers and a run index file.
+
+    ``run_workers`` runs are exported concurrently; ``1`` exports them serially.
+    If a run fails, the index still lists (and uploads) the runs that succeeded
+    before the first failure is raised.
+    """
     output_root = Path(output_dir).expanduser()
     output_root.mkdir(parents=True, exist_ok=True)
 
     src = NWPSource("hrrr")
     forecast_hours = range(0, max_fxx + 1)
+    init_times = latest_init_times(run_count, source=src)
     written_paths: list[Path] = []
     index_entries: list[dict[str, object]] = []
 
-    for init_time in latest_init_times(run_count, source=src):
-        LOG.info("Fetching HRRR surface layers for %s", init_time.strftime("%Y-%m-%d %HZ"))
-        raw = fetch_surface_dataset(
+    if upload:
+        from brc_tools.download.push_data import load_config_urls, send_json_to_all
+
+        api_key, config_urls = load_config_urls()
+        urls = [server_url] if server_url else config_urls
+
+    def _do_export(init_time: dt.datetime) -> tuple[Path, dict[str, object]]:
+        output_path, entry = _export_run(
             init_time,
+            output_root=output_root,
             forecast_hours=forecast_hours,
             region=region,
-            source=src,
-        )
-        prepared = prepare_surface_dataset(raw)
-        reduced = downsample_surface_dataset(prepared, stride=stride)
-        payload = build_surface_payload(
-            reduced,
-            init_time=init_time,
-            region=region,
             stride=stride,
+            source=src,
         )
-
-        output_path = output_root / _surface_filename(init_time)
-        _write_json(payload, output_path)
-        written_paths.append(output_path)
-        index_entries.append(
-            {
-                "filename": output_path.name,
-                "init_time": payload["init_time"],
-                "forecast_hours": payload["forecast_hours"],
-                "valid_times": payload["valid_times"],
-            }
-        )
+        # Upload each run as soon as it is written rather than holding every
+        # file until the slowest run finishes; the index still goes last.
+        if upload:
+            send_json_to_all(urls, str(output_path), upload_bucket, api_key)
+        return output_path, entry
+
+    def _attempt(init_time: dt.datetime):
+        try:
+            return _do_export(init_time), None
+        except Exception as exc:  # noqa: BLE001 - re-raised after the index
+            return None, exc
+
+    # Runs are independent (download, decode, reduce, write), so they overlap in a
+    # thread pool the same way NWPSource.fetch overlaps fields within one run.
+    if run_workers <= 1 or len(init_times) <= 1:
+        results = [_attempt(init_time) for init_time in init_times]
+    else:
+        with ThreadPoolExecutor(max_workers=min(run_workers, len(init_times))) as pool:
+            results = list(pool.map(_attempt, init_times))
+
+    # A failed run must not strand the runs already uploaded without an index:
+    # index what succeeded, then raise the first failure.
+    failures: list[Exception] = []
+    for init_time, (done, exc) in zip(init_times, results, strict=True):
+        if exc is not None:
+            LOG.error("Surface export for %s failed: %s",
+                      init_time.strftime("%Y-%m-%d %HZ"), exc)
+            failures.append(exc)
+            continue
+        written_paths.append(done[0])
+        index_entries.append(done[1])
+
+    if failures and not index_entries:
+        # Nothing to index; keep whatever index the last good export left.
+        raise failures[0]
 
     index_entries.sort(key=lambda entry: entry["init_time"], reverse=True)
     index_path = output_root / INDEX_FILENAME
@@ -247,16 +280,50 @@ def export_latest_surface_layers(
     written_paths.append(index_path)
 
     if upload:
-        from brc_tools.download.push_data import load_config_urls, send_json_to_all
-
-        api_key, config_urls = load_config_urls()
-        urls = [server_url] if server_url else config_urls
-        for path in written_paths:
-            send_json_to_all(urls, str(path), upload_bucket, api_key)
+        send_json_to_all(urls, str(index_path), upload_bucket, api_key)
 
+    if failures:
+        raise failures[0]
     return written_paths
 
 
+def _export_run(
+    init_time: dt.datetime,
+    *,
+    output_root: Path,
+    forecast_hours: Iterable[int],
+    region: str,
+    stride: int,
+    source: NWPSource,
+) -> tuple[Path, dict[str, object]]:
+    """Fetch, reduce, and write one run; return its path and index entry."""
+    LOG.info("Fetching HRRR surface layers for %s", init_time.strftime("%Y-%m-%d %HZ"))
+    raw = fetch_surface_dataset(
+        init_time,
+        forecast_hours=forecast_hours,
+        region=region,
+        source=source,
+    )
+    prepared = prepare_surface_dataset(raw)
+    reduced = downsample_surface_dataset(prepared, stride=stride)
+    payload = build_surface_payload(
+        reduced,
+        init_time=init_time,
+        region=region,
+        stride=stride,
+    )
+
+    output_path = output_root / _surface_filename(init_time)
+    _write_json(payload, output_path)
+    entry = {
+        "filename": output_path.name,
+        "init_time": payload["init_time"],
+        "forecast_hours": payload["forecast_hours"],
+        "valid_times": payload["valid_times"],
+    }
+    return output_path, entry
+
+
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments for the export script."""
     parser = argparse.ArgumentParser(
@@ -290,6 +357,12 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_STRIDE,
         help=f"Spatial decimation stride (default: {DEFAULT_STRIDE})",
     )
+    parser.add_argument(
+        "--run-workers",
+        type=int,
+        default=DEFAULT_RUN_WORKERS,
+        help=f"Runs to export concurrently (default: {DEFAULT_RUN_WORKERS})",
+    )
     parser.add_argument(
         "--upload",
         action="store_true",
@@ -324,6 +397,7 @@ def main() -> int:
             max_fxx=args.max_fxx,
             run_count=args.run_count,
             stride=args.stride,
+            run_workers=args.run_workers,
             upload=args.upload,
             upload_bucket=args.upload_bucket,
             server_url=args.server_url,
@@ -386,6 +460,15 @@ def _maybe_field(ds: xr.Dataset, name: str, template: xr.DataArray, fill_value:
     return xr.full_like(template, fill_value, dtype=float)
 
 
+def _partition(amount: np.ndarray, flag: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Clip ``amount`` at zero, scale it, and zero it where ``flag`` is not set, in place."""
+    np.clip(amount, 0.0, None, out=amount)
+    if scale != 1.0:
+        amount *= scale
+    amount[~(flag >= 0.5)] = 0.0
+    return amount
+
+
 def _spatial_dims(ds: xr.Dataset) -> tuple[str, str]:
     if "y" in ds.dims and "x" in ds.dims:
         return "y", "x"
@@ -415,10 +498,5 @@ def _isoformat_utc(value: dt.datetime) -> str:
     return utc_value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def _to_datetime(value: np.datetime64) -> dt.datetime:
-    seconds = value.astype("datetime64[s]").astype(int)
-    return dt.datetime.fromtimestamp(int(seconds), tz=dt.timezone.utc)
-
-
 if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
     raise SystemExit(main())
@@ -161,14 +161,15 @@ def cape_cin(column, parcel: str) -> tuple[float, float]:
     return float(cape.m), float(cin.m)
 
 
-def _parcel_start(column, parcel: str):
-    """``(p, T, Td)`` pint quantities for the chosen parcel's starting point."""
+def _parcel_start(pq, tq, tdq, parcel: str):
+    """``(p, T, Td)`` pint quantities for the chosen parcel's starting point.
+
+    Takes the profile already wrapped in units, so a caller that holds it does
+    not re-read and re-wrap the column.
+    """
     import metpy.calc as mpcalc
 
     u = _units()
-    p, t, td, *_ = _profile(column)
-    pq, tq, tdq = p * u.hPa, t * u.degC, td * u.degC
-
     if parcel == "sb":
         return pq[0], tq[0], tdq[0]
     if parcel == "ml":
@@ -206,7 +207,7 @@ def parcel_levels(column, parcel: str) -> ParcelLevels:
         return float(np.interp(-np.log(p_level), -np.log(p), z_agl))
 
     try:
-        p_start, t_start, td_start = _parcel_start(column, parcel)
+        p_start, t_start, td_start = _parcel_start(pq, tq, tdq, parcel)
         lcl_p, _ = mpcalc.lcl(p_start, t_start, td_start)
         lcl_hpa = float(lcl_p.to("hPa").m)
     except (ValueError, IndexError):
@@ -238,9 +239,10 @@ def parcel_profile_c(column, parcel: str) -> np.ndarray:
     import metpy.calc as mpcalc
 
     u = _units()
-    p, *_ = _profile(column)
-    p_start, t_start, td_start = _parcel_start(column, parcel)
-    prof = mpcalc.parcel_profile(p * u.hPa, t_start, td_start).to("degC")
+    p, t, td, *_ = _profile(column)
+    pq = p * u.hPa
+    _, t_start, td_start = _parcel_start(pq, t * u.degC, td * u.degC, parcel)
+    prof = mpcalc.parcel_profile(pq, t_start, td_start).to("degC")
     return np.asarray(prof.m, dtype=float)
 
 
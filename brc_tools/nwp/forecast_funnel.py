@@ -38,6 +38,7 @@ from brc_tools.nwp.derived import (
     wind_speed,
 )
 from brc_tools.nwp.source import _parse_init_time, load_lookups
+from brc_tools.utils.grib import CFGRIB_INDEXPATH
 
 LOG = logging.getLogger(__name__)
 
@@ -161,6 +162,29 @@ def _first_ds(obj):
     return obj
 
 
+def _herbie_open(H, search: str):
+    """Subset ``H`` by ``search`` and open it, keeping the subset and its cfgrib index.
+
+    The subset stays in Herbie's cache (``remove_grib=False``); a persistent index
+    beside it lets cfgrib's per-hypercube reopens, and later runs, skip the scan.
+    """
+    return _first_ds(H.xarray(search, remove_grib=False,
+                              backend_kwargs={"indexpath": CFGRIB_INDEXPATH}))
+
+
+def _has_messages(H, search: str) -> bool:
+    """Whether ``H``'s index lists any message matching ``search``.
+
+    Reads the byte-offset inventory Herbie parses once per object, so absent
+    fields are ruled out without a subset download or a cfgrib open.  ``True``
+    when there is no index to consult, leaving the open itself to decide.
+    """
+    try:
+        return len(H.inventory(search)) > 0
+    except Exception:  # noqa: BLE001 - no .idx -> fall through to the open
+        return True
+
+
 def _pick(ds, logical: str):
     """Return the DataArray for a logical field, trying cfgrib short-name aliases."""
     for name in _CFGRIB_NAMES[logical]:
@@ -347,10 +371,11 @@ def _herbie_fetch_full(init_dt: dt.datetime, levels, cache_dir):
         kwargs["save_dir"] = str(cache_dir)
     H = Herbie(init_dt, **kwargs)
 
-    lv_re = "|".join(str(int(lv)) for lv in levels)
-    iso = _first_ds(H.xarray(rf":(HGT|UGRD|VGRD|TMP):({lv_re}) mb:", remove_grib=False))
-    b850 = _first_ds(H.xarray(r":(TMP|UGRD|VGRD):850 mb:", remove_grib=False))
-    slp = _first_ds(H.xarray(r":(PRMSL|MSLET):mean sea level:", remove_grib=False))
+    # One isobaric subset carries the panel levels and the 850 hPa thermal fields,
+    # rather than a second byte-range download and cfgrib open just for 850.
+    lv_re = "|".join(str(lv) for lv in sorted({int(lv) for lv in levels} | {850}))
+    iso = _herbie_open(H, rf":(HGT|UGRD|VGRD|TMP):({lv_re}) mb:")
+    slp = _herbie_open(H, r":(PRMSL|MSLET):mean sea level:")
 
     lon2d, lat2d = _lonlat_2d(iso)
     gh = {lv: _sel_level(_pick(iso, "gh"), lv) for lv in levels}
@@ -358,23 +383,27 @@ def _herbie_fetch_full(init_dt: dt.datetime, levels, cache_dir):
     vv = {lv: _sel_level(_pick(iso, "v"), lv) for lv in levels}
     t600 = _sel_level(_pick(iso, "t"), 600)
 
-    # NAM awphys carries RH (not SPFH) on pressure levels, so derive q from RH + T; try
-    # SPFH first for any model that does ship it.  A search matching zero messages makes
-    # Herbie write no subset (cfgrib then FileNotFoundError), so fall back on any failure.
-    try:
-        q_ds = _first_ds(H.xarray(r":SPFH:600 mb:", remove_grib=False))
-        q600 = specific_humidity_g_per_kg(_sel_level(_pick(q_ds, "q"), 600))
-    except Exception:  # noqa: BLE001 - no SPFH message -> RH fallback
-        rh_ds = _first_ds(H.xarray(r":RH:600 mb:", remove_grib=False))
+    # NAM awphys carries RH (not SPFH) on pressure levels, so derive q from RH + T; use
+    # SPFH for any model that does ship it.  The index says up front whether it does;
+    # a failed SPFH open (no subset written -> cfgrib FileNotFoundError) still falls back.
+    q600 = None
+    if _has_messages(H, r":SPFH:600 mb:"):
+        try:
+            q_ds = _herbie_open(H, r":SPFH:600 mb:")
+            q600 = specific_humidity_g_per_kg(_sel_level(_pick(q_ds, "q"), 600))
+        except Exception:  # noqa: BLE001 - no SPFH message -> RH fallback
+            q600 = None
+    if q600 is None:
+        rh_ds = _herbie_open(H, r":RH:600 mb:")
         q600 = specific_humidity_g_per_kg(
             rh_pct=_sel_level(_pick(rh_ds, "r"), 600),
             temp_k=t600, pressure_hpa=600.0)
     return _assemble_full(
         lat2d=lat2d, lon2d=lon2d, levels=levels, gh=gh, u=uu, v=vv,
         t600=t600,
-        t850=_sel_level(_pick(b850, "t"), 850),
-        u850=_sel_level(_pick(b850, "u"), 850),
-        v850=_sel_level(_pick(b850, "v"), 850),
+        t850=_sel_level(_pick(iso, "t"), 850),
+        u850=_sel_level(_pick(iso, "u"), 850),
+        v850=_sel_level(_pick(iso, "v"), 850),
         q600_g_kg=q600, mslp_pa=_sel_level(_pick(slp, "mslp"), 0),
     )
 
@@ -396,17 +425,26 @@ def _ncei_fetch_full(init_time, levels, cache_dir):
     # Open ONE variable at a time. The grib1 namanl carries variables on different
     # isobaric level sets (HGT ~39 levels, RH ~5), so a single typeOfLevel filter makes
     # cfgrib raise DatasetBuildError and silently drop fields; a per-shortName filter
-    # gives each variable its own consistent cube.
-    def _open(short=None, level_type="isobaricInhPa"):
+    # gives each variable its own consistent cube. The opens share one on-disk cfgrib
+    # index beside the staged file, so the GRIB is scanned once rather than per open
+    # (cfgrib rebuilds the index if the file is newer).  Each open is also limited
+    # to the levels the panels read, so the ~39-level HGT/U/V/T cubes are not
+    # decoded whole for the handful of surfaces that are drawn.
+    wanted = sorted({int(lv) for lv in levels} | {600, 850})
+
+    def _open(short=None, level_type="isobaricInhPa", at=None):
         keys: dict = {"typeOfLevel": level_type}
         if short:
             keys["shortName"] = short
+        if at is not None:
+            keys["level"] = at
         return xr.open_dataset(
             str(path), engine="cfgrib",
-            backend_kwargs={"indexpath": "", "filter_by_keys": keys},
+            backend_kwargs={"indexpath": CFGRIB_INDEXPATH,
+                            "filter_by_keys": keys},
         )
 
-    gh_ds, u_ds, v_ds, t_ds = _open("gh"), _open("u"), _open("v"), _open("t")
+    gh_ds, u_ds, v_ds, t_ds = (_open(s, at=wanted) for s in ("gh", "u", "v", "t"))
     lon2d, lat2d = _lonlat_2d(gh_ds)
     gh_da, u_da, v_da, t_da = (_pick(gh_ds, "gh"), _pick(u_ds, "u"),
                                _pick(v_ds, "v"), _pick(t_ds, "t"))
@@ -416,10 +454,11 @@ def _ncei_fetch_full(init_time, levels, cache_dir):
 
     # SPFH may be absent from the historical analysis -> derive from RH + T.
     try:
-        q600 = specific_humidity_g_per_kg(_sel_level(_pick(_open("q"), "q"), 600))
+        q600 = specific_humidity_g_per_kg(
+            _sel_level(_pick(_open("q", at=600), "q"), 600))
     except Exception:  # noqa: BLE001 - no SPFH message -> RH fallback
         q600 = specific_humidity_g_per_kg(
-            rh_pct=_sel_level(_pick(_open("r"), "r"), 600),
+            rh_pct=_sel_level(_pick(_open("r", at=600), "r"), 600),
             temp_k=_sel_level(t_da, 600), pressure_hpa=600.0)
 
     slp = _open(level_type="meanSea")
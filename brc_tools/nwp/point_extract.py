@@ -57,12 +57,14 @@ def extract_point_series(
     return out
 
 
-def valid_times_iso(ds: xr.Dataset) -> list[str]:
-    """Return the dataset's ``time`` coordinate as ISO-Z strings."""
+def valid_times_iso(ds: xr.Dataset) -> list[str | None]:
+    """Return the dataset's ``time`` coordinate as ISO-Z strings (``None`` for NaT)."""
     if "time" not in ds.coords:
         return []
-    values = np.atleast_1d(ds["time"].values)
-    return [_np_datetime_to_isoz(v) for v in values]
+    # One vectorized datetime64 -> string pass instead of a datetime per step.
+    values = np.atleast_1d(ds["time"].values).astype("datetime64[s]")
+    return [None if missing else f"{s}Z" for s, missing in
+            zip(np.datetime_as_string(values, unit="s"), np.isnat(values), strict=True)]
 
 
 def valid_times_datetime(ds: xr.Dataset) -> list[dt.datetime]:
@@ -78,7 +80,3 @@ def _np_datetime_to_utc_naive(value: np.datetime64) -> dt.datetime:
     return dt.datetime.fromtimestamp(int(seconds), tz=dt.timezone.utc).replace(
         tzinfo=None
     )
-
-
-def _np_datetime_to_isoz(value: np.datetime64) -> str:
-    return _np_datetime_to_utc_naive(value).strftime("%Y-%m-%dT%H:%M:%SZ")
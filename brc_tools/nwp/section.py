@@ -17,6 +17,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
+import xarray as xr
+
+from brc_tools.utils.memo import ArrayMemo
 
 _RD = 287.05  # J kg-1 K-1 (dry air gas constant)
 _G = 9.80665  # m s-2
@@ -82,6 +85,28 @@ class NWPSection:
     tracer_names: tuple[str, ...] = ()
 
 
+# Column indexes by (scale, grid).  Several sections are cut from one grid --
+# each transect of a sweep, a coverage preflight before the cut -- and callers
+# mix scales (degrees for a point lookup, km for a transect), so a few entries
+# are kept rather than one that each scale would evict.
+_trees = ArrayMemo(maxsize=4)
+
+
+def column_tree(lat2d, lon2d, scale: tuple[float, float] = (1.0, 1.0)):
+    """KD-tree over a grid's ``(lat * scale[0], lon * scale[1])`` columns.
+
+    The one column index for every nearest-column lookup (NWP and WRF sections,
+    point series, flux transects).  Reused while a call passes a grid and scale
+    already indexed; ``scale`` turns degrees into a local metric when wanted.
+    """
+    from scipy.spatial import cKDTree
+
+    lat2d = np.asarray(lat2d, dtype=float)
+    lon2d = np.asarray(lon2d, dtype=float)
+    return _trees.get(tuple(scale), lambda: cKDTree(np.column_stack(
+        [lat2d.ravel() * scale[0], lon2d.ravel() * scale[1]])), arrays=(lat2d, lon2d))
+
+
 def _lon180(lon) -> np.ndarray:
     """Wrap longitudes from 0..360 to -180..180 (HRRR grids are 0..360)."""
     lon = np.asarray(lon, dtype=float)
@@ -105,6 +130,21 @@ def _sample_line(start, end, n):
     return lon_line, lat_line, np.hypot(dx, dy)
 
 
+def section_bbox(start, end, *, pad_deg: float = 0.25) -> tuple[float, float, float, float]:
+    """``(sw_lat, sw_lon, ne_lat, ne_lon)`` around an A->B line, padded by ``pad_deg``.
+
+    Pass it as :meth:`~brc_tools.nwp.NWPSource.fetch`'s ``bbox`` when the fetch
+    only feeds a section: each field is then cropped to the line's footprint as it
+    arrives, and with the decoded-tile cache on, a rerun reads those small tiles
+    instead of decoding the GRIB again.  The pad keeps every sample's nearest
+    column inside the crop.  Longitudes are -180..180, as ``start``/``end`` are.
+    """
+    lats = (float(start[0]), float(end[0]))
+    lons = (float(start[1]), float(end[1]))
+    return (min(lats) - pad_deg, min(lons) - pad_deg,
+            max(lats) + pad_deg, max(lons) + pad_deg)
+
+
 def extract_nwp_section(
     ds,
     start: tuple[float, float],
@@ -126,6 +166,8 @@ def extract_nwp_section(
         Must hold 2-D ``latitude``/``longitude`` coords and flat per-level vars
         ``{u}_{lev}``, ``{v}_{lev}``, ``{temp}_{lev}``, ``{height}_{lev}`` (and
         optionally ``{omega}_{lev}``) for each level in *levels*, plus *terrain_var*.
+        Fetching it with ``bbox=section_bbox(start, end)`` keeps it to the
+        columns the line can touch.
     levels : sequence of int
         Pressure levels (hPa) present as per-level variables, ordered as desired
         (bottom-up recommended, e.g. ``[1000, 975, ..., 700]``).
@@ -144,43 +186,54 @@ def extract_nwp_section(
     -------
     NWPSection
     """
-    from scipy.spatial import cKDTree
-
     lat2d = np.asarray(ds["latitude"].values, dtype=float)
     lon2d = _lon180(ds["longitude"].values)
-    tree = cKDTree(np.column_stack([lat2d.ravel(), lon2d.ravel()]))
+    tree = column_tree(lat2d, lon2d)
 
     lon_line, lat_line, dist = _sample_line(start, end, n_points)
     _, flat = tree.query(np.column_stack([lat_line, lon_line]))
-    flat = np.asarray(flat, dtype=int)
-
-    def gather(varname: str) -> np.ndarray:
-        da = ds[varname]
-        if "time" in da.dims:
-            da = da.isel(time=time_index)
-        return np.asarray(da.values, dtype=float).ravel()[flat]
+    jj, ii = np.unravel_index(np.asarray(flat, dtype=int), lat2d.shape)
 
     levels = [int(x) for x in levels]
     nz, n = len(levels), n_points
     up, vp, tp, hp, op = prefixes
-    u = np.full((nz, n), np.nan)
-    v = np.full((nz, n), np.nan)
-    temp = np.full((nz, n), np.nan)
-    hgt = np.full((nz, n), np.nan)
-    omega = np.full((nz, n), np.nan)
     has_td = dewpoint_prefix is not None and all(
         f"{dewpoint_prefix}_{lev}" in ds for lev in levels)
-    dewpoint = np.full((nz, n), np.nan) if has_td else None
+    wanted = [f"{p}_{lev}" for p in (up, vp, tp, hp) for lev in levels]
+    wanted += [f"{op}_{lev}" for lev in levels if f"{op}_{lev}" in ds]
+    if has_td:
+        wanted += [f"{dewpoint_prefix}_{lev}" for lev in levels]
+    wanted.append(terrain_var)
+
+    # One vectorized point selection over every level and variable: only the
+    # sampled columns are read, never a full-grid float copy per level.
+    sub = ds[list(dict.fromkeys(wanted))]
+    if "time" in sub.dims:
+        sub = sub.isel(time=time_index)
+    ydim, xdim = ds["latitude"].dims
+    pts = sub.isel({ydim: xr.DataArray(jj, dims="point"),
+                    xdim: xr.DataArray(ii, dims="point")})
+
+    def curtain(prefix: str, out: np.ndarray | None = None) -> np.ndarray:
+        # filled level by level in place: no per-level list and stacked copy
+        out = np.empty((nz, n)) if out is None else out
+        for k, lev in enumerate(levels):
+            out[k] = pts[f"{prefix}_{lev}"].values
+        return out
+
+    # u and v share one (2, nz, n) buffer so both wind components below come
+    # out of a single contraction over it.
+    uv = np.empty((2, nz, n))
+    u = curtain(up, uv[0])
+    v = curtain(vp, uv[1])
+    temp = curtain(tp)
+    hgt = curtain(hp)
+    omega = np.full((nz, n), np.nan)
     for k, lev in enumerate(levels):
-        u[k] = gather(f"{up}_{lev}")
-        v[k] = gather(f"{vp}_{lev}")
-        temp[k] = gather(f"{tp}_{lev}")
-        hgt[k] = gather(f"{hp}_{lev}")
-        if f"{op}_{lev}" in ds:
-            omega[k] = gather(f"{op}_{lev}")
-        if has_td:
-            dewpoint[k] = gather(f"{dewpoint_prefix}_{lev}")
-    terrain1d = gather(terrain_var)
+        if f"{op}_{lev}" in pts:
+            omega[k] = pts[f"{op}_{lev}"].values
+    dewpoint = curtain(dewpoint_prefix) if has_td else None
+    terrain1d = np.asarray(pts[terrain_var].values, dtype=float)
 
     pres_pa = (np.array(levels, dtype=float) * 100.0)[:, None]  # (nz, 1)
     speed = np.hypot(u, v)
@@ -189,8 +242,11 @@ def extract_nwp_section(
     if has_td:
         from brc_tools.nwp.derived import theta_e
         thetae = np.asarray(theta_e(temp, dewpoint, pres_pa / 100.0), dtype=float)
-    # omega (Pa/s) -> geometric w (m/s):  w = -omega * R_d * T / (p * g)
-    w = -omega * _RD * temp / (pres_pa * _G)
+    # omega (Pa/s) -> geometric w (m/s):  w = -omega * R_d * T / (p * g).
+    # Pressure is constant along each level, so its factor stays an (nz, 1)
+    # column and is applied in place -- one (nz, n) temporary, not four.
+    w = np.multiply(omega, temp)
+    w *= -_RD / (pres_pa * _G)
 
     # along-transect horizontal component (+ toward B), east/north basis
     lat0, lon0 = float(start[0]), float(start[1])
@@ -199,12 +255,12 @@ def extract_nwp_section(
     tx, ty = (lon1 - lon0) * coslat, (lat1 - lat0)
     tnorm = np.hypot(tx, ty) or 1.0
     tx, ty = tx / tnorm, ty / tnorm
-    along = u * tx + v * ty
     # Normal component, + into the page: the LEFT-hand normal of A->B, so a
     # west-to-east line makes northerly flow positive.  Same convention as
     # wrf_section.section_from_plane -- see its docstring for why it is the
     # opposite sign to the outward normal used for boundary fluxes.
-    normal = u * (-ty) + v * tx
+    # Rows of the basis: along = u*tx + v*ty, normal = -u*ty + v*tx.
+    along, normal = np.tensordot(np.array([[tx, ty], [-ty, tx]]), uv, axes=1)
 
     # Mask fields below the terrain surface (isobaric levels under ground are
     # extrapolated); keep height2d valid so pcolormesh can still place the cells,
@@ -3,15 +3,24 @@
 import datetime
 import logging
 import os
+import tempfile
 import tomllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import fasteners
 import numpy as np
 import polars as pl
 import xarray as xr
 from herbie import Herbie
 
-from brc_tools.nwp._cache import purge_cached_files, validate_cached_grib
+from brc_tools.nwp._cache import (
+    decoded_tile_path,
+    purge_cached_files,
+    read_decoded_tile,
+    validate_cached_grib,
+    write_decoded_tile,
+)
 from brc_tools.nwp._crop import crop_to_bbox, nearest_point_value
 from brc_tools.nwp._normalise import normalize_coords
 
@@ -108,41 +117,59 @@ class NWPSource:
             renamed to their canonical ``output_var`` names.  The ``time``
             coordinate holds valid times (init + fxx).
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
         init_dt = _parse_init_time(init_time)
         aliases = self._lu["aliases"]
         sw, ne = self._resolve_bbox(region, bbox)
         var_groups = self._group_by_product(variables, aliases, product)
         crop_method = self._cfg.get("crop_method", "lonlat_after_aux")
 
-        # Build flat work list: (fxx, alias_name, search_str, output_var, product)
+        # Resolve every requested field to (product_key, search, out_name) once;
+        # none of it depends on the forecast hour, so the per-hour loop below is
+        # just a cross product rather than a re-walk of the alias table.
+        field_specs = []
+        for prod_key, var_list in var_groups.items():
+            for alias_name, search_str, output_var in var_list:
+                alias_cfg = aliases[alias_name]
+                if "derived_from" in alias_cfg:
+                    continue
+                for search, level_label in self._expand_search(
+                    search_str, levels, alias_cfg
+                ):
+                    out_name = (
+                        output_var if level_label is None
+                        else f"{output_var}_{level_label}"
+                    )
+                    field_specs.append((prod_key, search, out_name))
+
+        # Build flat work list: (fxx, search_str, product, output_var, retries)
         retries = self._defaults.get("download_retries", 2)
         work_items = []
         for fxx in (int(f) for f in forecast_hours):
             fxx_product = self._resolve_product_for_fxx(
                 product or self._default_product, fxx
             )
-            for prod_key, var_list in var_groups.items():
-                actual_product = prod_key if prod_key else fxx_product
-                for alias_name, search_str, output_var in var_list:
-                    alias_cfg = aliases[alias_name]
-                    if "derived_from" in alias_cfg:
-                        continue
-                    for search, level_label in self._expand_search(
-                        search_str, levels, alias_cfg
-                    ):
-                        out_name = (
-                            output_var if level_label is None
-                            else f"{output_var}_{level_label}"
-                        )
-                        work_items.append(
-                            (fxx, search, actual_product, out_name, retries)
-                        )
+            for prod_key, search, out_name in field_specs:
+                work_items.append(
+                    (fxx, search, prod_key or fxx_product, out_name, retries)
+                )
+
+        tile_dir = self._decoded_cache_dir()
+        # One Herbie per GRIB file for this fetch only: the fields of a file share
+        # its parsed index, and nothing outlives the call to go stale.
+        handles: dict[tuple[int, str], Herbie] = {}
 
         def _do_fetch(item):
             fxx, search, prod, out_name, ret = item
-            ds = self._herbie_fetch(init_dt, fxx, search, prod, ret)
+            tile = None
+            if tile_dir is not None:
+                tile = decoded_tile_path(
+                    tile_dir, self._model_key, self._member, f"{init_dt:%Y%m%d%H}",
+                    fxx, prod, search, out_name, sw, ne, crop_method,
+                )
+                cached = read_decoded_tile(tile)
+                if cached is not None:
+                    return fxx, out_name, cached
+            ds = self._herbie_fetch(init_dt, fxx, search, prod, ret, handles=handles)
             if ds is not None:
                 data_vars = list(ds.data_vars)
                 if data_vars:
@@ -151,6 +178,16 @@ class NWPSource:
                 drop = [n for n in ds.coords if n not in keep and n not in ds.dims]
                 if drop:
                     ds = ds.drop_vars(drop, errors="ignore")
+                # Crop each field as it arrives, not after the merge.  Herbie
+                # has already decoded the full grid (remove_grib=True loads it
+                # before the GRIB is deleted), so this saves no decode; it lets
+                # the full-grid array go here, so the merge/concat below and the
+                # tile cache hold basin-sized fields instead of CONUS grids.
+                if sw is not None and ne is not None:
+                    ds = crop_to_bbox(ds, sw, ne, crop_method)
+                if tile is not None:
+                    ds = ds.load()
+                    write_decoded_tile(ds, tile)
             return fxx, out_name, ds
 
         # Submit all (hour × variable) pairs to a flat thread pool
@@ -164,27 +201,44 @@ class NWPSource:
                     raw_results[(fxx, out_name)] = ds
                     fxx_set.add(fxx)
         else:
-            workers = min(max_workers, len(work_items))
+            # One task per GRIB file: its fields would queue on the file lock
+            # anyway, so they run back to back on one thread (sharing its Herbie
+            # handle) and the pool's slots go to distinct files.
+            file_tasks: dict[tuple[int, str], list] = {}
+            for item in work_items:
+                file_tasks.setdefault((item[0], item[2]), []).append(item)
+
+            def _do_file(items):
+                fetched = []
+                for item in items:
+                    try:
+                        fetched.append(_do_fetch(item))
+                    except Exception as exc:
+                        logger.warning("Fetch failed f%03d %s: %s", item[0], item[3], exc)
+                return fetched
+
+            workers = min(max_workers, len(file_tasks))
             logger.info(
-                "Parallel fetch: %d tasks (%d hours × %d vars) with %d workers",
+                "Parallel fetch: %d tasks (%d hours × %d vars) over %d files with %d workers",
                 len(work_items),
                 len(set(i[0] for i in work_items)),
                 len(set(i[3] for i in work_items)),
+                len(file_tasks),
                 workers,
             )
+            # Longest file batches first: the pool's FIFO queue then behaves like
+            # longest-processing-time scheduling, so a many-field file is not the
+            # last task started while the other workers sit idle.
+            batches = sorted(file_tasks.values(), key=len, reverse=True)
             with ThreadPoolExecutor(max_workers=workers) as pool:
-                futures = {pool.submit(_do_fetch, item): item for item in work_items}
+                futures = [pool.submit(_do_file, items) for items in batches]
                 for future in as_completed(futures):
-                    try:
-                        fxx, out_name, ds = future.result()
+                    for fxx, out_name, ds in future.result():
                         if ds is not None:
                             raw_results[(fxx, out_name)] = ds
                             fxx_set.add(fxx)
-                    except Exception as exc:
-                        item = futures[future]
-                        logger.warning("Fetch failed f%03d %s: %s", item[0], item[3], exc)
 
-        # Group by fxx, merge, normalize, crop
+        # Group by fxx, merge, normalize (each field was cropped on arrival)
         results: dict[int, xr.Dataset] = {}
         for fxx in sorted(fxx_set):
             hour_ds = {k[1]: v for k, v in raw_results.items() if k[0] == fxx}
@@ -193,10 +247,7 @@ class NWPSource:
             ds_hour = xr.merge(
                 list(hour_ds.values()), combine_attrs="drop", compat="override"
             )
-            ds_hour = normalize_coords(ds_hour, init_dt, fxx)
-            if sw is not None and ne is not None:
-                ds_hour = crop_to_bbox(ds_hour, sw, ne, crop_method)
-            results[fxx] = ds_hour
+            results[fxx] = normalize_coords(ds_hour, init_dt, fxx)
 
         hour_slices = [results[fxx] for fxx in sorted(results)]
         if not hour_slices:
@@ -255,6 +306,7 @@ class NWPSource:
         """Fetch all requested variables for a single forecast hour."""
         retries = self._defaults.get("download_retries", 2)
         results = {}
+        handles = {}
         for alias_name, search_str, output_var in var_list:
             alias_cfg = aliases[alias_name]
             # Handle derived variables
@@ -263,7 +315,8 @@ class NWPSource:
 
             actual_searches = self._expand_search(search_str, levels, alias_cfg)
             for search, level_label in actual_searches:
-                ds = self._herbie_fetch(init_dt, fxx, search, product, retries)
+                ds = self._herbie_fetch(init_dt, fxx, search, product, retries,
+                                        handles=handles)
                 if ds is not None:
                     out_name = output_var if level_label is None else f"{output_var}_{level_label}"
                     data_vars = list(ds.data_vars)
@@ -277,7 +330,8 @@ class NWPSource:
                     results[out_name] = ds
         return results
 
-    def _herbie_fetch(self, init_dt, fxx, search_str, product, retries):
+    def _herbie_fetch(self, init_dt, fxx, search_str, product, retries, *,
+                      handles=None):
         """Single Herbie fetch with cache validation, file-level locking, and retry.
 
         A per-GRIB-file lock (via fasteners) prevents concurrent threads/processes
@@ -285,10 +339,13 @@ class NWPSource:
         The lock key is (model, init, fxx, product, member) — different search
         strings hitting the same GRIB file serialize, but different files download
         freely in parallel.
-        """
-        import tempfile
-        import fasteners
 
+        ``handles`` is the calling fetch's ``{(fxx, product): Herbie}``: search
+        strings of one file then share an object and the file's index is read
+        once rather than once per field.  A failed attempt drops only its own
+        entry, so the retry starts from a fresh object.
+        """
+        key = (fxx, product)
         lock_dir = os.environ.get("BRC_TOOLS_LOCK_DIR") or tempfile.gettempdir()
         member_str = self._member or "det"
         lock_name = (
@@ -311,7 +368,11 @@ class NWPSource:
                     herbie_kwargs["save_dir"] = cache_dir
 
                 with lock:
-                    H = Herbie(init_dt, **herbie_kwargs)
+                    H = handles.get(key) if handles is not None else None
+                    if H is None:
+                        H = Herbie(init_dt, **herbie_kwargs)
+                        if handles is not None:
+                            handles[key] = H
                     grib_path = getattr(H, "grib", None)
                     if grib_path and not validate_cached_grib(grib_path):
                         purge_cached_files(H)
@@ -323,6 +384,9 @@ class NWPSource:
                     "Herbie fetch failed (attempt %d/%d) %s f%03d %r: %s",
                     attempt + 1, retries, self._model_key, fxx, search_str, exc,
                 )
+                # A handle that failed may carry stale source/index state
+                if handles is not None:
+                    handles.pop(key, None)
                 if attempt < retries - 1:
                     with lock:
                         try:
@@ -399,10 +463,14 @@ class NWPSource:
         return base_product
 
     def _cache_dir(self):
-        import os
         env_var = self._defaults.get("cache_dir_env_var", "BRC_TOOLS_HERBIE_CACHE")
         return os.environ.get(env_var) or None
 
+    def _decoded_cache_dir(self):
+        """Opt-in cache of decoded, cropped fields (unset = always decode GRIB)."""
+        env_var = self._defaults.get("decoded_cache_env_var", "BRC_TOOLS_DECODED_CACHE")
+        return os.environ.get(env_var) or None
+
 
 def _parse_init_time(init_time) -> datetime.datetime:
     """Parse init_time from string or datetime.
@@ -113,7 +113,7 @@ def air_density(ds) -> np.ndarray:
     depend on it feed a *power law* in :func:`extinction_km`.
     """
     p = wo.pressure_pa(ds)
-    t = wo.temperature_k(ds)
+    t = wo.temperature_k(ds, pressure=p)
     qv = wo.qvapor(ds)
     return p / (_RD * t * (1.0 + 0.608 * qv))
 
@@ -170,7 +170,7 @@ def relative_humidity(ds) -> np.ndarray:
     p = wo.pressure_pa(ds)
     qv = np.maximum(wo.qvapor(ds), 0.0)
     e = qv * p / (_EPS + qv)
-    return 100.0 * e / saturation_vapour_pressure_pa(wo.temperature_k(ds))
+    return 100.0 * e / saturation_vapour_pressure_pa(wo.temperature_k(ds, pressure=p))
 
 
 def relative_humidity_2m(ds) -> np.ndarray:
@@ -285,6 +285,15 @@ def fog_top_asl(ds, **kwargs) -> np.ndarray:
 # --------------------------------------------------------------------------- #
 # cloud
 # --------------------------------------------------------------------------- #
+def _native(ds, name: str) -> np.ndarray:
+    """A 3-D field in the precision WRF wrote it (float32), ``Time`` squeezed.
+
+    For fields that are only thresholded, maxed or halved: a float64 copy of a
+    full nest doubles the memory and traffic and changes none of those answers.
+    """
+    return np.asarray(wo._da(ds, name).values)
+
+
 def cloud_fraction_layers(ds) -> dict[str, np.ndarray]:
     """Maximum ``CLDFRA`` within each ISCCP pressure band, ``{low, mid, high}``.
 
@@ -293,7 +302,7 @@ def cloud_fraction_layers(ds) -> dict[str, np.ndarray]:
     overlap assumption would mix the layers back together, which is the one
     thing separating them was for.
     """
-    cf = np.asarray(wo._da(ds, "CLDFRA").values, dtype=float)
+    cf = _native(ds, "CLDFRA")
     p_hpa = wo.pressure_pa(ds) / 100.0
     out = {}
     for name, (lo, hi) in _CLOUD_BANDS.items():
@@ -304,13 +313,13 @@ def cloud_fraction_layers(ds) -> dict[str, np.ndarray]:
 
 def _first_cloudy_from_ground(cf, fraction: float):
     """``(k_index, found)`` of the lowest level with ``cf >= fraction``."""
-    cloudy = np.asarray(cf, dtype=float) >= float(fraction)
+    cloudy = np.asarray(cf) >= float(fraction)
     return np.argmax(cloudy, axis=0), cloudy.any(axis=0)
 
 
 def cloud_base_agl(ds, *, fraction: float = _CLOUDY_FRACTION) -> np.ndarray:
     """Height (m AGL) of the lowest cloudy level. NaN in a cloud-free column."""
-    cf = np.asarray(wo._da(ds, "CLDFRA").values, dtype=float)
+    cf = _native(ds, "CLDFRA")
     k, found = _first_cloudy_from_ground(cf, fraction)
     z = wo.height_agl(ds)
     return np.where(found, np.take_along_axis(z, k[None], axis=0)[0], np.nan)
@@ -318,7 +327,7 @@ def cloud_base_agl(ds, *, fraction: float = _CLOUDY_FRACTION) -> np.ndarray:
 
 def cloud_top_asl(ds, *, fraction: float = _CLOUDY_FRACTION) -> np.ndarray:
     """Height (m ASL) of the highest cloudy level. NaN in a cloud-free column."""
-    cf = np.asarray(wo._da(ds, "CLDFRA").values, dtype=float)
+    cf = _native(ds, "CLDFRA")
     cloudy = cf >= float(fraction)
     found = cloudy.any(axis=0)
     k = cf.shape[0] - 1 - np.argmax(cloudy[::-1], axis=0)
@@ -336,7 +345,7 @@ def ceiling_agl(ds, *, fraction: float = _CLOUDY_FRACTION) -> np.ndarray:
     the first mass level are therefore returned as NaN here and left to
     :func:`fog_depth_m`.
     """
-    cf = np.asarray(wo._da(ds, "CLDFRA").values, dtype=float)
+    cf = _native(ds, "CLDFRA")
     k, found = _first_cloudy_from_ground(cf, fraction)
     z = wo.height_agl(ds)
     base = np.where(found, np.take_along_axis(z, k[None], axis=0)[0], np.nan)
@@ -409,13 +418,14 @@ def turbulent_kinetic_energy(ds) -> np.ndarray:
     ``TKE_PBL`` is used only when ``QKE`` is absent (the YSU/Shin-Hong path).
     """
     if "QKE" in ds:
-        qke = np.asarray(wo._da(ds, "QKE").values, dtype=float)
+        qke = _native(ds, "QKE")
         if qke.ndim == 3 and qke.shape[0] > 1:
             return 0.5 * qke
     if "TKE_PBL" in ds:
-        tke = np.asarray(wo._da(ds, "TKE_PBL").values, dtype=float)
+        tke = _native(ds, "TKE_PBL")
         # TKE_PBL sits on w levels; destagger to mass points if it is one longer.
-        if tke.shape[0] == wo.potential_temperature(ds).shape[0] + 1:
+        # (the mass-level count comes off T's shape -- no need to derive theta)
+        if tke.shape[0] == wo._da(ds, "T").shape[0] + 1:
             return 0.5 * (tke[1:] + tke[:-1])
         return tke
     raise KeyError("this run wrote neither QKE nor TKE_PBL")
@@ -275,6 +275,10 @@ def select_times(
 RENDERED, SKIPPED, PLANNED, ERROR, ABSENT = (
     "rendered", "skipped", "planned", "error", "absent")
 
+#: File formats a ledger can write.  Renderers always draw PNG; ``webp`` is a
+#: lossless re-encode afterwards, about half the size for archived sweeps.
+IMAGE_FORMATS = ("png", "webp")
+
 
 @dataclass
 class FigureRecord:
@@ -303,9 +307,14 @@ class FigureLedger:
     did.
     """
 
-    def __init__(self, *, skip_existing: bool = False, dry_run: bool = False):
+    def __init__(self, *, skip_existing: bool = False, dry_run: bool = False,
+                 image_format: str = "png"):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"image_format must be one of {IMAGE_FORMATS}, "
+                             f"got {image_format!r}")
         self.skip_existing = bool(skip_existing)
         self.dry_run = bool(dry_run)
+        self.image_format = image_format
         self.records: list[FigureRecord] = []
 
     # -- recording ---------------------------------------------------------- #
@@ -325,8 +334,18 @@ class FigureLedger:
         ``render_fn`` takes the output path, so the decision to render happens
         before any work does.  ``sources`` are the files the figure derives from;
         with ``skip_existing`` a figure at least as new as all of them is kept.
+
+        With ``image_format="webp"`` a ``.png`` request is rendered as PNG and
+        re-encoded to the ``.webp`` beside it (see
+        :func:`brc_tools.visualize.style.png_to_webp`).  The PNG is drawn under a
+        scratch name and not kept, so a ``.png`` an earlier PNG-format run left
+        at ``out_path`` is never overwritten or deleted.
         """
         out_path = Path(out_path)
+        png_path = None
+        if self.image_format == "webp" and out_path.suffix.lower() == ".png":
+            out_path = out_path.with_suffix(".webp")
+            png_path = out_path.with_name(f".{out_path.stem}.{os.getpid()}.png")
         common = dict(family=family, domain=domain, var=var,
                       valid=None if valid is None else valid.strftime(TIME_FMT),
                       path=str(out_path))
@@ -339,7 +358,16 @@ class FigureLedger:
             return 0
         try:
             out_path.parent.mkdir(parents=True, exist_ok=True)
-            render_fn(out_path)
+            if png_path is None:
+                render_fn(out_path)
+            else:
+                from brc_tools.visualize.style import png_to_webp
+
+                try:
+                    render_fn(png_path)
+                    png_to_webp(png_path, out_path)
+                finally:
+                    png_path.unlink(missing_ok=True)
         except Exception as exc:  # one bad panel is not a lost run
             label = " ".join(str(x) for x in (family, var, out_path.name) if x)
             print(f"[ERR] {label}: {exc}")
@@ -440,6 +468,7 @@ class FigureLedger:
             "argv": list(argv) if argv is not None else None,
             "dry_run": self.dry_run,
             "skip_existing": self.skip_existing,
+            "image_format": self.image_format,
             "counts": {s: self.count(s)
                        for s in (RENDERED, SKIPPED, PLANNED, ERROR, ABSENT)},
             "figures": [asdict(r) for r in self.records],
@@ -521,6 +550,11 @@ def add_output_arguments(parser) -> None:
         help="keep figures already newer than every file they derive from; "
              "makes a re-run after adding one family cheap",
     )
+    parser.add_argument(
+        "--image-format", choices=IMAGE_FORMATS, default="png",
+        help="file format for figures; webp is lossless and about half the size "
+             "of png (default: png)",
+    )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="print the figures that would be rendered, then exit",
@@ -536,6 +570,17 @@ def add_output_arguments(parser) -> None:
     )
 
 
+def section_points(spec: dict) -> int | None:
+    """A ``[[sections]]`` entry's ``n_points``, or None to size it to the grid.
+
+    None lets :func:`~brc_tools.nwp.wrf_section.section_from_plane` size the line
+    to the grid (:func:`~brc_tools.nwp.wrf_section.section_n_points`), so the
+    preflight and the cut agree.  This replaced a fixed default of 240 samples.
+    """
+    n = spec.get("n_points")
+    return None if n is None else int(n)
+
+
 def check_section_on_grid(plane, key: str, spec: dict, *, tag: str) -> bool:
     """Preflight an ``[[sections]]`` A->B transect against the nest it will cut.
 
@@ -552,7 +597,7 @@ def check_section_on_grid(plane, key: str, spec: dict, *, tag: str) -> bool:
     """
     cov = ws.section_coverage(
         plane, tuple(spec["a"]), tuple(spec["b"]),
-        n_points=int(spec.get("n_points", 240)),
+        n_points=section_points(spec),
     )
     if cov.fully_inside:
         return True
@@ -27,6 +27,7 @@ dataset-agnostic and are reused unchanged; nothing here touches the brc-wrf-faci
 from __future__ import annotations
 
 import csv
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -342,6 +343,10 @@ class PreflightReport:
 # --------------------------------------------------------------------------- #
 # small helpers
 # --------------------------------------------------------------------------- #
+# The sweep renders every family at every valid time, so the same slug / tag /
+# label strings are rebuilt many times per time step; they are pure functions of
+# hashable inputs, so compute each once.
+@functools.lru_cache(maxsize=256)
 def _slug(text: str) -> str:
     return re.sub(r"[^0-9a-z]+", "_", text.lower()).strip("_")
 
@@ -350,6 +355,7 @@ def _focus_slug(cfg: CaseConfig) -> str:
     return _slug(cfg.focus_point.name) or "focus"
 
 
+@functools.lru_cache(maxsize=1024)
 def _valid_tag(valid: datetime) -> str:
     """Collision-safe compact valid-time tag, preserving legacy hourly names."""
     if valid.second:
@@ -359,6 +365,7 @@ def _valid_tag(valid: datetime) -> str:
     return valid.strftime("%Hz")
 
 
+@functools.lru_cache(maxsize=1024)
 def _valid_label(valid: datetime, *, include_date: bool = False) -> str:
     """Human-readable valid time with minute/second precision only when needed."""
     clock = "%H:%M:%S" if valid.second else ("%H:%M" if valid.minute else "%H")
@@ -557,7 +564,7 @@ def task_upperair_pressure(cfg, run, domain, case, label, valid, out, skip_exist
     ue, ve = wo.earth_relative_winds(ds)
     dx, dy = wo.dx_dy(ds)
     target_pa = p_hpa * 100.0
-    tk = interp_to_pressure_surface(wo.temperature_k(ds), p, target_pa)
+    tk = interp_to_pressure_surface(wo.temperature_k(ds, pressure=p), p, target_pa)
     tc = tk - 273.15
     u = interp_to_pressure_surface(ue, p, target_pa)
     v = interp_to_pressure_surface(ve, p, target_pa)
@@ -153,7 +153,7 @@ def destagger(da, dim: str):
 # --------------------------------------------------------------------------- #
 def potential_temperature(ds) -> np.ndarray:
     """Full potential temperature (K): ``T`` + 300."""
-    return np.asarray((_da(ds, "T") + THETA0).values)
+    return np.add(_da(ds, "T").values, THETA0)
 
 
 def pressure_pa(ds) -> np.ndarray:
@@ -161,11 +161,20 @@ def pressure_pa(ds) -> np.ndarray:
     return np.asarray((_da(ds, "P") + _da(ds, "PB")).values)
 
 
-def temperature_k(ds) -> np.ndarray:
-    """Air temperature (K) from theta and pressure."""
-    theta = potential_temperature(ds)
-    p = pressure_pa(ds)
-    return theta * (p / P0) ** RCP
+def temperature_k(ds, *, theta=None, pressure=None) -> np.ndarray:
+    """Air temperature (K) from theta and pressure.
+
+    ``theta`` and ``pressure`` reuse 3-D arrays the caller already holds instead
+    of reading them again.  The Exner factor and product are built in one output
+    buffer, not a temporary per operator.
+    """
+    theta = potential_temperature(ds) if theta is None else theta
+    p = pressure_pa(ds) if pressure is None else pressure
+    # Sized for the wider input: a float32 pressure must not truncate float64 theta.
+    out = np.empty(np.shape(p), dtype=np.result_type(p, theta, np.float32))
+    np.divide(p, P0, out=out, dtype=out.dtype)
+    np.power(out, RCP, out=out)
+    return np.multiply(out, theta, out=out)
 
 
 def geopotential_height_w(ds) -> np.ndarray:
@@ -224,8 +233,11 @@ def earth_relative_winds(ds) -> tuple[np.ndarray, np.ndarray]:
     Defaults to identity if the rotation fields are absent.
     """
     u, v = grid_relative_winds(ds)
-    cosa = surface_field(ds, "COSALPHA") if "COSALPHA" in ds else np.ones(u.shape[1:])
-    sina = surface_field(ds, "SINALPHA") if "SINALPHA" in ds else np.zeros(u.shape[1:])
+    # identity in the winds' own dtype, so a float32 run is not widened to float64
+    cosa = (surface_field(ds, "COSALPHA") if "COSALPHA" in ds
+            else np.ones(u.shape[1:], dtype=u.dtype))
+    sina = (surface_field(ds, "SINALPHA") if "SINALPHA" in ds
+            else np.zeros(u.shape[1:], dtype=u.dtype))
     cosa = cosa[np.newaxis, :, :]
     sina = sina[np.newaxis, :, :]
     ue = u * cosa - v * sina
@@ -247,7 +259,12 @@ def theta_2m(ds) -> np.ndarray:
         return surface_field(ds, "TH2")
     t2 = surface_field(ds, "T2")
     psfc = surface_field(ds, "PSFC")
-    return t2 * (P0 / psfc) ** RCP
+    # T2 * (P0 / PSFC) ** RCP, built in one buffer as temperature_k is
+    out = np.empty(np.shape(psfc), dtype=np.result_type(t2, psfc, np.float32))
+    np.divide(P0, psfc, out=out, dtype=out.dtype)
+    np.power(out, RCP, out=out)
+    np.multiply(out, t2, out=out)
+    return out
 
 
 # --------------------------------------------------------------------------- #
@@ -292,12 +309,16 @@ def center_indices(ds) -> tuple[int, int]:
 
 
 def nearest_column_index(ds, lat: float, lon: float) -> tuple[int, int]:
-    """Nearest mass-grid column ``(j, i)`` to a lat/lon (cKDTree on XLAT/XLONG)."""
-    from scipy.spatial import cKDTree
+    """Nearest mass-grid column ``(j, i)`` to a lat/lon (cKDTree on XLAT/XLONG).
+
+    The tree is shared with the section samplers and kept while the grid is
+    unchanged, so a point series over many files of one domain builds it once.
+    """
+    from brc_tools.nwp.section import column_tree
 
     xlat = surface_field(ds, "XLAT")
     xlon = surface_field(ds, "XLONG")
-    tree = cKDTree(np.column_stack([xlat.ravel(), xlon.ravel()]))
+    tree = column_tree(xlat, xlon)
     _, idx = tree.query([lat, lon])
     j, i = np.unravel_index(int(idx), xlat.shape)
     return int(j), int(i)
@@ -547,7 +568,11 @@ def _deficit_kernel(ds, crest_m: float) -> _DeficitKernel:
     w = np.clip((crest_m - z0) / np.maximum(z1 - z0, 1e-6), 0.0, 1.0)
     theta_crest = t0 + w * (t1 - t0)         # (ny, nx) theta at crest height
 
-    integrand = np.where(below, np.clip(theta_crest[np.newaxis] - theta, 0.0, None), 0.0)
+    # One (nz, ny, nx) buffer, floored and masked in place: the difference, clip
+    # and where used to allocate a full 3-D temporary each.
+    integrand = np.subtract(theta_crest[np.newaxis], theta)
+    np.maximum(integrand, 0.0, out=integrand)
+    integrand[~below] = 0.0
     return _DeficitKernel(
         integrand=integrand, pressure_pa=p, height_asl=z, theta_crest=theta_crest
     )
@@ -759,28 +784,13 @@ class TransectFlux:
     label: str = ""
 
 
-def integrate_flux_transect(
-    ds,
-    flux_x_w_m: np.ndarray,
-    flux_y_w_m: np.ndarray,
-    lat_a: float,
-    lon_a: float,
-    lat_b: float,
-    lon_b: float,
-    *,
-    spacing_m: float | None = None,
-    label: str = "",
-) -> TransectFlux:
-    """Integrate an earth-relative horizontal flux field across an a->b line.
+def _transect_columns(ds, lat_a, lon_a, lat_b, lon_b, spacing_m):
+    """Sample an a->b line every ``spacing_m``: lats, lons, j, i, distance, normal.
 
-    ``flux_x_w_m`` and ``flux_y_w_m`` are eastward and northward components on the
-    WRF mass grid. The function samples the nearest column every ``spacing_m``
-    (default: grid ``min(dx, dy)``) and integrates the normal component,
-    ``Phi = integral F . n_hat ds``, with ``n_hat`` the rightward normal walking
-    a->b. Flat-earth metric, fine for basin-scale (< ~100 km) transects.
+    Only the 2-D ``XLAT``/``XLONG`` are read, so a caller can find the columns it
+    needs before deciding how much of the 3-D state to derive.
     """
-    from scipy.integrate import trapezoid
-    from scipy.spatial import cKDTree
+    from brc_tools.nwp.section import column_tree
 
     # local flat-earth metres per degree (mid-latitude approximations)
     coslat = np.cos(np.deg2rad(0.5 * (lat_a + lat_b)))
@@ -797,23 +807,23 @@ def integrate_flux_transect(
     lats = lat_a + frac * (lat_b - lat_a)
     lons = lon_a + frac * (lon_b - lon_a)
     tx, ty = ex / length, ey / length
-    nx_e, ny_n = ty, -tx  # rightward normal to the a->b direction
 
-    # one KD-tree for all samples (nearest_column_index would rebuild it per point)
+    # one KD-tree for all samples, reused across transects and times of one grid
     xlat = surface_field(ds, "XLAT")
     xlon = surface_field(ds, "XLONG")
-    tree = cKDTree(np.column_stack([xlat.ravel(), xlon.ravel()]))
+    tree = column_tree(xlat, xlon)
     _, idx = tree.query(np.column_stack([lats, lons]))
     jj, ii = np.unravel_index(np.asarray(idx, dtype=int), xlat.shape)
+    # rightward normal to the a->b direction
+    return lats, lons, jj, ii, frac * length, (ty, -tx)
 
-    fx = np.asarray(flux_x_w_m)
-    fy = np.asarray(flux_y_w_m)
-    if fx.shape != xlat.shape or fy.shape != xlat.shape:
-        raise ValueError(
-            f"flux fields must match mass-grid shape {xlat.shape}; got {fx.shape}, {fy.shape}"
-        )
-    f_normal = fx[jj, ii] * nx_e + fy[jj, ii] * ny_n
-    dist = frac * length
+
+def _transect_flux(columns, fx_line, fy_line, label) -> TransectFlux:
+    """Finish a :class:`TransectFlux` from the flux sampled at each column."""
+    from scipy.integrate import trapezoid
+
+    lats, lons, jj, ii, dist, (nx_e, ny_n) = columns
+    f_normal = fx_line * nx_e + fy_line * ny_n
     return TransectFlux(
         lats=lats,
         lons=lons,
@@ -827,6 +837,38 @@ def integrate_flux_transect(
     )
 
 
+def integrate_flux_transect(
+    ds,
+    flux_x_w_m: np.ndarray,
+    flux_y_w_m: np.ndarray,
+    lat_a: float,
+    lon_a: float,
+    lat_b: float,
+    lon_b: float,
+    *,
+    spacing_m: float | None = None,
+    label: str = "",
+) -> TransectFlux:
+    """Integrate an earth-relative horizontal flux field across an a->b line.
+
+    ``flux_x_w_m`` and ``flux_y_w_m`` are eastward and northward components on the
+    WRF mass grid. The function samples the nearest column every ``spacing_m``
+    (default: grid ``min(dx, dy)``) and integrates the normal component,
+    ``Phi = integral F . n_hat ds``, with ``n_hat`` the rightward normal walking
+    a->b. Flat-earth metric, fine for basin-scale (< ~100 km) transects.
+    """
+    columns = _transect_columns(ds, lat_a, lon_a, lat_b, lon_b, spacing_m)
+    _, _, jj, ii, _, _ = columns
+    fx = np.asarray(flux_x_w_m)
+    fy = np.asarray(flux_y_w_m)
+    shape = surface_field(ds, "XLAT").shape
+    if fx.shape != shape or fy.shape != shape:
+        raise ValueError(
+            f"flux fields must match mass-grid shape {shape}; got {fx.shape}, {fy.shape}"
+        )
+    return _transect_flux(columns, fx[jj, ii], fy[jj, ii], label)
+
+
 def transect_deficit_flux(
     ds,
     crest_m: float,
@@ -844,16 +886,21 @@ def transect_deficit_flux(
     Use :func:`integrate_flux_transect` when a caller already has the earth-relative
     deficit-flux fields and needs several transects without recomputing the column
     integral.
+
+    The column integral is purely per-column, so only the block of the grid the
+    line crosses is derived (plus the staggered edge the winds destagger from)
+    rather than the whole domain.
     """
-    fx, fy = deficit_flux_field(ds, crest_m)
-    return integrate_flux_transect(
-        ds,
-        fx,
-        fy,
-        lat_a,
-        lon_a,
-        lat_b,
-        lon_b,
-        spacing_m=spacing_m,
-        label=label,
-    )
+    columns = _transect_columns(ds, lat_a, lon_a, lat_b, lon_b, spacing_m)
+    _, _, jj, ii, _, _ = columns
+    j0, j1 = int(jj.min()), int(jj.max()) + 1
+    i0, i1 = int(ii.min()), int(ii.max()) + 1
+    window = {
+        "south_north": slice(j0, j1),
+        "west_east": slice(i0, i1),
+        "south_north_stag": slice(j0, j1 + 1),
+        "west_east_stag": slice(i0, i1 + 1),
+    }
+    block = ds.isel({dim: sl for dim, sl in window.items() if dim in ds.dims})
+    fx, fy = deficit_flux_field(block, crest_m)
+    return _transect_flux(columns, fx[jj - j0, ii - i0], fy[jj - j0, ii - i0], label)
@@ -14,6 +14,9 @@ empty/None result is expected and handled gracefully.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 import matplotlib
@@ -24,6 +27,7 @@ import numpy as np  # noqa: E402
 
 from brc_tools.nwp._crop import crop_to_bbox  # noqa: E402
 from brc_tools.nwp.source import load_lookups  # noqa: E402
+from brc_tools.utils.grib import CFGRIB_INDEXPATH  # noqa: E402
 
 LOG = logging.getLogger(__name__)
 
@@ -38,6 +42,29 @@ def _figure_dir(case: str, figure_dir: str | Path | None) -> Path:
     return out
 
 
+# PNG text key recording the region a quicklook was cropped to.
+_REGION_KEY = "Region"
+
+
+def _is_current(out_path: Path, source: str | Path, region: str) -> bool:
+    """True if ``out_path`` is at least as new as ``source`` and shows ``region``.
+
+    The PNG name does not carry the region, so the crop is read back from the
+    PNG's text metadata.  A quicklook written before the tag existed has none and
+    counts as :data:`DEFAULT_REGION`, the crop staging renders.
+    """
+    try:
+        if out_path.stat().st_mtime < Path(source).stat().st_mtime:
+            return False
+        from PIL import Image
+
+        with Image.open(out_path) as im:
+            recorded = im.text.get(_REGION_KEY, DEFAULT_REGION)
+    except OSError:
+        return False
+    return recorded == region
+
+
 def _region_swne(region: str) -> tuple[tuple[float, float], tuple[float, float]] | None:
     cfg = load_lookups().get("regions", {}).get(region)
     if not cfg:
@@ -45,6 +72,10 @@ def _region_swne(region: str) -> tuple[tuple[float, float], tuple[float, float]]
     return tuple(cfg["sw"]), tuple(cfg["ne"])
 
 
+def _out_path(case: str, figure_dir: str | Path | None, variable_level: str, fxx: int) -> Path:
+    return _figure_dir(case, figure_dir) / f"{variable_level}_f{int(fxx):03d}.png"
+
+
 def quicklook_staged_grib(
     staged_path: str | Path,
     *,
@@ -53,20 +84,110 @@ def quicklook_staged_grib(
     region: str = DEFAULT_REGION,
     figure_dir: str | Path | None = None,
     case: str = DEFAULT_CASE,
+    overwrite: bool = False,
 ) -> Path:
     """Render a basin map of one staged surface GRIB at lead time ``fxx``.
 
-    Opens the staged file with cfgrib, selects the step nearest ``fxx`` hours,
-    crops to ``region``, and saves ``<figures>/<case>/<variable_level>_f{fxx}.png``.
+    Opens the staged file with cfgrib (persisting its message index beside the
+    file so later opens skip the scan), selects the step nearest ``fxx`` hours,
+    crops to ``region``, and saves ``<figures>/<case>/<variable_level>_f{fxx}.png``
+    with the region recorded in its metadata.
     Reuses :func:`brc_tools.visualize.planview.plot_planview`, falling back to a
     plain pcolormesh if that path raises.
+
+    A PNG of ``region`` already newer than ``staged_path`` is returned as-is, without opening
+    the GRIB; pass ``overwrite=True`` to render it again.
+    """
+    out_path = _out_path(case, figure_dir, variable_level, fxx)
+    if not overwrite and _is_current(out_path, staged_path, region):
+        LOG.info("Quicklook %s is newer than %s; keeping it", out_path.name, staged_path)
+        return out_path
+
+    field_ds, valid = _load_quicklook_field(staged_path, fxx=fxx, region=region)
+    figure = _render_quicklook(field_ds, valid, out_path, variable_level=variable_level,
+                               fxx=fxx, case=case, region=region)
+    if figure is not None:
+        figure.close()
+    return out_path
+
+
+def quicklook_staged_gribs(
+    staged: Iterable[tuple[str | Path, str]],
+    *,
+    fxx: int = 24,
+    region: str = DEFAULT_REGION,
+    figure_dir: str | Path | None = None,
+    case: str = DEFAULT_CASE,
+    overwrite: bool = False,
+) -> list[Path]:
+    """Render :func:`quicklook_staged_grib` for each ``(staged_path, variable_level)``.
+
+    The next GRIB is opened and decoded on a background thread while the current
+    map draws, so the cfgrib read overlaps the matplotlib render instead of
+    following it.  Consecutive fields on one grid share a figure: the map,
+    borders and colour bar are built once and each later field only swaps the
+    shaded values, limits and title.  Current PNGs are skipped as in the
+    single-file call; a file that fails to read or render is logged and left out
+    of the returned paths.
+    """
+    jobs = []
+    for staged_path, variable_level in staged:
+        out_path = _out_path(case, figure_dir, variable_level, fxx)
+        if not overwrite and _is_current(out_path, staged_path, region):
+            LOG.info("Quicklook %s is newer than %s; keeping it", out_path.name, staged_path)
+            continue
+        jobs.append((staged_path, variable_level, out_path))
+
+    written: list[Path] = []
+    if not jobs:
+        return written
+    # One worker: a single read in flight ahead of the render, never a queue of
+    # decoded grids waiting on matplotlib.
+    figure = None
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        def _load(job):
+            return pool.submit(_load_quicklook_field, job[0], fxx=fxx, region=region)
+
+        pending = _load(jobs[0])
+        try:
+            for i, (_staged_path, variable_level, out_path) in enumerate(jobs):
+                current = pending
+                if i + 1 < len(jobs):
+                    pending = _load(jobs[i + 1])
+                try:
+                    field_ds, valid = current.result()
+                    figure = _render_quicklook(field_ds, valid, out_path,
+                                               variable_level=variable_level,
+                                               fxx=fxx, case=case, region=region,
+                                               figure=figure)
+                except Exception as exc:  # noqa: BLE001 - best-effort, per file
+                    LOG.warning("quicklook failed for %s: %s", variable_level, exc)
+                    if figure is not None:
+                        figure.close()
+                        figure = None
+                    continue
+                written.append(out_path)
+        finally:
+            if figure is not None:
+                figure.close()
+    return written
+
+
+def _load_quicklook_field(staged_path: str | Path, *, fxx: int, region: str):
+    """Read, step-select and crop one staged GRIB into memory.
+
+    Returns ``(dataset, valid)``: a one-variable 2-D dataset and its valid time
+    (``None`` if the file carries none).  The values are loaded here, so a caller
+    running this on a worker thread gets the decode off the render thread too.
     """
     import xarray as xr
 
+    # Keep cfgrib's message index next to the staged file so re-renders (another
+    # lead, a rerun of the staging job) open it without rescanning every message.
     ds = xr.open_dataset(
         str(staged_path),
         engine="cfgrib",
-        backend_kwargs={"indexpath": ""},
+        backend_kwargs={"indexpath": CFGRIB_INDEXPATH},
     )
 
     if "step" in ds.dims:
@@ -81,20 +202,71 @@ def quicklook_staged_grib(
         raise ValueError(f"No data variables in {staged_path}")
     var = data_vars[0]
 
-    # The reforecast cfgrib dataset carries the lead time as ``step`` with a scalar
-    # ``time``; plot_planview wants a singleton ``time`` *dimension*. Build a clean
-    # (time=1, lat, lon) field, keeping the valid time for the label.
     valid = ds["valid_time"].values if "valid_time" in ds.coords else (
         ds["time"].values if "time" in ds.coords else None
     )
-    field2d = ds[var].reset_coords(drop=True)
-    one_ds = field2d.to_dataset(name=var)
+    return ds[var].reset_coords(drop=True).to_dataset(name=var).load(), valid
+
+
+@dataclass
+class _QuicklookFigure:
+    """A saved quicklook left open for the next field on the same grid."""
+
+    ax: object
+    latitude: np.ndarray
+    longitude: np.ndarray
+
+    def matches(self, field_ds) -> bool:
+        return (np.array_equal(self.latitude, field_ds["latitude"].values)
+                and np.array_equal(self.longitude, field_ds["longitude"].values))
+
+    def redraw(self, field_ds, var: str, title: str, out_path: Path,
+               metadata: dict) -> None:
+        """Swap in ``var``'s values, limits, label and title, then save."""
+        from brc_tools.visualize.grid import fill_array
+
+        field = fill_array(field_ds[var].values)
+        # plot_planview's fill is the first artist on its axes
+        mesh = self.ax.collections[0]
+        mesh.set_array(field)
+        mesh.set_clim(float(np.nanmin(field)), float(np.nanmax(field)))
+        mesh.colorbar.set_label(var, fontsize=9)
+        self.ax.set_title(title, fontsize=11)
+        self.ax.get_figure().savefig(out_path, dpi=150, metadata=metadata)
+
+    def close(self) -> None:
+        plt.close(self.ax.get_figure())
+
+
+def _render_quicklook(field_ds, valid, out_path: Path, *, variable_level: str,
+                      fxx: int, case: str, region: str = DEFAULT_REGION,
+                      figure: _QuicklookFigure | None = None) -> _QuicklookFigure | None:
+    """Save one quicklook, redrawing ``figure`` when it is on the same grid.
+
+    Returns the open figure for the next field to reuse (the caller closes it),
+    or ``None`` after the plain fallback.  A ``figure`` that is not returned has
+    been closed here.
+    """
+    var = next(iter(field_ds.data_vars))
+    # The reforecast cfgrib dataset carries the lead time as ``step`` with a scalar
+    # ``time``; plot_planview wants a singleton ``time`` *dimension*. Build a clean
+    # (time=1, lat, lon) field, keeping the valid time for the label.
+    one_ds = field_ds
     if valid is not None:
         one_ds = one_ds.expand_dims(time=[np.datetime64(valid)])
 
-    out_path = _figure_dir(case, figure_dir) / f"{variable_level}_f{int(fxx):03d}.png"
     vt_label = str(valid)[:16] if valid is not None else ""
     title = f"{variable_level}  f{int(fxx):03d}  valid {vt_label}Z  ({case})"
+    metadata = {_REGION_KEY: region}
+
+    if figure is not None:
+        if figure.matches(field_ds):
+            try:
+                figure.redraw(field_ds, var, title, out_path, metadata)
+                return figure
+            except Exception as exc:  # noqa: BLE001 - rebuild below
+                LOG.warning("quicklook redraw failed (%s); drawing afresh", exc)
+        figure.close()
 
     try:
         from brc_tools.nwp.case_study import annotate
@@ -103,16 +275,18 @@ def quicklook_staged_grib(
         ax = plot_planview(one_ds, var, time_idx=0, title=title)
         fig = ax.get_figure()
         annotate(fig, "GEFSv12 Reforecast | WRF-input staging | BRC Tools")
-        fig.savefig(out_path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
+        # plot_planview lays its own figure out (constrained), so skip the
+        # bbox_inches="tight" pass -- on a Cartopy axes it costs a second draw.
+        fig.savefig(out_path, dpi=150, metadata=metadata)
     except Exception as exc:  # noqa: BLE001 - cosmetic fallback
         LOG.warning("plot_planview failed (%s); using plain fallback", exc)
-        _plain_map(field2d.to_dataset(name=var), var, title, out_path)
-
-    return out_path
+        _plain_map(field_ds, var, title, out_path, metadata)
+        return None
+    return _QuicklookFigure(ax, np.asarray(field_ds["latitude"].values),
+                            np.asarray(field_ds["longitude"].values))
 
 
-def _plain_map(ds, var: str, title: str, out_path: Path) -> None:
+def _plain_map(ds, var: str, title: str, out_path: Path, metadata: dict) -> None:
     """Minimal pcolormesh fallback with no cartopy dependency."""
     lat = np.asarray(ds["latitude"].values)
     lon = np.asarray(ds["longitude"].values)
@@ -125,7 +299,7 @@ def _plain_map(ds, var: str, title: str, out_path: Path) -> None:
     ax.set_ylabel("latitude")
     fig.text(0.99, 0.01, "GEFSv12 Reforecast | WRF-input staging | BRC Tools",
              ha="right", va="bottom", fontsize=6, style="italic", alpha=0.7)
-    fig.savefig(out_path, dpi=150, bbox_inches="tight")
+    fig.savefig(out_path, dpi=150, bbox_inches="tight", metadata=metadata)
     plt.close(fig)
 
 
@@ -30,6 +30,7 @@ waypoints, and colour scales are the caller's business.
 """
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -37,12 +38,14 @@ from pathlib import Path
 import numpy as np
 
 from brc_tools.nwp import wrf_output as wo
-from brc_tools.nwp.section import NWPSection
+from brc_tools.nwp.section import NWPSection, column_tree
+
+LOG = logging.getLogger(__name__)
 
 __all__ = ["WRFPlane", "load_plane", "plan_dataset", "plan_diagnostics",
            "plan_extent", "section_from_plane", "extract_wrf_section",
            "section_coverage", "SectionCoverage", "grid_spacing_km",
-           "nearest_column",
+           "nearest_column", "section_n_points",
            "PLANE_EXTRAS", "list_valid_times", "wrfout_path", "init_time"]
 
 _KM_PER_DEG_LAT = 110.574
@@ -56,6 +59,13 @@ _KM_PER_DEG_LON = 111.320
 #: has no upper bound and will happily return the boundary column forever.
 _OFFGRID_TOLERANCE_CELLS = 1.0
 
+#: Fewest samples an automatically sized transect gets, so a short line across a
+#: coarse nest still draws as a curtain rather than a handful of slabs.
+_MIN_SECTION_POINTS = 50
+
+#: Samples per grid spacing of transect length; see :func:`section_n_points`.
+_SAMPLES_PER_SPACING = 1.5
+
 # WRF writes history filenames as `%Y-%m-%d_%H:%M:%S`, unless the run set
 # `nocolons = .true.` (common on filesystems and tooling that dislike colons), in
 # which case the time separators become underscores.  wrf_output assumes the first;
@@ -262,7 +272,9 @@ class WRFPlane:
 PLANE_EXTRAS = ("rh", "qv", "cloud", "vis", "tke", "theta_grad", "tracers")
 
 
-def load_plane(ds, *, extras: tuple[str, ...] = ()) -> WRFPlane:
+def load_plane(
+    ds, *, extras: tuple[str, ...] = (), window: dict[str, slice] | None = None
+) -> WRFPlane:
     """Read the 3-D fields for :func:`section_from_plane` from an open ``wrfout``.
 
     Reflectivity is picked up when the run wrote ``REFL_10CM``, so a convective
@@ -273,15 +285,22 @@ def load_plane(ds, *, extras: tuple[str, ...] = ()) -> WRFPlane:
     this run did not write is left as ``None`` rather than raising, so one config
     can ask for a fog curtain and still work against a run with no microphysics
     output.
+
+    ``window`` (from :func:`plane_window`) crops ``ds`` lazily before anything is
+    read, so only that block of columns comes off disk; ``pressure_hpa`` is then
+    the mean over the window rather than the whole domain.
     """
     from brc_tools.nwp import wrf_derived as wd
 
     unknown = [e for e in extras if e not in PLANE_EXTRAS]
     if unknown:
         raise ValueError(f"unknown plane extras {unknown}; choose from {list(PLANE_EXTRAS)}")
+    if window is not None:
+        ds = ds.isel({dim: sl for dim, sl in window.items() if dim in ds.dims})
 
     ue, ve = wo.earth_relative_winds(ds)
     theta = wo.potential_temperature(ds)
+    pressure = wo.pressure_pa(ds)
     height = wo.geopotential_height_mass(ds)
     plane = WRFPlane(
         refl=wo.reflectivity(ds) if "REFL_10CM" in ds else None,
@@ -291,11 +310,11 @@ def load_plane(ds, *, extras: tuple[str, ...] = ()) -> WRFPlane:
         height=height,
         height_w=wo.geopotential_height_w(ds),
         theta=theta,
-        temp=wo.temperature_k(ds),
+        temp=wo.temperature_k(ds, theta=theta, pressure=pressure),
         ue=ue,
         ve=ve,
         w=wo.vertical_velocity(ds),
-        pressure_hpa=wo.pressure_pa(ds).mean(axis=(1, 2)) / 100.0,
+        pressure_hpa=pressure.mean(axis=(1, 2)) / 100.0,
     )
     if not extras:
         return plane
@@ -323,7 +342,7 @@ def load_plane(ds, *, extras: tuple[str, ...] = ()) -> WRFPlane:
         try:
             setattr(plane, name, builders[name]())
         except KeyError as exc:  # a variable this run did not write
-            print(f"[SKIP] section extra {name!r}: {exc}")
+            LOG.warning("section extra %r skipped: %s", name, exc)
     return plane
 
 
@@ -362,6 +381,23 @@ def grid_spacing_km(lat2d, lon2d) -> float:
     return float(np.median(np.concatenate(steps)))
 
 
+def section_n_points(start, end, spacing_km: float, *,
+                     minimum: int = _MIN_SECTION_POINTS) -> int:
+    """Samples for an A->B line: 1.5 per grid spacing of its length.
+
+    One per spacing is not enough for nearest-column sampling: an oblique line
+    steps into a new column at every row *and* column edge it crosses -- up to
+    1.4x as many columns as its length in cells -- so on a diagonal it skips
+    about a third of them; at 1.5 it reaches over nine in ten.  A long line on a
+    fine nest gets more and a short one fewer, instead of the engines' old fixed
+    240 oversampling the first and undersampling the second.  Never fewer than
+    ``minimum``.
+    """
+    _, _, dist = _sample_line(start, end, 2)
+    return max(int(minimum),
+               int(np.ceil(_SAMPLES_PER_SPACING * dist[-1] / float(spacing_km))) + 1)
+
+
 def nearest_column(plane: WRFPlane, lat: float, lon: float) -> tuple[int, int]:
     """``(j, i)`` of the plane column nearest ``(lat, lon)``.
 
@@ -418,13 +454,10 @@ def _nearest_columns(lat2d, lon2d, lat_line, lon_line):
     The KD-tree is built in kilometres (longitudes scaled by cos(lat)), so the
     distances it returns are already the quantity we want to threshold on.
     """
-    from scipy.spatial import cKDTree
-
     coslat = float(np.cos(np.deg2rad(np.mean(lat2d))))
-    tree = cKDTree(np.column_stack([
-        np.asarray(lat2d, dtype=float).ravel() * _KM_PER_DEG_LAT,
-        np.asarray(lon2d, dtype=float).ravel() * _KM_PER_DEG_LON * coslat,
-    ]))
+    # Memoised on the grid: coverage, the cut itself and every further transect of
+    # a sweep all query the same plane.
+    tree = column_tree(lat2d, lon2d, (_KM_PER_DEG_LAT, _KM_PER_DEG_LON * coslat))
     dist_km, flat = tree.query(np.column_stack([
         lat_line * _KM_PER_DEG_LAT, lon_line * _KM_PER_DEG_LON * coslat]))
     jj, ii = np.unravel_index(flat, np.shape(lat2d))
@@ -437,14 +470,15 @@ def section_coverage(
     end: tuple[float, float],
     *,
     lon2d=None,
-    n_points: int = 240,
+    n_points: int | None = None,
     max_gap_km: float | None = None,
 ) -> SectionCoverage:
     """Whether an A->B transect lies on the grid, without reading the 3-D state.
 
     Accepts either a :class:`WRFPlane` or a bare ``lat2d`` plus ``lon2d``, so an
     engine can preflight a transect against a single opened ``wrfout`` before
-    committing to :func:`load_plane`.
+    committing to :func:`load_plane`.  ``n_points=None`` sizes the line with
+    :func:`section_n_points`, as :func:`section_from_plane` does.
     """
     if isinstance(plane_or_lat2d, WRFPlane):
         lat2d, lon2d = plane_or_lat2d.lat2d, plane_or_lat2d.lon2d
@@ -453,10 +487,12 @@ def section_coverage(
         if lon2d is None:
             raise TypeError("pass a WRFPlane, or both lat2d and lon2d")
 
+    spacing = grid_spacing_km(lat2d, lon2d)
+    if n_points is None:
+        n_points = section_n_points(start, end, spacing)
     lon_line, lat_line, dist_along = _sample_line(start, end, n_points)
     _, _, gap_km = _nearest_columns(lat2d, lon2d, lat_line, lon_line)
 
-    spacing = grid_spacing_km(lat2d, lon2d)
     tol = float(max_gap_km) if max_gap_km is not None else _OFFGRID_TOLERANCE_CELLS * spacing
     outside = gap_km > tol
     first = None
@@ -491,7 +527,7 @@ def section_from_plane(
     start: tuple[float, float],
     end: tuple[float, float],
     *,
-    n_points: int = 240,
+    n_points: int | None = None,
     termini: tuple[str, str] = ("A", "B"),
     orientation: str = "EW",
     max_gap_km: float | None = None,
@@ -533,13 +569,29 @@ def section_from_plane(
     are left intact so the axes and the terrain fill stay well defined and the
     gap simply reads as missing.  Use :func:`section_coverage` to detect this
     before paying for :func:`load_plane`.
+
+    ``n_points=None`` sizes the line to the grid (see :func:`section_n_points`).
     """
+    spacing = (grid_spacing_km(plane.lat2d, plane.lon2d)
+               if max_gap_km is None or n_points is None else None)
+    if n_points is None:
+        n_points = section_n_points(start, end, spacing)
     lon_line, lat_line, dist = _sample_line(start, end, n_points)
     jj, ii, gap_km = _nearest_columns(plane.lat2d, plane.lon2d, lat_line, lon_line)
-
     tol = (float(max_gap_km) if max_gap_km is not None
-           else _OFFGRID_TOLERANCE_CELLS * grid_spacing_km(plane.lat2d, plane.lon2d))
-    offgrid = gap_km > tol
+           else _OFFGRID_TOLERANCE_CELLS * spacing)
+    return _cut_columns(plane, start, end, (lon_line, lat_line, dist), jj, ii,
+                        gap_km > tol, termini=termini, orientation=orientation)
+
+
+def _cut_columns(plane, start, end, line, jj, ii, offgrid, *, termini,
+                 orientation) -> NWPSection:
+    """The :class:`NWPSection` at already-picked plane columns ``(jj, ii)``.
+
+    ``line`` is the ``(lon_line, lat_line, distance_km)`` the columns were picked
+    for and ``offgrid`` the samples to blank.
+    """
+    lon_line, lat_line, dist = line
 
     def _blank(field):
         """NaN the off-grid columns of a sampled data field."""
@@ -594,10 +646,72 @@ def section_from_plane(
     )
 
 
-def extract_wrf_section(ds, start, end, **kwargs) -> NWPSection:
+def plane_window(ds, lines, *, n_points: int | None = None,
+                 pad: int = 2) -> dict[str, slice]:
+    """``isel`` indexers for the block of columns the ``(start, end)`` lines touch.
+
+    Only the 2-D ``XLAT``/``XLONG`` are read.  The block spans every sample's
+    nearest column plus ``pad`` cells, so the nearest-column pick inside it is the
+    same as on the full grid; the staggered dims get the one extra edge they need
+    to destagger.  ``n_points=None`` sizes each line as :func:`section_from_plane`
+    does.
+    """
+    lat2d = wo.surface_field(ds, "XLAT")
+    lon2d = _lon180(wo.surface_field(ds, "XLONG"))
+    spacing = grid_spacing_km(lat2d, lon2d) if n_points is None else None
+    jj, ii = [], []
+    for start, end in lines:
+        n = n_points if n_points is not None else section_n_points(start, end, spacing)
+        lon_line, lat_line, _ = _sample_line(start, end, n)
+        j, i, _ = _nearest_columns(lat2d, lon2d, lat_line, lon_line)
+        jj.append(j)
+        ii.append(i)
+    return _window_around(np.concatenate(jj), np.concatenate(ii), lat2d.shape, pad)
+
+
+def _window_around(jj, ii, shape, pad: int) -> dict[str, slice]:
+    """Mass and staggered ``isel`` slices spanning columns ``(jj, ii)`` plus ``pad``."""
+    ny, nx = shape
+    j0, j1 = max(int(jj.min()) - pad, 0), min(int(jj.max()) + pad + 1, ny)
+    i0, i1 = max(int(ii.min()) - pad, 0), min(int(ii.max()) + pad + 1, nx)
+    return {
+        "south_north": slice(j0, j1),
+        "west_east": slice(i0, i1),
+        "south_north_stag": slice(j0, j1 + 1),
+        "west_east_stag": slice(i0, i1 + 1),
+    }
+
+
+def extract_wrf_section(
+    ds,
+    start: tuple[float, float],
+    end: tuple[float, float],
+    *,
+    n_points: int | None = None,
+    termini: tuple[str, str] = ("A", "B"),
+    orientation: str = "EW",
+    max_gap_km: float | None = None,
+) -> NWPSection:
     """One-shot :func:`load_plane` + :func:`section_from_plane`.
 
-    Convenient for a single transect; for several lines through the same time,
-    call :func:`load_plane` once and reuse the plane.
+    Convenient for a single transect; the read is cropped to the line's
+    :func:`plane_window`, so only the columns the cut can touch are loaded.  For
+    several lines through the same time, call :func:`load_plane` once and reuse
+    the plane.
     """
-    return section_from_plane(load_plane(ds), start, end, **kwargs)
+    # The columns are picked once, on the full grid: the window is cut around
+    # them and the cut reuses them shifted into it, so no second (window) tree.
+    lat2d = wo.surface_field(ds, "XLAT")
+    lon2d = _lon180(wo.surface_field(ds, "XLONG"))
+    spacing = grid_spacing_km(lat2d, lon2d)
+    if n_points is None:
+        n_points = section_n_points(start, end, spacing)
+    lon_line, lat_line, dist = _sample_line(start, end, n_points)
+    jj, ii, gap_km = _nearest_columns(lat2d, lon2d, lat_line, lon_line)
+    tol = (float(max_gap_km) if max_gap_km is not None
+           else _OFFGRID_TOLERANCE_CELLS * spacing)
+    window = _window_around(jj, ii, lat2d.shape, pad=2)
+    return _cut_columns(
+        load_plane(ds, window=window), start, end, (lon_line, lat_line, dist),
+        jj - window["south_north"].start, ii - window["west_east"].start,
+        gap_km > tol, termini=termini, orientation=orientation)
@@ -43,6 +43,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import hashlib
 import json
 import logging
@@ -54,6 +55,7 @@ import subprocess
 import tempfile
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from urllib.parse import quote
@@ -201,6 +203,19 @@ def _canonical_staging_path(
     return base / filename
 
 
+def _herbie_save_dir(herbie_save_dir, output_root) -> Path:
+    """Herbie's working cache: ``herbie_save_dir``, else one inside ``output_root``.
+
+    Defaulting beside the staging tree keeps the download on the filesystem it is
+    moved to, so the move is a rename rather than a second full copy of a
+    multi-gigabyte GRIB from node-local temp onto scratch.
+    """
+    save_dir = (Path(herbie_save_dir) if herbie_save_dir is not None
+                else Path(output_root) / ".herbie_cache")
+    save_dir.mkdir(parents=True, exist_ok=True)
+    return save_dir
+
+
 def _reforecast_filename(variable_level: str, init_dt: dt.datetime, member_token: str) -> str:
     """The reforecast's own file name, e.g. ``tmp_2m_2013013100_c00.grib2``."""
     return f"{variable_level}_{init_dt:%Y%m%d%H}_{member_token}.grib2"
@@ -281,14 +296,23 @@ def _isoformat_utc(value: dt.datetime) -> str:
 
 
 _LEAD_RE = re.compile(r"(\d+)\s*hour")
+# The first ``N hour`` token of every line, for scanning a whole idx in one pass.
+_IDX_LEAD_RE = re.compile(r"^[^\n]*?(\d+)\s*hour", re.MULTILINE)
 
 
 def _parse_lead(text) -> int | None:
     """Integer lead hour from a forecast-time string ('12 hour fcst' -> 12)."""
-    m = _LEAD_RE.search(str(text))
+    return _parse_lead_str(str(text))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_lead_str(text: str) -> int | None:
+    # An inventory repeats the same few forecast-time strings for every field,
+    # and the stager reads it more than once; parse each distinct string once.
+    m = _LEAD_RE.search(text)
     if m:
         return int(m.group(1))
-    s = str(text).strip()
+    s = text.strip()
     return int(s) if s.isdigit() else None
 
 
@@ -308,7 +332,7 @@ def _lead_times_from_inventory(inv) -> list[int]:
     """Best-effort sorted integer lead-time list from a Herbie inventory."""
     if inv is None:
         return []
-    hours = {h for h in (_parse_lead(v) for v in _inv_lead_values(inv)) if h is not None}
+    hours = {h for h in map(_parse_lead, set(_inv_lead_values(inv))) if h is not None}
     return sorted(hours)
 
 
@@ -324,8 +348,9 @@ def _lead_times_from_idx(idx_path: Path) -> list[int]:
         text = Path(idx_path).read_text(encoding="utf-8", errors="replace")
     except OSError:
         return []
-    hours = {h for h in (_parse_lead(line) for line in text.splitlines()) if h is not None}
-    return sorted(hours)
+    # Every idx line is unique (message number, byte offset), so per-line parsing
+    # gains nothing from the lead cache; one regex pass over the text does it.
+    return sorted({int(h) for h in _IDX_LEAD_RE.findall(text)})
 
 
 def _lead_search_regex(inv, lo: int, hi: int) -> tuple[str | None, list[int]]:
@@ -341,7 +366,7 @@ def _lead_search_regex(inv, lo: int, hi: int) -> tuple[str | None, list[int]]:
     leads = sorted(
         {
             h
-            for h in (_parse_lead(v) for v in _inv_lead_values(inv))
+            for h in map(_parse_lead, set(_inv_lead_values(inv)))
             if h is not None and lo <= h <= hi
         }
     )
@@ -387,8 +412,8 @@ def stage_reforecast(
         Intended lead-time window (hours). Selects the forecast-range bucket and
         is recorded as metadata; the download fetches the whole bucket file.
     herbie_save_dir : path, optional
-        Herbie's working cache before the move. Defaults to a temp dir; pass a
-        path on the same filesystem as ``output_root`` to make the move a rename.
+        Herbie's working cache before the move. Defaults to ``.herbie_cache``
+        inside ``output_root``, on the same filesystem, so the move is a rename.
     overwrite : bool
         Re-download even if a valid file already exists at the canonical path.
     keep_herbie_cache : bool
@@ -431,12 +456,7 @@ def stage_reforecast(
     # A representative fxx inside the bucket (selects the directory only).
     rep_fxx = int(fxx_window[0])
 
-    save_dir = (
-        Path(herbie_save_dir)
-        if herbie_save_dir is not None
-        else Path(tempfile.gettempdir()) / "brc_wrf_staging_cache"
-    )
-    save_dir.mkdir(parents=True, exist_ok=True)
+    save_dir = _herbie_save_dir(herbie_save_dir, output_root)
     lock_dir = os.environ.get("BRC_TOOLS_LOCK_DIR") or tempfile.gettempdir()
 
     staged: list[StagedFile] = []
@@ -580,11 +600,24 @@ def _download(H, search=None) -> Path:
 
     ``search=None`` downloads the whole file; a regex downloads only the matching
     GRIB messages by byte-range (used by ``lead_subset``).
+
+    A valid file already at Herbie's local path for this ``search`` is returned
+    as-is: Herbie skips an existing whole file itself but always re-fetches a
+    byte-range subset, so a re-run with ``keep_herbie_cache`` would otherwise
+    pull every subset again.
     """
+    getter = getattr(H, "get_localFilePath", None)
+    if callable(getter):
+        try:
+            existing = Path(getter(search))
+        except Exception:  # noqa: BLE001 - path prediction is best-effort
+            existing = None
+        if existing is not None and existing.exists() and validate_cached_grib(existing):
+            LOG.info("reuse (already in Herbie cache): %s", existing)
+            return existing
     out = H.download(search=search)
     if out is not None:
         return Path(out)
-    getter = getattr(H, "get_localFilePath", None)
     if callable(getter):
         return Path(getter())
     grib = getattr(H, "grib", None)
@@ -849,6 +882,8 @@ DEFAULT_HRRR_INIT = "2026-02-21 18:00"
 DEFAULT_HRRR_LEADS = (12, 13)
 DEFAULT_HRRR_PRODUCTS = ("nat", "sfc")
 DEFAULT_HRRR_INTERVAL_SECONDS = 3600
+# Whole-file HRRR downloads in flight at once; bounded by the bucket, not by cores.
+DEFAULT_HRRR_DOWNLOAD_WORKERS = 4
 
 
 def _hrrr_filename(init_dt: dt.datetime, lead: int, product: str) -> str:
@@ -904,6 +939,7 @@ def stage_hrrr(
     herbie_save_dir: str | Path | None = None,
     overwrite: bool = False,
     keep_herbie_cache: bool = False,
+    download_workers: int = DEFAULT_HRRR_DOWNLOAD_WORKERS,
 ) -> list[StagedFile]:
     """Stage whole raw HRRR GRIB product files (one per ``(product, lead)``) to scratch.
 
@@ -927,17 +963,20 @@ def stage_hrrr(
     output_root, case, source
         Canonical staging root, case name, and source token (``"hrrr"``).
     herbie_save_dir : path, optional
-        Herbie's working cache before the move. Pass a path on the same filesystem as
-        ``output_root`` to make the move a rename.
+        Herbie's working cache before the move. Defaults to ``.herbie_cache`` inside
+        ``output_root``, on the same filesystem, so the move is a rename.
     overwrite : bool
         Re-download even if a valid file already exists at the canonical path.
     keep_herbie_cache : bool
         Copy out of Herbie's cache instead of moving (leaves the cache populated).
+    download_workers : int
+        Concurrent ``(product, lead)`` downloads. The transfers are network-bound,
+        so threads suffice; ``1`` stages them one after another.
 
     Returns
     -------
     list[StagedFile]
-        One record per staged file. Does not write the manifest.
+        One record per staged file, in product-major order. Does not write the manifest.
     """
     init_dt = _parse_init_time(init)
     lu = load_lookups()
@@ -951,62 +990,60 @@ def stage_hrrr(
     if not products:
         raise ValueError("stage_hrrr needs at least one product (e.g. 'nat', 'sfc').")
 
-    save_dir = (
-        Path(herbie_save_dir)
-        if herbie_save_dir is not None
-        else Path(tempfile.gettempdir()) / "brc_wrf_staging_cache"
-    )
-    save_dir.mkdir(parents=True, exist_ok=True)
+    save_dir = _herbie_save_dir(herbie_save_dir, output_root)
     lock_dir = os.environ.get("BRC_TOOLS_LOCK_DIR") or tempfile.gettempdir()
 
-    staged: list[StagedFile] = []
-    for product in products:
-        for lead in leads:
-            filename = _hrrr_filename(init_dt, lead, product)
-            dest = _canonical_staging_path(output_root, case, source, "", filename)
-
-            lock_name = f"stage_{herbie_model}_{init_dt:%Y%m%d_%H}_f{lead:02d}_{product}.lock"
-            lock = fasteners.InterProcessLock(os.path.join(lock_dir, lock_name))
-
-            with lock:
-                if not overwrite and dest.exists() and validate_cached_grib(dest):
-                    LOG.info("skip (already staged): %s", dest)
-                    staged.append(
-                        _hrrr_staged_file(
-                            dest, init_dt, lead, product, source,
-                            _hrrr_remote_url(init_dt, lead, product),
-                        )
-                    )
-                    continue
-
-                H = Herbie(
-                    init_dt,
-                    model=herbie_model,
-                    fxx=lead,
-                    product=product,
-                    save_dir=str(save_dir),
-                )
-                # Whole-file download (search=None): retain the full raw GRIB — no
-                # byte-range subset, no crop — WPS needs every field on the native grid.
-                local = _download(H)
-                if not validate_cached_grib(local):
-                    purge_cached_files(H)
-                    raise RuntimeError(f"Downloaded HRRR GRIB failed validation: {local}")
-
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                if keep_herbie_cache:
-                    shutil.copy2(local, dest)
-                else:
-                    shutil.move(str(local), str(dest))
+    def _stage_one(product: str, lead: int) -> StagedFile:
+        filename = _hrrr_filename(init_dt, lead, product)
+        dest = _canonical_staging_path(output_root, case, source, "", filename)
 
-                remote_url = _remote_url(H) or _hrrr_remote_url(init_dt, lead, product)
-                staged.append(
-                    _hrrr_staged_file(dest, init_dt, lead, product, source, remote_url)
-                )
-                LOG.info(
-                    "staged hrrr %s f%02d -> %s (%d bytes)",
-                    product, lead, dest, dest.stat().st_size,
+        lock_name = f"stage_{herbie_model}_{init_dt:%Y%m%d_%H}_f{lead:02d}_{product}.lock"
+        lock = fasteners.InterProcessLock(os.path.join(lock_dir, lock_name))
+
+        with lock:
+            if not overwrite and dest.exists() and validate_cached_grib(dest):
+                LOG.info("skip (already staged): %s", dest)
+                return _hrrr_staged_file(
+                    dest, init_dt, lead, product, source,
+                    _hrrr_remote_url(init_dt, lead, product),
                 )
+
+            H = Herbie(
+                init_dt,
+                model=herbie_model,
+                fxx=lead,
+                product=product,
+                save_dir=str(save_dir),
+            )
+            # Whole-file download (search=None): retain the full raw GRIB — no
+            # byte-range subset, no crop — WPS needs every field on the native grid.
+            local = _download(H)
+            if not validate_cached_grib(local):
+                purge_cached_files(H)
+                raise RuntimeError(f"Downloaded HRRR GRIB failed validation: {local}")
+
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if keep_herbie_cache:
+                shutil.copy2(local, dest)
+            else:
+                shutil.move(str(local), str(dest))
+
+            remote_url = _remote_url(H) or _hrrr_remote_url(init_dt, lead, product)
+            LOG.info(
+                "staged hrrr %s f%02d -> %s (%d bytes)",
+                product, lead, dest, dest.stat().st_size,
+            )
+            return _hrrr_staged_file(dest, init_dt, lead, product, source, remote_url)
+
+    # Each (product, lead) is an independent whole-file HTTP download with its own
+    # lock, so threads overlap the transfers; map keeps the product-major order.
+    tasks = [(product, lead) for product in products for lead in leads]
+    workers = max(1, min(int(download_workers), len(tasks)))
+    if workers == 1:
+        staged = [_stage_one(product, lead) for product, lead in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            staged = list(pool.map(lambda task: _stage_one(*task), tasks))
     return staged
 
 
@@ -1075,18 +1112,31 @@ def stage_gfs_soil(
     # little, whereas being 5 h off catches the top layer mid-diurnal-swing.
     candidates.sort(key=lambda x: (x[0], x[1]))
 
+    def _dest(c: dt.datetime, ld: int) -> Path:
+        filename = f"gfs_{c:%Y%m%d%H}_f{ld:02d}_{product.replace('.', '')}.grib2"
+        return _canonical_staging_path(output_root, case, source, "", filename)
+
     cycle = lead = None
     H = None
     for stale, _, c, ld in candidates:
-        try:
-            probe = Herbie(c, model="gfs", fxx=ld, product=product,
-                           save_dir=str(Path(tempfile.gettempdir())), verbose=False)
-            if not probe.grib:
-                raise FileNotFoundError("no grib source")
-        except Exception as exc:  # noqa: BLE001
-            LOG.info("GFS soil: %s f%02d unavailable (%s) -- trying next",
-                     f"{c:%Y-%m-%d %HZ}", ld, type(exc).__name__)
-            continue
+        # A candidate already staged was available when it was fetched: take it
+        # without a Herbie probe, so a warm rerun makes no network request at all.
+        # Better-ranked candidates that are not staged are still probed first.
+        staged = _dest(c, ld)
+        if not overwrite and staged.exists() and validate_cached_grib(staged):
+            LOG.info("GFS soil: %s f%02d already staged -- no probe",
+                     f"{c:%Y-%m-%d %HZ}", ld)
+        else:
+            try:
+                probe = Herbie(c, model="gfs", fxx=ld, product=product,
+                               save_dir=str(Path(tempfile.gettempdir())), verbose=False)
+                if not probe.grib:
+                    raise FileNotFoundError("no grib source")
+            except Exception as exc:  # noqa: BLE001
+                LOG.info("GFS soil: %s f%02d unavailable (%s) -- trying next",
+                         f"{c:%Y-%m-%d %HZ}", ld, type(exc).__name__)
+                continue
+        # Logged for a staged pick too: a rerun must not hide that the soil is stale.
         cycle, lead = c, ld
         LOG.info("GFS soil: using %s f%02d -- valid %s, %d h from WRF init%s",
                  f"{c:%Y-%m-%d %HZ}", ld,
@@ -1099,15 +1149,9 @@ def stage_gfs_soil(
             f"{init_dt:%Y-%m-%d %HZ}. Checked {len(candidates)} combination(s)."
         )
 
-    filename = f"gfs_{cycle:%Y%m%d%H}_f{lead:02d}_{product.replace('.', '')}.grib2"
-    dest = _canonical_staging_path(output_root, case, source, "", filename)
+    dest = _dest(cycle, lead)
 
-    save_dir = (
-        Path(herbie_save_dir)
-        if herbie_save_dir is not None
-        else Path(tempfile.gettempdir()) / "brc_wrf_staging_cache"
-    )
-    save_dir.mkdir(parents=True, exist_ok=True)
+    save_dir = _herbie_save_dir(herbie_save_dir, output_root)
     lock_dir = os.environ.get("BRC_TOOLS_LOCK_DIR") or tempfile.gettempdir()
     lock = fasteners.InterProcessLock(
         os.path.join(lock_dir, f"stage_gfs_soil_{cycle:%Y%m%d_%H}_f{lead:02d}.lock")
@@ -1693,21 +1737,17 @@ def stage_case(
 def _run_quicklook(staged: list[StagedFile], *, region: str, case: str) -> None:
     """Best-effort sanity figures; never fatal to staging."""
     try:
-        from brc_tools.nwp.wrf_quicklook import quicklook_staged_grib
+        from brc_tools.nwp.wrf_quicklook import quicklook_staged_gribs
 
         wanted = {"tmp_2m", "weasd_sfc"}
-        for s in staged:
-            if s.variable_level in wanted:
-                try:
-                    png = quicklook_staged_grib(
-                        s.local_path,
-                        variable_level=s.variable_level,
-                        region=region,
-                        case=case,
-                    )
-                    LOG.info("quicklook -> %s", png)
-                except Exception as exc:  # noqa: BLE001
-                    LOG.warning("quicklook failed for %s: %s", s.variable_level, exc)
+        # The batch call reads the next GRIB while the current map renders and
+        # logs (rather than raises) a per-file failure.
+        for png in quicklook_staged_gribs(
+            [(s.local_path, s.variable_level) for s in staged if s.variable_level in wanted],
+            region=region,
+            case=case,
+        ):
+            LOG.info("quicklook -> %s", png)
     except Exception as exc:  # noqa: BLE001
         LOG.warning("quicklook unavailable: %s", exc)
 
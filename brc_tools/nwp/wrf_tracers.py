@@ -66,13 +66,24 @@ def tracer_stack(ds, names: list[str] | None = None) -> np.ndarray:
     Advection undershoots produce small negative concentrations.  They are
     numerical, and a negative share is not a thing, so they are clipped here --
     once, at the read -- rather than in each consumer.
+
+    The stack keeps the file's float32 rather than widening to float64: it is the
+    largest array a plane carries, and the shares are ratios of it.
     """
     names = names if names is not None else tracer_variables(ds)
     if not names:
         raise KeyError("this run wrote no tr17_* tracers (tracer_opt unset, "
                        "or the seeding step was skipped)")
-    return np.stack([np.maximum(np.asarray(wo._da(ds, n).values, dtype=float), 0.0)
-                     for n in names])
+    # One preallocated block, each tracer clipped straight into its slot, so the
+    # read never holds a list of 3-D arrays alongside their stacked copy.
+    # The dtype comes from every tracer (read from metadata, nothing loaded), so
+    # a float64 tracer later in the list is not squeezed into a float32 block.
+    fields = [wo._da(ds, name) for name in names]
+    stack = np.empty((len(names), *fields[0].shape),
+                     dtype=np.result_type(*(f.dtype for f in fields), np.float32))
+    for k, field in enumerate(fields):
+        np.maximum(field.values, 0.0, out=stack[k])
+    return stack
 
 
 def tracer_shares(stack, *, floor: float = DEFAULT_TOTAL_FLOOR
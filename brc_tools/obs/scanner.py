@@ -208,7 +208,7 @@ def detect_wind_ramp(
         return None
 
     peak_idx = speeds.index(peak_speed)
-    peak_time = window["valid_time"].to_list()[peak_idx]
+    peak_time = window["valid_time"][peak_idx]
 
     return {
         "date": str(d),
@@ -349,7 +349,7 @@ def detect_foehn(
 
     # -- Composite foehn score --
     foehn_score = round(wind_increase + temp_increase + dewpt_decrease, 1)
-    peak_time = window["valid_time"].to_list()[peak_idx]
+    peak_time = window["valid_time"][peak_idx]
 
     return {
         "date": str(d),
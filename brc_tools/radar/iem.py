@@ -201,8 +201,14 @@ def read_world_file(path: str | Path) -> tuple[float, float, float, float]:
 def dbz_from_index(index) -> np.ndarray:
     """Palette index to dBZ; index 0 (missing) becomes NaN."""
     idx = np.asarray(index)
-    dbz = _DBZ_MIN + (idx.astype(float) - 1.0) * _DBZ_STEP
-    return np.where(idx == 0, np.nan, dbz)
+    # One float buffer, scaled and masked in place: a RIDGE mosaic is millions of
+    # pixels and each temporary would be another full-size copy.
+    dbz = idx.astype(float)
+    dbz -= 1.0
+    dbz *= _DBZ_STEP
+    dbz += _DBZ_MIN
+    dbz[idx == 0] = np.nan
+    return dbz
 
 
 def read_ridge(
@@ -250,7 +256,7 @@ def read_ridge(
 
     values = dbz_from_index(index)
     if mask_below_dbz is not None:
-        values = np.where(values < mask_below_dbz, np.nan, values)
+        values[values < mask_below_dbz] = np.nan
 
     dx, dy, ul_x, ul_y = read_world_file(wld_path)
     ny, nx = index.shape
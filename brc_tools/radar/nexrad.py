@@ -40,6 +40,7 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -430,8 +431,6 @@ def fetch_volume(
         except Exception as exc:  # noqa: BLE001 - retried, then re-raised
             last = exc
             if attempt < retries - 1:
-                import time
-
                 time.sleep(backoff * (attempt + 1))
     raise RuntimeError(f"failed to fetch {url} after {retries} attempts: {last}")
 
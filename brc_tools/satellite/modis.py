@@ -22,6 +22,7 @@ import os
 import platform as runtime_platform
 import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from importlib.metadata import PackageNotFoundError, version
@@ -615,16 +616,25 @@ def _render_figure(
 
     output_stem.parent.mkdir(parents=True, exist_ok=True)
     output_hashes: dict[str, str] = {}
-    for fmt in formats:
-        clean = fmt.lower().lstrip(".")
-        if clean not in ("png", "pdf"):
-            raise ValueError("formats must contain only png and/or pdf")
-        path = output_stem.with_suffix(f".{clean}")
-        metadata = {"Creator": "brc-tools MODIS context renderer", "Title": heading}
-        if clean == "png":
-            metadata["Software"] = metadata.pop("Creator")
-        fig.savefig(path, dpi=dpi, metadata=metadata)
-        output_hashes[path.name] = _sha256(path.read_bytes())
+    # Encode each format in memory and hand the disk write to a worker, so the
+    # PDF encode overlaps the PNG write and the hash needs no read-back.
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        writes = []
+        for fmt in formats:
+            clean = fmt.lower().lstrip(".")
+            if clean not in ("png", "pdf"):
+                raise ValueError("formats must contain only png and/or pdf")
+            path = output_stem.with_suffix(f".{clean}")
+            metadata = {"Creator": "brc-tools MODIS context renderer", "Title": heading}
+            if clean == "png":
+                metadata["Software"] = metadata.pop("Creator")
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=clean, dpi=dpi, metadata=metadata)
+            content = buffer.getvalue()
+            writes.append(writer.submit(path.write_bytes, content))
+            output_hashes[path.name] = _sha256(content)
+        for write in writes:
+            write.result()  # surface any disk error here
     plt.close(fig)
     return output_hashes
 
@@ -0,0 +1,6 @@
+"""GRIB settings shared by the ``download`` and ``nwp`` readers."""
+
+# cfgrib ``indexpath`` template that keeps a GRIB's message index beside it, so a
+# file opened more than once (several filters, several hypercubes, a rerun) is
+# scanned once.  cfgrib rebuilds the index itself when the GRIB is newer.
+CFGRIB_INDEXPATH = "{path}.{short_hash}.idx"
@@ -0,0 +1,57 @@
+"""A small bounded memo for results built from arrays.
+
+``functools.lru_cache`` needs hashable arguments, but the expensive things the
+renderers rebuild -- a KD-tree over a lat/lon grid, a projected grid, the cuts
+from one loaded WRF plane -- are keyed on arrays or on a live object.  A
+:class:`ArrayMemo` compares arrays by content and owners by identity, and keeps
+only the few most recent results.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+import numpy as np
+
+
+class ArrayMemo:
+    """Most-recently-used memo keyed on ``(key, arrays, owner)``.
+
+    ``key`` is any hashable and compares with ``==``; ``arrays`` compare by shape
+    and content (copies are kept, so a caller mutating its array in place cannot
+    make a stale entry match); ``owner`` compares by identity and is held, not
+    copied.  At most ``maxsize`` entries are kept, least recently used evicted.
+    """
+
+    def __init__(self, maxsize: int = 1):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: list[tuple[Hashable, tuple[np.ndarray, ...], Any, Any]] = []
+
+    def get(self, key: Hashable, build: Callable[[], Any], *,
+            arrays: Sequence = (), owner: Any = None) -> Any:
+        """The memoised ``build()`` for this ``key``/``arrays``/``owner``."""
+        arrays = tuple(np.asarray(a) for a in arrays)
+        for i, (k, arrs, own, value) in enumerate(self._entries):
+            if k == key and own is owner and _same_arrays(arrs, arrays):
+                if i:
+                    self._entries.insert(0, self._entries.pop(i))
+                return value
+        value = build()
+        self._entries.insert(0, (key, tuple(a.copy() for a in arrays), owner, value))
+        del self._entries[self.maxsize:]
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry (and with it any reference to an owner)."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _same_arrays(a: tuple[np.ndarray, ...], b: tuple[np.ndarray, ...]) -> bool:
+    return len(a) == len(b) and all(
+        x.shape == y.shape and np.array_equal(x, y) for x, y in zip(a, b, strict=True))
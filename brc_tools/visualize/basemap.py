@@ -125,8 +125,30 @@ def _iter_lines(geom):
             yield from _iter_lines(part)
 
 
-def _draw_lines(ax, records, bbox, pbox, base_kw, *, transform_kw):
-    """Clip line/border records to ``bbox`` and stroke them."""
+@functools.lru_cache(maxsize=64)
+def _clipped_parts(layer: str, resolution: str, extent: tuple, highways_only: bool) -> tuple:
+    """Clip a layer to ``extent`` once -> line parts ``((xs, ys), ...)``.
+
+    Lakes come back as polygon exteriors (for filling), every other layer as the
+    stroked lines.  Cached per ``(layer, resolution, extent)``: a sweep renders many
+    fields over the same window, and the bbox test + shapely intersection over every
+    record in the layer is the expensive part of an overlay -- the drawing is cheap.
+    """
+    records = _load_records(layer, resolution)
+    if not records:
+        return ()
+    if layer == "roads" and highways_only:
+        records = tuple((g, a) for (g, a) in records if a.get("type") in _HIGHWAY_TYPES)
+    try:
+        from shapely.geometry import box as _box
+        from shapely.prepared import prep
+    except Exception:  # pragma: no cover - shapely absent
+        return ()
+
+    lon0, lon1, lat0, lat1 = extent
+    bbox = _box(min(lon0, lon1), min(lat0, lat1), max(lon0, lon1), max(lat0, lat1))
+    pbox = prep(bbox)
+    parts: list[tuple[np.ndarray, np.ndarray]] = []
     for geom, _attrs in records:
         try:
             if not pbox.intersects(geom):
@@ -134,28 +156,45 @@ def _draw_lines(ax, records, bbox, pbox, base_kw, *, transform_kw):
             clipped = geom.intersection(bbox)
         except Exception:  # pragma: no cover - invalid geometry
             continue
-        for xs, ys in _iter_lines(clipped):
-            if xs.size >= 2:
-                ax.plot(xs, ys, **base_kw, **transform_kw)
+        if layer == "lakes":
+            for poly in getattr(clipped, "geoms", [clipped]):
+                if getattr(poly, "geom_type", None) != "Polygon":
+                    continue
+                x, y = poly.exterior.xy
+                parts.append((np.asarray(x), np.asarray(y)))
+        else:
+            parts.extend((xs, ys) for xs, ys in _iter_lines(clipped) if xs.size >= 2)
+    return tuple(parts)
+
+
+def _draw_lines(ax, parts, base_kw, *, transform_kw):
+    """Stroke pre-clipped line parts as one collection.
+
+    A layer can clip to thousands of parts; one :class:`LineCollection` per layer
+    keeps every later draw -- each frame of a sweep -- to a single artist instead
+    of a ``Line2D`` per road segment or county edge.
+    """
+    if not parts:
+        return
+    from matplotlib.collections import LineCollection
 
+    lines = LineCollection([np.column_stack(p) for p in parts], **base_kw,
+                           **transform_kw)
+    ax.add_collection(lines)
+    ax.autoscale_view()
 
-def _draw_lake_fills(ax, records, bbox, pbox, *, transform_kw, zorder=2.5):
-    """Clip lake polygons to ``bbox`` and fill them a muted water blue."""
-    fill_kw = dict(facecolor="#aacbe6", edgecolor="#5d87ab", linewidth=0.4, alpha=0.65,
-                   zorder=zorder)
-    for geom, _attrs in records:
-        try:
-            if not pbox.intersects(geom):
-                continue
-            clipped = geom.intersection(bbox)
-        except Exception:  # pragma: no cover - invalid geometry
-            continue
-        polys = getattr(clipped, "geoms", [clipped])
-        for poly in polys:
-            if getattr(poly, "geom_type", None) != "Polygon":
-                continue
-            x, y = poly.exterior.xy
-            ax.fill(np.asarray(x), np.asarray(y), **fill_kw, **transform_kw)
+
+def _draw_lake_fills(ax, parts, *, transform_kw, zorder=2.5):
+    """Fill pre-clipped lake exteriors a muted water blue, as one collection."""
+    if not parts:
+        return
+    from matplotlib.collections import PolyCollection
+
+    fills = PolyCollection([np.column_stack(p) for p in parts], facecolor="#aacbe6",
+                           edgecolor="#5d87ab", linewidth=0.4, alpha=0.65,
+                           zorder=zorder, **transform_kw)
+    ax.add_collection(fills)
+    ax.autoscale_view()
 
 
 def draw_waypoints(
@@ -311,30 +350,20 @@ def add_reference_overlays(
         cities = bool(layers.get("cities", cities))
     if not (states or counties or roads or rivers or lakes or cities):
         return
-    try:
-        from shapely.geometry import box as _box
-        from shapely.prepared import prep
-    except Exception:  # pragma: no cover - shapely absent
-        return
-
-    lon0, lon1, lat0, lat1 = extent
-    bbox = _box(min(lon0, lon1), min(lat0, lat1), max(lon0, lon1), max(lat0, lat1))
-    pbox = prep(bbox)
+    key = tuple(float(v) for v in extent)
     transform_kw = {} if transform is None else {"transform": transform}
 
     if lakes:
-        _draw_lake_fills(ax, _load_records("lakes", resolution), bbox, pbox,
+        _draw_lake_fills(ax, _clipped_parts("lakes", resolution, key, False),
                          transform_kw=transform_kw)
     if rivers:
-        _draw_lines(ax, _load_records("rivers", resolution), bbox, pbox,
+        _draw_lines(ax, _clipped_parts("rivers", resolution, key, False),
                     _LINE_STYLE["rivers"], transform_kw=transform_kw)
     if roads:
-        recs = _load_records("roads", resolution)
-        if highways_only:
-            recs = tuple((g, a) for (g, a) in recs if a.get("type") in _HIGHWAY_TYPES)
-        _draw_lines(ax, recs, bbox, pbox, _LINE_STYLE["roads"], transform_kw=transform_kw)
+        _draw_lines(ax, _clipped_parts("roads", resolution, key, highways_only),
+                    _LINE_STYLE["roads"], transform_kw=transform_kw)
     if states:
-        _draw_lines(ax, _load_records("states", resolution), bbox, pbox,
+        _draw_lines(ax, _clipped_parts("states", resolution, key, False),
                     _LINE_STYLE["states"], transform_kw=transform_kw)
     if cities:
         draw_cities(ax, extent, max_rank=city_rank, resolution=resolution,
@@ -55,12 +55,16 @@ def isentrope_lid(theta3d, height3d, terrain, theta_iso: float, *,
 
     with np.errstate(invalid="ignore", divide="ignore"):
         frac = (float(theta_iso) - th_lo) / (th_hi - th_lo)
-    lid = np.where(k > 0, z_lo + np.clip(frac, 0.0, 1.0) * (z_hi - z_lo), np.nan)
+    np.clip(frac, 0.0, 1.0, out=frac)
+    lid = z_lo + frac * (z_hi - z_lo)
 
-    lid = np.where(has, lid, np.nan)          # never reaches theta_iso
-    lid = np.where(k > 0, lid, np.nan)        # ground already >= theta_iso: no pool
+    # One mask, one pass: k > 0 also covers "never reaches theta_iso" (k is 0
+    # wherever ``has`` is False) and "ground already >= theta_iso"; NaN depths
+    # fail both comparisons.
     depth = lid - terr
-    return np.where((depth > 0.0) & (depth <= max_depth_m), lid, np.nan)
+    keep = (k > 0) & (depth > 0.0) & (depth <= max_depth_m)
+    lid[~keep] = np.nan
+    return lid
 
 
 def extent_window(lon2d, lat2d, extent) -> tuple[slice, slice]:
@@ -137,10 +141,13 @@ def plot_coldpool_3d(
     dx_m = max(float(np.nanmean(np.diff(x_km, axis=1))) * 1000.0, 1.0)
     dy_m = max(float(np.nanmean(np.diff(y_km, axis=0))) * 1000.0, 1.0)
 
-    depth = np.where(lid - terr >= depth_min_m, lid - terr, np.nan)
+    depth = lid - terr
+    with np.errstate(invalid="ignore"):
+        pooled = depth >= depth_min_m
+    depth[~pooled] = np.nan
     norm = colors.Normalize(depth_min_m, depth_max_m)
     pool_rgba = colormaps[pool_cmap](norm(np.clip(depth, depth_min_m, depth_max_m)))
-    pool_rgba[..., 3] = np.where(np.isfinite(depth), 0.92, 0.0)  # invisible off-pool
+    pool_rgba[..., 3] = np.where(pooled, 0.92, 0.0)  # invisible off-pool
 
     # Pure hillshade, no elevation ramp: shape comes from the shading and height
     # from the z axis, which leaves darkness as well as hue free for the pool. A
@@ -157,8 +164,8 @@ def plot_coldpool_3d(
     ax = fig.add_subplot(projection="3d", computed_zorder=False)
     ax.plot_surface(x_km, y_km, terr, facecolors=terr_rgb, linewidth=0,
                     antialiased=False, rstride=1, cstride=1, shade=False, zorder=1)
-    if np.isfinite(depth).any():
-        ax.plot_surface(x_km, y_km, np.where(np.isfinite(depth), lid, np.nan),
+    if pooled.any():
+        ax.plot_surface(x_km, y_km, np.where(pooled, lid, np.nan),
                         facecolors=pool_rgba, linewidth=0, antialiased=False,
                         rstride=1, cstride=1, shade=False, zorder=3)
         cb = fig.colorbar(plt.cm.ScalarMappable(norm=norm, cmap=pool_cmap), ax=ax,
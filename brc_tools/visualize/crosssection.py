@@ -148,10 +148,7 @@ def plot_wrf_section(
     dpi: int = 300,
 ) -> Path:
     """Render a terrain-filled, height-ASL potential-temperature cross-section."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     from brc_tools.visualize.style import get_style
 
@@ -160,7 +157,7 @@ def plot_wrf_section(
     z2d = np.asarray(section.height2d)
     field = np.asarray(section.theta2d)
     terrain = np.asarray(section.terrain1d)
-    x2d = np.tile(dist, (z2d.shape[0], 1))
+    x2d = np.broadcast_to(dist, z2d.shape)
     accent = _ACCENT.get(section.orientation, "#c62828")
     out = Path(out_path)
 
@@ -169,7 +166,8 @@ def plot_wrf_section(
         hi = style.vmax if style.vmax is not None else float(np.ceil(np.nanmax(field)))
         contour_levels = np.arange(lo, hi + 0.1, 2.0)
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     ax.set_facecolor("0.55")  # sub-terrain gap (lowest mass level is above HGT) reads as terrain
     mesh = ax.pcolormesh(
         x2d, z2d, field, cmap=style.cmap, vmin=style.vmin, vmax=style.vmax,
@@ -214,19 +212,14 @@ def plot_wrf_section(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
 def _interp_columns_to_heights(field2d, height2d, target):
     """Interpolate each column of ``field2d`` (on ``height2d``) onto ``target`` heights."""
-    field2d = np.asarray(field2d)
-    height2d = np.asarray(height2d)
-    n = field2d.shape[1]
-    out = np.full((target.size, n), np.nan)
-    for i in range(n):
-        out[:, i] = np.interp(target, height2d[:, i], field2d[:, i], left=np.nan, right=np.nan)
-    return out
+    from brc_tools.visualize.grid import interp_columns
+
+    return interp_columns(field2d, height2d, target)
 
 
 def plot_wrf_section_difference(
@@ -253,10 +246,7 @@ def plot_wrf_section_difference(
     differs slightly, so both are interpolated onto a common ASL axis before the
     difference is taken.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     from brc_tools.visualize.style import diff_style
 
@@ -283,7 +273,8 @@ def plot_wrf_section_difference(
 
         diff = _nan_gaussian(diff, smooth_sigma)
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     ax.set_facecolor("0.55")  # below-ground NaN cells read as terrain, not white
     mesh = ax.pcolormesh(dist, target_heights, diff, cmap=style.cmap,
                          vmin=style.vmin, vmax=style.vmax, shading="gouraud")
@@ -314,5 +305,4 @@ def plot_wrf_section_difference(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
@@ -66,15 +66,13 @@ def plot_deficitflux_map(
     ``quiver_target`` sets roughly how many arrows span the short axis; the stride is
     derived from the grid so a 111 m and a 3 km nest both stay legible.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(out_path)
     lon = np.asarray(lon)
     lat = np.asarray(lat)
-    fig, ax = plt.subplots(figsize=(7.2, 6.4), constrained_layout=True)
+    fig = Figure(figsize=(7.2, 6.4), layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(lon, lat, np.asarray(h_mj), shading="auto",
                          cmap=style.cmap, vmin=style.vmin, vmax=style.vmax)
     stride = max(1, min(lon.shape) // max(quiver_target, 1))
@@ -95,7 +93,6 @@ def plot_deficitflux_map(
     _annotate(ax, annotation)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
@@ -123,10 +120,7 @@ def plot_deficitflux_divergence(
     because the raw divergence is saturated gravity-wave noise at 111 m — a
     fixed cell count would under-smooth fine nests and blur coarse ones.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     from brc_tools.visualize.style import symmetric_limit
 
@@ -141,7 +135,8 @@ def plot_deficitflux_divergence(
         vmin, vmax = -lim, lim
     else:
         vmin, vmax = style.vmin, style.vmax
-    fig, ax = plt.subplots(figsize=(7.2, 6.4), constrained_layout=True)
+    fig = Figure(figsize=(7.2, 6.4), layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(lon, lat, adv, shading="auto",
                          cmap=style.cmap, vmin=vmin, vmax=vmax)
     _decorate(ax, lon, lat, crest_terrain=crest_terrain, crest_m=crest_m,
@@ -151,7 +146,6 @@ def plot_deficitflux_divergence(
     _annotate(ax, annotation)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
@@ -178,15 +172,13 @@ def plot_deficit_bulk_diagnostics(
     reduced-gravity proxy only; the renderer deliberately labels it as exploratory and
     does not imply a hydraulic-control diagnosis.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(out_path)
     fields = (np.asarray(depth_m), np.asarray(speed_m_s), np.asarray(froude))
     labels = ("diagnosed layer depth", "deficit-weighted speed |F|/H", "exploratory bulk Froude proxy")
-    fig, axes = plt.subplots(1, 3, figsize=(14.2, 4.6), constrained_layout=True)
+    fig = Figure(figsize=(14.2, 4.6), layout="constrained")
+    axes = fig.subplots(1, 3)
     for ax, field, style, subtitle in zip(axes, fields, styles, labels):
         mesh = ax.pcolormesh(
             lon, lat, field, shading="auto", cmap=style.cmap,
@@ -203,7 +195,6 @@ def plot_deficit_bulk_diagnostics(
         fig.text(0.01, 0.005, annotation, fontsize=6, color="0.4", ha="left", va="bottom")
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
@@ -228,11 +219,8 @@ def plot_deficit_budget(
     diabatic because reference-state, clipped-layer, vertical/boundary, and numerical
     terms may also contribute.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
     import matplotlib.dates as mdates
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(out_path)
     times = list(times)
@@ -242,7 +230,7 @@ def plot_deficit_budget(
     convergence = np.asarray(convergence_tendency, dtype=float)
     unresolved = np.asarray(unresolved_tendency, dtype=float)
 
-    fig = plt.figure(figsize=(10.6, 6.2), constrained_layout=True)
+    fig = Figure(figsize=(10.6, 6.2), layout="constrained")
     gs = fig.add_gridspec(2, 2, width_ratios=(1.45, 1.0))
     ax_h = fig.add_subplot(gs[0, 0])
     ax_t = fig.add_subplot(gs[1, 0], sharex=ax_h)
@@ -306,5 +294,4 @@ def plot_deficit_budget(
     fig.autofmt_xdate(rotation=25)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
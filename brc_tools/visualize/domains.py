@@ -30,6 +30,7 @@ def plot_domain_boxes(
     import matplotlib
 
     matplotlib.use("Agg")
+    import matplotlib.colors as mcolors
     import matplotlib.pyplot as plt
 
     from brc_tools.visualize.grid import terrain_contour_levels
@@ -40,11 +41,16 @@ def plot_domain_boxes(
     if terrain is not None and terrain_lonlat is not None:
         lon2d, lat2d = (np.asarray(a) for a in terrain_lonlat)
         levels = terrain_contour_levels(np.asarray(terrain))
-        cf = ax.contourf(
+        # One QuadMesh on a BoundaryNorm keeps contourf's stepped bands without
+        # extracting a polygon set per level.
+        cmap = plt.get_cmap("terrain")
+        norm = (mcolors.BoundaryNorm(levels, cmap.N, extend="both")
+                if levels is not None else None)
+        mesh = ax.pcolormesh(
             lon2d, lat2d, np.asarray(terrain),
-            levels=levels if levels is not None else 20, cmap="terrain", alpha=0.9,
+            cmap=cmap, norm=norm, shading="nearest", alpha=0.9,
         )
-        fig.colorbar(cf, ax=ax, shrink=0.8, label="terrain height (m MSL)")
+        fig.colorbar(mesh, ax=ax, shrink=0.8, label="terrain height (m MSL)")
 
     colors = box_colors or ["#111111", "#c62828", "#1565c0", "#2e7d32"]
     for k, outline in enumerate(outlines):
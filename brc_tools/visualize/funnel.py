@@ -25,6 +25,8 @@ from pathlib import Path
 
 import numpy as np
 
+from brc_tools.visualize.grid import fill_array
+
 KT = 1.94384  # m/s -> knots
 
 # Funnel overlays: borders + hydrography + city labels; roads off (too busy at
@@ -42,14 +44,21 @@ def _validate_output_dir(path: Path) -> None:
         raise SystemExit(f"refusing to write figure into the repo checkout: {resolved}")
 
 
+def _finite_range(field) -> tuple[float | None, float | None]:
+    """``(min, max)`` over the finite values, without copying them out first."""
+    vals = np.asarray(field, dtype=float)
+    if not np.isfinite(vals).any():
+        return None, None
+    return float(np.nanmin(vals)), float(np.nanmax(vals))
+
+
 def _contour_levels(field, interval: float) -> np.ndarray:
     """Evenly spaced contour levels spanning a field's finite range."""
-    vals = np.asarray(field, dtype=float)
-    finite = vals[np.isfinite(vals)]
-    if finite.size == 0:
+    lo, hi = _finite_range(field)
+    if lo is None:
         return np.array([])
-    lo = np.floor(float(finite.min()) / interval) * interval
-    hi = np.ceil(float(finite.max()) / interval) * interval
+    lo = np.floor(lo / interval) * interval
+    hi = np.ceil(hi / interval) * interval
     return np.arange(lo, hi + interval, interval)
 
 
@@ -93,7 +102,7 @@ def plot_upperair_panel(ax, lon, lat, fill, height, u, v, *, style, level_label,
     """Scalar fill (isotachs or absolute vorticity) + height contours + barbs."""
     lon = np.asarray(lon)
     lat = np.asarray(lat)
-    mesh = ax.pcolormesh(lon, lat, np.asarray(fill, dtype=float), shading="auto",
+    mesh = ax.pcolormesh(lon, lat, fill_array(fill), shading="auto",
                          cmap=style.cmap, vmin=style.vmin, vmax=style.vmax, alpha=0.95)
     ax.figure.colorbar(mesh, ax=ax, shrink=0.85, extend=style.extend, label=style.label)
     _draw_heights(ax, lon, lat, height, height_interval_dam)
@@ -106,6 +115,8 @@ def plot_upperair_panel(ax, lon, lat, fill, height, u, v, *, style, level_label,
 
 # Temperature-advection contour levels (K/h): warm (red, solid) / cold (blue, dashed).
 _ADV_LEVELS = np.array([-3.0, -2.0, -1.0, -0.5, 0.5, 1.0, 2.0, 3.0])
+_ADV_COLORS = tuple("#1565c0" if lv < 0 else "#c62828" for lv in _ADV_LEVELS)
+_ADV_STYLES = tuple("dashed" if lv < 0 else "solid" for lv in _ADV_LEVELS)
 
 
 def plot_moisture_panel(ax, lon, lat, spfh, height, u, v, *, style, level_label,
@@ -114,17 +125,15 @@ def plot_moisture_panel(ax, lon, lat, spfh, height, u, v, *, style, level_label,
     """Specific-humidity fill + heights + warm/cold-air (temperature) advection + barbs."""
     lon = np.asarray(lon)
     lat = np.asarray(lat)
-    mesh = ax.pcolormesh(lon, lat, np.asarray(spfh, dtype=float), shading="auto",
+    mesh = ax.pcolormesh(lon, lat, fill_array(spfh), shading="auto",
                          cmap=style.cmap, vmin=style.vmin, vmax=style.vmax, alpha=0.95)
     ax.figure.colorbar(mesh, ax=ax, shrink=0.85, extend=style.extend, label=style.label)
     _draw_heights(ax, lon, lat, height, height_interval_dam)
     if t_adv is not None:
         adv = np.asarray(t_adv, dtype=float)
         if np.isfinite(adv).any() and float(np.nanmax(np.abs(adv))) >= _ADV_LEVELS[-1] * 0.15:
-            colors = ["#1565c0" if lv < 0 else "#c62828" for lv in _ADV_LEVELS]
-            styles = ["dashed" if lv < 0 else "solid" for lv in _ADV_LEVELS]
-            cs = ax.contour(lon, lat, adv, levels=_ADV_LEVELS, colors=colors,
-                            linestyles=styles, linewidths=0.8, alpha=0.9, zorder=4.5)
+            cs = ax.contour(lon, lat, adv, levels=_ADV_LEVELS, colors=_ADV_COLORS,
+                            linestyles=_ADV_STYLES, linewidths=0.8, alpha=0.9, zorder=4.5)
             ax.clabel(cs, fontsize=5.5, fmt="%.1f", inline=True)
     if u is not None and v is not None:
         _draw_barbs(ax, lon, lat, u, v, barb_stride)
@@ -219,10 +228,7 @@ def plot_forecast_funnel(data, out_path, *, dpi: int = 300, title: str | None =
     ``.panels``, ``.init_time``, ``.valid_time``, ``.model_label``).  Refuses to write
     inside the repo checkout.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(out_path)
     _validate_output_dir(out.parent)
@@ -230,7 +236,8 @@ def plot_forecast_funnel(data, out_path, *, dpi: int = 300, title: str | None =
     by_key = {p.key: p for p in data.panels}
     order = ["1a", "1b", "1c", "1d"]
 
-    fig, axes = plt.subplots(2, 2, figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    axes = fig.subplots(2, 2)
     flat = axes.ravel()
     for ax, key in zip(flat, order):
         panel = by_key.get(key)
@@ -249,5 +256,4 @@ def plot_forecast_funnel(data, out_path, *, dpi: int = 300, title: str | None =
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
@@ -7,11 +7,15 @@ variables; this module standardises the actual Matplotlib rendering choices.
 
 from __future__ import annotations
 
+import logging
+import warnings
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+LOG = logging.getLogger(__name__)
+
 
 def terrain_contour_levels(values: Any) -> np.ndarray | None:
     """Return readable terrain contour levels for a wide range of domains."""
@@ -47,6 +51,176 @@ def data_contour_levels(values: Any, *, target_count: int = 12) -> np.ndarray |
     return np.linspace(low, high, target_count)
 
 
+def pixel_coarsen_factor(shape: tuple[int, ...], pixels: tuple[float, float]) -> int:
+    """Largest block size that still leaves at least one grid cell per output pixel.
+
+    ``shape`` is the field's ``(ny, nx)`` and ``pixels`` the drawn panel's
+    ``(height, width)``.  ``1`` unless the grid is at least twice as dense as the
+    panel along both axes -- below that, averaging would visibly soften the field.
+    """
+    ny, nx = shape[-2:]
+    return max(1, int(min(ny / max(pixels[0], 1.0), nx / max(pixels[1], 1.0))))
+
+
+def view_window(lon2d, lat2d, extent, pad: int = 1) -> tuple[slice, slice]:
+    """Row/column slices covering ``extent`` (``lon0, lon1, lat0, lat1``) plus ``pad`` cells.
+
+    The full grid is returned when nothing falls inside, so a mis-set extent still
+    draws something rather than an empty mesh.
+    """
+    inside = ((lon2d >= extent[0]) & (lon2d <= extent[1])
+              & (lat2d >= extent[2]) & (lat2d <= extent[3]))
+    rows = np.flatnonzero(inside.any(axis=1))
+    cols = np.flatnonzero(inside.any(axis=0))
+    if rows.size == 0 or cols.size == 0:
+        return slice(None), slice(None)
+    return (slice(max(rows[0] - pad, 0), rows[-1] + pad + 1),
+            slice(max(cols[0] - pad, 0), cols[-1] + pad + 1))
+
+
+def interp_columns(field: Any, z: Any, heights: Any, *, fill_below: bool = False) -> np.ndarray:
+    """Interpolate every column of ``field`` (sampled at heights ``z``) onto ``heights``.
+
+    ``z`` is ``(nz, n)`` and ``field`` either ``(nz, n)`` or a stack ``(m, nz, n)`` of
+    fields on those heights; the result is ``(heights.size, n)`` (or ``(m, ...)``).
+    Each column matches ``np.interp`` over its finite samples sorted by height: NaN
+    above the top one, and below the bottom one NaN or -- with ``fill_below`` --
+    the bottom value held down to the ground.  Columns with fewer than two finite
+    samples are all NaN.
+
+    One array pass over all columns, not a loop per column.  Sorting the heights
+    and bracketing the targets depend only on ``z``, so they are done once for a
+    whole stack; each field then only re-ranks its own finite samples.
+    """
+    f = np.asarray(field, dtype=float)
+    z = np.asarray(z, dtype=float)
+    h = np.asarray(heights, dtype=float).ravel()
+    single = f.ndim == 2
+    if single:
+        f = f[None]
+    ncol = z.shape[1]
+
+    # --- height-only work, shared by every field -------------------------------
+    zkey = np.where(np.isfinite(z), z, np.inf)  # a missing height never brackets
+    order = np.argsort(zkey, axis=0, kind="stable")
+    zs_all = np.take_along_axis(zkey, order, axis=0)
+    k_all = (zs_all[None, :, :] <= h[:, None, None]).sum(axis=1)  # (nh, n)
+
+    z_ok = np.isfinite(zs_all)
+    z_count = z_ok.sum(axis=0)
+
+    out = np.empty((f.shape[0], h.size, ncol))
+    cols = np.arange(ncol)
+    hv = h[:, None]
+    for j, fj in enumerate(f):
+        fs_all = np.take_along_axis(fj, order, axis=0)
+        valid = z_ok & np.isfinite(fs_all)
+        if np.array_equal(valid, z_ok):
+            # The usual case: the field is finite wherever there is a height, so
+            # the valid samples are already first and in order -- no re-rank.
+            k, count, zs, fs = k_all, z_count, zs_all, fs_all
+        else:
+            # Samples at/below each target that are valid for this field.
+            below = np.cumsum(valid, axis=0)
+            k = np.where(k_all > 0, below[np.maximum(k_all - 1, 0), cols], 0)
+            count = below[-1]
+            # Valid samples first, still in height order.
+            rank = np.argsort(~valid, axis=0, kind="stable")
+            zs = np.take_along_axis(zs_all, rank, axis=0)
+            fs = np.take_along_axis(fs_all, rank, axis=0)
+
+        top = np.maximum(count - 1, 0)
+        lo = np.minimum(np.maximum(k - 1, 0), top)
+        hi = np.minimum(k, top)
+        z_lo, z_hi = zs[lo, cols], zs[hi, cols]
+        f_lo, f_hi = fs[lo, cols], fs[hi, cols]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            res = np.where(z_hi > z_lo, f_lo + (hv - z_lo) / (z_hi - z_lo) * (f_hi - f_lo),
+                           f_lo)
+        res[np.broadcast_to(hv, res.shape) > zs[top, cols]] = np.nan
+        res[k == 0] = np.nan
+        if fill_below:
+            res = np.where(k == 0, fs[0], res)
+        res[:, count < 2] = np.nan
+        out[j] = res
+    return out[0] if single else out
+
+
+# Above this many contour vertices, inline label placement (which walks every path
+# for every label) costs more than the contours themselves and the labels crowd.
+CLABEL_MAX_VERTICES = 20_000
+
+
+def contour_vertex_count(cs) -> int:
+    """Total path vertices in a ``ContourSet`` (matplotlib 3.7 and 3.8+ layouts)."""
+    try:
+        paths = cs.get_paths()
+    except AttributeError:  # matplotlib < 3.8: one collection per level
+        paths = [p for coll in cs.collections for p in coll.get_paths()]
+    return sum(len(p.vertices) for p in paths)
+
+
+def clabel_if_sparse(ax, cs, *args, max_vertices: int = CLABEL_MAX_VERTICES,
+                     **kwargs) -> bool:
+    """``ax.clabel(cs, ...)`` unless the contours carry more than ``max_vertices``.
+
+    Returns whether labels were drawn; a dense field keeps its lines unlabelled,
+    and the skip is logged so a figure missing its labels can be traced.
+    """
+    n_vertices = contour_vertex_count(cs)
+    if n_vertices > max_vertices:
+        LOG.info("Skipping contour labels: %d vertices > %d", n_vertices, max_vertices)
+        return False
+    ax.clabel(cs, *args, **kwargs)
+    return True
+
+
+def clabel_for(ax, cs, label_contours: bool | str, *args, **kwargs) -> bool:
+    """Label ``cs`` as a renderer's ``label_contours`` argument asks.
+
+    ``True`` always labels (the publication look), ``False`` never does, and
+    ``"sparse"`` -- for batch and sweep runs -- goes through
+    :func:`clabel_if_sparse`.  Returns whether labels were drawn.
+    """
+    if label_contours == "sparse":
+        return clabel_if_sparse(ax, cs, *args, **kwargs)
+    if label_contours not in (True, False):
+        raise ValueError(
+            f"label_contours must be True, False or 'sparse', got {label_contours!r}")
+    if label_contours:
+        ax.clabel(cs, *args, **kwargs)
+    return bool(label_contours)
+
+
+def fill_array(values: Any) -> np.ndarray:
+    """``values`` as float32, the precision the shaded fills here are drawn in.
+
+    A colour fill resolves a few hundred levels at most, far inside float32, while
+    GRIB decodes arrive as float64; the cast halves what the coarsening and the
+    mesh carry.  A float32 input (wrfout) is returned without a copy.
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+def block_mean(values: Any, factor: int) -> np.ndarray:
+    """NaN-aware ``factor`` x ``factor`` block mean over the last two axes (edges trimmed).
+
+    Floating input keeps its precision (a float32 field stays float32); anything
+    else is promoted to float64.
+    """
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(float)
+    if factor <= 1:
+        return arr
+    ny, nx = arr.shape[-2] // factor * factor, arr.shape[-1] // factor * factor
+    arr = arr[..., :ny, :nx]
+    blocks = arr.reshape(*arr.shape[:-2], ny // factor, factor, nx // factor, factor)
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN blocks stay NaN
+        return np.nanmean(blocks, axis=(-3, -1))
+
+
 def plot_grid_field(
     lon: Any,
     lat: Any,
@@ -76,17 +250,15 @@ def plot_grid_field(
     dpi: int = 150,
 ) -> Path:
     """Render a lat-lon pcolormesh field with optional contours and vectors."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     lon = np.asarray(lon)
     lat = np.asarray(lat)
     field = np.asarray(field)
     out = Path(out_path)
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(
         lon,
         lat,
@@ -161,7 +333,6 @@ def plot_grid_field(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
@@ -186,18 +357,17 @@ def plot_vertical_section(
     dpi: int = 150,
 ) -> Path:
     """Render a vertical cross-section from precomputed distance/height arrays."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     distance = np.asarray(distance_km)
     height = np.asarray(height_m)
     values = np.asarray(field)
     out = Path(out_path)
 
-    x_grid = np.tile(distance, (values.shape[0], 1))
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    # a read-only view: the mesh only reads it, so no (nz, n) copy is made
+    x_grid = np.broadcast_to(distance, values.shape)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(x_grid, height, values, shading="nearest", cmap=cmap, alpha=alpha)
     fig.colorbar(mesh, ax=ax, shrink=0.85, label=colorbar_label)
 
@@ -251,5 +421,4 @@ def plot_vertical_section(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
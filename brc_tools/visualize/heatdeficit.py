@@ -61,13 +61,11 @@ def plot_heatdeficit_field(
     dpi: int = 300,
 ) -> Path:
     """Render a single-case heat-deficit field (MJ m^-2) as a sequential map."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     out = Path(out_path)
-    fig, ax = plt.subplots(figsize=(7.2, 6.4), constrained_layout=True)
+    fig = Figure(figsize=(7.2, 6.4), layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(lon, lat, np.asarray(field_mj), shading="auto",
                          cmap=style.cmap, vmin=style.vmin, vmax=style.vmax)
     _decorate(ax, lon, lat, crest_terrain=crest_terrain, crest_m=crest_m,
@@ -77,7 +75,6 @@ def plot_heatdeficit_field(
     _annotate(ax, annotation)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
@@ -102,10 +99,7 @@ def plot_heatdeficit_difference(
     ``limit`` fixes the symmetric colour magnitude (MJ m^-2) for cross-hour comparability;
     when ``None`` it is taken adaptively from the robust 99th percentile of the difference.
     """
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     from brc_tools.visualize.style import symmetric_limit
 
@@ -113,7 +107,8 @@ def plot_heatdeficit_difference(
     diff = np.asarray(field_a_mj) - np.asarray(field_b_mj)
     lim = abs(limit) if limit is not None else symmetric_limit(diff)
     lim = lim or 1.0
-    fig, ax = plt.subplots(figsize=(7.2, 6.4), constrained_layout=True)
+    fig = Figure(figsize=(7.2, 6.4), layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(lon, lat, diff, shading="auto", cmap="RdBu_r", vmin=-lim, vmax=lim)
     _decorate(ax, lon, lat, crest_terrain=crest_terrain, crest_m=crest_m,
               waypoints=waypoints, overlays=overlays)
@@ -123,5 +118,4 @@ def plot_heatdeficit_difference(
     _annotate(ax, annotation)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
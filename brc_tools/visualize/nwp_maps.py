@@ -23,8 +23,15 @@ from pathlib import Path
 import numpy as np
 
 from brc_tools.visualize.basemap import add_reference_overlays, draw_waypoints
-from brc_tools.visualize.grid import terrain_contour_levels
-from brc_tools.visualize.style import get_style
+from brc_tools.visualize.grid import (
+    block_mean,
+    fill_array,
+    interp_columns,
+    pixel_coarsen_factor,
+    terrain_contour_levels,
+    view_window,
+)
+from brc_tools.visualize.style import get_style, save_figure
 
 _KT = 1.94384  # m/s -> knots
 _ACCENT = "#c62828"
@@ -37,11 +44,11 @@ def _lon180(lon) -> np.ndarray:
     return np.where(lon > 180.0, lon - 360.0, lon)
 
 
-def _sel(ds, name, time_index):
+def _sel(ds, name, time_index, dtype=float):
     da = ds[name]
     if "time" in da.dims:
         da = da.isel(time=time_index)
-    return np.asarray(da.values, dtype=float)
+    return np.asarray(da.values, dtype=dtype)
 
 
 def _annotate(ax, text):
@@ -76,6 +83,7 @@ def plot_nwp_surface_map(
     annotation: str | None = None,
     figsize: tuple[float, float] = (9.0, 7.6),
     dpi: int = 150,
+    coarsen: int | None = None,
 ) -> Path:
     """Render a plan-view NWP field with wind barbs, terrain, overlays, and towns.
 
@@ -84,14 +92,22 @@ def plot_nwp_surface_map(
     ``overlays`` is a ``{layer: bool}`` map passed to
     :func:`~brc_tools.visualize.basemap.add_reference_overlays` (default: all,
     incl. counties).
+
+    ``coarsen`` block-averages the shaded field before drawing. The default
+    (``None``) picks the factor from the output size so the mesh never carries
+    more than about one cell per pixel -- a no-op for basin grids, a large saving
+    for a CONUS grid on a page-sized map. Pass ``1`` to always draw native cells.
     """
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     lon2d = _lon180(ds["longitude"].values)
     lat2d = np.asarray(ds["latitude"].values, dtype=float)
-    fld = _sel(ds, field, time_index)
+    # Everything outside the view is clipped away at draw time anyway; cut the
+    # grid down first so the mesh, contours and barbs only carry visible cells.
+    win = (view_window(lon2d, lat2d, extent) if extent is not None
+           else (slice(None), slice(None)))
+    lon2d, lat2d = lon2d[win], lat2d[win]
+    fld = fill_array(_sel(ds, field, time_index, None)[win])  # float32 shading
 
     st = style if style is not None else _safe_style(field)
     cmap = cmap or (st.cmap if st else "viridis")
@@ -118,22 +134,30 @@ def plot_nwp_surface_map(
             ticks = [t for t in ticks if vmin <= t <= vmax]
         vmin = vmax = None
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
-    mesh = ax.pcolormesh(lon2d, lat2d, fld, cmap=cmap, vmin=vmin, vmax=vmax,
-                         norm=norm, shading="auto")
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.add_subplot()
+    if coarsen is None:
+        coarsen = pixel_coarsen_factor(fld.shape, (figsize[1] * dpi, figsize[0] * dpi))
+    lon_c, lat_c = block_mean(lon2d, coarsen), block_mean(lat2d, coarsen)
+    mesh = ax.pcolormesh(lon_c, lat_c, block_mean(fld, coarsen), cmap=cmap,
+                         vmin=vmin, vmax=vmax, norm=norm, shading="auto",
+                         rasterized=True)
     fig.colorbar(mesh, ax=ax, shrink=0.85, extend=(st.extend if st else "neither"),
                  label=label, ticks=ticks)
 
     if terrain_contours and terrain_var and terrain_var in ds:
-        terr = _sel(ds, terrain_var, time_index)
+        terr = _sel(ds, terrain_var, time_index)[win]
         levels = terrain_contour_levels(terr)
         if levels is not None:
-            ax.contour(lon2d, lat2d, terr, levels=levels, colors="0.35",
-                       linewidths=0.3, alpha=0.5, zorder=1.5)
+            # Traced on the fill's pixel-scale grid: finer cells than the panel
+            # has pixels only add marching-squares work and sub-pixel wiggles.
+            ax.contour(lon_c, lat_c, block_mean(terr, coarsen), levels=levels,
+                       colors="0.35", linewidths=0.3, alpha=0.5, zorder=1.5,
+                       rasterized=True)
 
     if wind_barbs and wind and wind[0] in ds and wind[1] in ds:
-        u = _sel(ds, wind[0], time_index) * _KT
-        v = _sel(ds, wind[1], time_index) * _KT
+        u = _sel(ds, wind[0], time_index)[win] * _KT
+        v = _sel(ds, wind[1], time_index)[win] * _KT
         s = barb_stride
         ax.barbs(lon2d[::s, ::s], lat2d[::s, ::s], u[::s, ::s], v[::s, ::s],
                  length=5.0, linewidth=0.4, zorder=4)
@@ -153,11 +177,22 @@ def plot_nwp_surface_map(
         ax.set_title(title)
     _annotate(ax, annotation)
 
+    return _save(fig, out_path, dpi)
+
+
+def _save(fig, out_path, dpi) -> Path:
+    """Write ``fig`` to ``out_path``.
+
+    Both renderers build a bare :class:`~matplotlib.figure.Figure` rather than going
+    through pyplot: a sweep writes hundreds of these, and a pyplot figure is
+    registered with the global figure manager (and pulls in the session's backend)
+    only to be closed again.  The gridded artists are drawn rasterized, so a
+    PDF/SVG carries one image per field instead of a path per cell or contour band.
+    Both figures are laid out by the constrained engine, so :func:`save_figure`
+    skips the tight-bbox pass and writes PNGs at a lighter zlib level."""
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
-    return out
+    return save_figure(fig, out, dpi=dpi)
 
 
 def _safe_style(field):
@@ -209,12 +244,20 @@ def _geo_locator_inset(ax, section, locator):
     lon2d = _lon180(locator["lon2d"])
     lat2d = np.asarray(locator["lat2d"], dtype=float)
     terr2d = np.asarray(locator["terrain2d"], dtype=float)
-    extent = locator.get("extent") or (
-        float(lon2d.min()), float(lon2d.max()), float(lat2d.min()), float(lat2d.max()))
+    extent = locator.get("extent")
+    if extent is None:
+        extent = (float(lon2d.min()), float(lon2d.max()),
+                  float(lat2d.min()), float(lat2d.max()))
+    else:
+        # Callers hand over the whole model grid; the inset only ever shows the
+        # extent, so mesh just that block instead of clipping a full-domain mesh.
+        win = view_window(lon2d, lat2d, extent)
+        lon2d, lat2d, terr2d = lon2d[win], lat2d[win], terr2d[win]
     # A tall/narrow transect (e.g. S->N) wants a different inset box than a wide one,
     # so the caller may override the default top-right placement.
     axins = ax.inset_axes(locator.get("rect") or [0.66, 0.60, 0.34, 0.40])
-    axins.contourf(lon2d, lat2d, terr2d, levels=12, cmap="terrain", alpha=0.85, zorder=0)
+    axins.pcolormesh(lon2d, lat2d, terr2d, cmap="terrain", shading="auto", alpha=0.85,
+                     zorder=0, rasterized=True)
     add_reference_overlays(axins, extent,
                            layers={"states": True, "counties": True, "roads": False,
                                    "rivers": True, "lakes": True})
@@ -243,25 +286,13 @@ def _geo_locator_inset(ax, section, locator):
 def _interp_to_heights(section, field2d, heights, *, fill_to_ground=True):
     """Interpolate each column of ``field2d`` (on ``section.height2d``) onto a common
     regular ``heights`` axis, turning coarse isobaric levels into a smooth curtain.
+    ``field2d`` may be a ``(m, nz, n)`` stack of curtains on the same heights.
 
     Over high terrain the lowest above-ground isobaric level can sit a few hundred
     metres up; with ``fill_to_ground`` the column is held at that lowest valid value
     down to the surface (the usual "fill to ground" choice for isobaric curtains --
     the true 10 m wind lives on the plan-view map), else it stays NaN below it."""
-    z = np.asarray(section.height2d, dtype=float)
-    f = np.asarray(field2d, dtype=float)
-    n = z.shape[1]
-    out = np.full((heights.size, n), np.nan)
-    for i in range(n):
-        zc, fc = z[:, i], f[:, i]
-        m = np.isfinite(zc) & np.isfinite(fc)
-        if m.sum() >= 2:
-            order = np.argsort(zc[m])
-            zz, ff = zc[m][order], fc[m][order]
-            out[:, i] = np.interp(heights, zz, ff,
-                                  left=(ff[0] if fill_to_ground else np.nan),
-                                  right=np.nan)
-    return out
+    return interp_columns(field2d, section.height2d, heights, fill_below=fill_to_ground)
 
 
 def _smooth1d(a, window=3):
@@ -315,9 +346,7 @@ def plot_nwp_section(
     sensible default is the plot's own aspect ratio (transect length / ``y_top_m``),
     so a deep section wants a much smaller value than a shallow one.
     """
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     if shade not in _SECTION_SHADE:
         raise ValueError(f"shade must be one of {sorted(_SECTION_SHADE)}, got {shade!r}")
@@ -333,18 +362,20 @@ def plot_nwp_section(
     y_bottom = _terrain_floor(terrain)
 
     heights = np.arange(y_bottom, y_top_m + dz_m, dz_m)
-    shaded = _interp_to_heights(section, shade_arr, heights)
-    theta = _interp_to_heights(section, section.theta2d, heights)
-    along = _interp_to_heights(section, section.along2d, heights)
-    w = _interp_to_heights(section, section.w2d, heights)
+    # One stacked call: the four curtains share the section's heights, so the
+    # height sort and target bracketing are done once for all of them.
+    shaded, theta, along, w = _interp_to_heights(
+        section, np.stack([shade_arr, section.theta2d, section.along2d, section.w2d]),
+        heights)
     below = heights[:, None] < terr_disp[None, :]
     for a in (shaded, theta, along, w):
         a[below] = np.nan
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.add_subplot()
     ax.set_facecolor("0.6")  # below-ground / below-lowest-level cells read as terrain
     mesh = ax.pcolormesh(dist, heights, shaded, cmap=st.cmap, vmin=st.vmin, vmax=st.vmax,
-                         shading="gouraud")
+                         shading="gouraud", rasterized=True)
     fig.colorbar(mesh, ax=ax, shrink=0.85, extend=st.extend, label=st.label)
 
     if theta_contours:
@@ -352,13 +383,12 @@ def plot_nwp_section(
         hi = np.ceil(np.nanmax(theta) / theta_interval) * theta_interval
         levels = np.arange(lo, hi + 0.1, theta_interval)
         cs = ax.contour(dist, heights, theta, levels=levels, colors="black",
-                        linewidths=0.4, alpha=0.5)
+                        linewidths=0.4, alpha=0.5, rasterized=True)
         ax.clabel(cs, cs.levels[::2], fontsize=6, fmt="%.0f")
 
     # in-plane wind: along-transect + exaggerated vertical, on the regular grid
     sz, sx = quiver_stride
-    dd, hh = np.meshgrid(dist, heights)
-    q = ax.quiver(dd[::sz, ::sx], hh[::sz, ::sx], along[::sz, ::sx],
+    q = ax.quiver(dist[::sx], heights[::sz], along[::sz, ::sx],
                   w[::sz, ::sx] * w_exaggeration, color="black", width=0.0016,
                   alpha=0.85, zorder=8)
     ax.quiverkey(q, 0.86, 1.02, 10.0, rf"10 m s$^{{-1}}$ along, $w\times${int(w_exaggeration)}",
@@ -383,8 +413,4 @@ def plot_nwp_section(
         _geo_locator_inset(ax, section, locator)
     _annotate(ax, annotation)
 
-    out = Path(out_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
-    return out
+    return _save(fig, out_path, dpi)
@@ -8,7 +8,10 @@ colour scale as the NWP fill.
 from __future__ import annotations
 
 import datetime
+import functools
+import os
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
@@ -17,12 +20,20 @@ import matplotlib.pyplot as plt
 import numpy as np
 import polars as pl
 
+from brc_tools.utils.memo import ArrayMemo
+from brc_tools.visualize.grid import clabel_for, fill_array
+
 # ---------------------------------------------------------------------------
 # Map helpers (extracted from case_study_20250222.py)
 # ---------------------------------------------------------------------------
 
 KT_FACTOR = 1.94384  # m/s -> knots
 
+# The one lon/lat CRS every map here is drawn in and every overlay is placed
+# with.  CRS objects are immutable, so a single instance serves every figure of a
+# sweep instead of a fresh PROJ definition per axes, artist and feature.
+_PLATE_CARREE = ccrs.PlateCarree()
+
 
 def _lon_to_180(lon):
     """Convert longitude from 0..360 to -180..180."""
@@ -36,6 +47,99 @@ def _get_latlon(ds):
     return lat, lon
 
 
+@functools.cache
+def _ne_feature(category, name, resolution):
+    """One ``NaturalEarthFeature`` per layer and scale for the whole process."""
+    return cfeature.NaturalEarthFeature(category, name, resolution)
+
+
+@functools.lru_cache(maxsize=32)
+def _clipped_feature(category, name, resolution, extent):
+    """Natural-Earth geometries intersecting ``extent``, read and clipped once.
+
+    ``NaturalEarthFeature`` re-runs its bbox intersection over the whole layer on
+    every draw; a figure series over one grid asks for the same layer and extent
+    every time, so the intersecting subset is kept per process and handed back as
+    a ``ShapelyFeature``.  ``extent`` is a hashable ``(lon0, lon1, lat0, lat1)``.
+    """
+    geoms = tuple(_ne_feature(category, name, resolution).intersecting_geometries(extent))
+    return cfeature.ShapelyFeature(geoms, _PLATE_CARREE)
+
+
+@functools.lru_cache(maxsize=8)
+def _lonlat_transformer(proj):
+    """PROJ transformer from lon/lat degrees to ``proj``, built once per CRS."""
+    from pyproj import Transformer
+
+    return Transformer.from_crs(_PLATE_CARREE, proj, always_xy=True)
+
+
+# Grids at least this large are split across threads: PROJ releases the GIL
+# inside each batch, so the chunks run in parallel.
+_THREADED_POINTS = 1_000_000
+
+
+def _transform_lonlat(proj, lon, lat):
+    """``lon``/``lat`` as x/y in ``proj``, same shape, transformed in place on copies.
+
+    Unlike ``transform_points`` this skips the zero z plane and the ``(n, 3)``
+    result, and keeps the grid's shape (1-D regular-grid axes come back meshed).
+    """
+    transformer = _lonlat_transformer(proj)
+    lon, lat = _lonlat_2d(lon, lat)
+    x = np.array(lon, dtype=float)
+    y = np.array(lat, dtype=float)
+    workers = min(os.cpu_count() or 1, 8)
+    if x.size < _THREADED_POINTS or workers == 1:
+        transformer.transform(x, y, inplace=True)
+        return x, y
+    xs = np.array_split(x.reshape(-1), workers)
+    ys = np.array_split(y.reshape(-1), workers)
+    with ThreadPoolExecutor(workers) as pool:
+        list(pool.map(lambda xy: transformer.transform(*xy, inplace=True),
+                      zip(xs, ys, strict=True)))
+    return x, y
+
+
+# Panels of an evolution figure and successive quicklooks of one run share a
+# grid: the last projected x/y is kept per (projection, lon, lat).
+_projections = ArrayMemo()
+
+
+def _lonlat_2d(lon, lat):
+    """``lon``/``lat`` as a 2-D ``(ny, nx)`` pair; 1-D regular-grid axes are meshed."""
+    lon, lat = np.asarray(lon), np.asarray(lat)
+    if lon.ndim == 1 and lat.ndim == 1:
+        lon, lat = np.meshgrid(lon, lat)
+    return lon, lat
+
+
+def _project_grid(ax, lon, lat):
+    """2-D lon/lat grid as x/y in ``ax``'s own projection (one PROJ pass).
+
+    1-D ``lon``/``lat`` (a regular grid) are meshed first, so x/y match the field.
+    """
+    lon, lat = _lonlat_2d(lon, lat)
+    proj = ax.projection
+    return _projections.get(proj, lambda: _transform_lonlat(proj, lon, lat),
+                            arrays=(lon, lat))
+
+
+def _data_extent(lon, lat):
+    """Hashable ``(lon0, lon1, lat0, lat1)`` of a grid, rounded for cache reuse."""
+    return (round(float(np.nanmin(lon)), 4), round(float(np.nanmax(lon)), 4),
+            round(float(np.nanmin(lat)), 4), round(float(np.nanmax(lat)), 4))
+
+
+def _ne_scale(extent):
+    """Natural-Earth scale for a map span: 50m once the view covers several states."""
+    if extent is None:
+        return "10m"
+    span = max(abs(float(extent[1]) - float(extent[0])),
+               abs(float(extent[3]) - float(extent[2])))
+    return "50m" if span >= 12.0 else "10m"
+
+
 def add_map_features(
     ax,
     *,
@@ -45,7 +149,8 @@ def add_map_features(
     roads=False,
     terrain=None,
     terrain_lonlat=None,
-    resolution="10m",
+    resolution=None,
+    extent=None,
 ):
     """Add cartopy basemap features to an axes.
 
@@ -54,25 +159,47 @@ def add_map_features(
     styling and are wrapped so a missing Natural-Earth shapefile (e.g. an offline
     compute node without a pre-populated ``CARTOPY_DATA_DIR``) degrades gracefully
     instead of raising.
+
+    ``extent`` (``(lon0, lon1, lat0, lat1)``), when given, draws each layer from
+    a per-process cache of the geometries inside it, so repeated panels over the
+    same domain skip the shapefile intersection.
+
+    ``resolution`` defaults to ``"10m"`` for basin-scale views and ``"50m"`` once
+    ``extent`` spans a region or CONUS, where 10m detail is sub-pixel but still
+    costs a full reprojection.  Counties and roads are only published at 10m.
     """
+    if resolution is None:
+        resolution = _ne_scale(extent)
     if terrain is not None and terrain_lonlat is not None:
         from brc_tools.visualize.grid import terrain_contour_levels
 
         lon2d, lat2d = (np.asarray(a) for a in terrain_lonlat)
         levels = terrain_contour_levels(np.asarray(terrain))
+        # One QuadMesh rather than contourf's per-band polygons; the BoundaryNorm
+        # keeps the stepped terrain bands contourf used to give.
+        cmap = plt.get_cmap("terrain")
+        norm = (mcolors.BoundaryNorm(levels, cmap.N, extend="both")
+                if levels is not None else None)
         try:
-            ax.contourf(
-                lon2d, lat2d, np.asarray(terrain),
-                levels=levels if levels is not None else 20, cmap="terrain",
-                alpha=0.55, transform=ccrs.PlateCarree(), zorder=0,
+            # Project the terrain grid into the axes CRS up front, as plot_planview
+            # does for its fields, so the mesh is not re-projected at draw time.
+            gx, gy = _project_grid(ax, lon2d, lat2d)
+            ax.pcolormesh(
+                gx, gy, np.asarray(terrain), cmap=cmap, norm=norm,
+                shading="nearest", alpha=0.55, zorder=0,
             )
         except Exception:  # pragma: no cover - rendering fallback
             pass
 
+    key = None if extent is None else tuple(float(v) for v in extent)
+
     def _feature(category, name, res, **style):
         try:
-            ax.add_feature(cfeature.NaturalEarthFeature(
-                category, name, res, facecolor="none", **style))
+            if key is not None:
+                feature = _clipped_feature(category, name, res, key)
+            else:
+                feature = _ne_feature(category, name, res)
+            ax.add_feature(feature, facecolor="none", **style)
         except Exception:  # pragma: no cover - offline / missing shapefile
             pass
 
@@ -80,7 +207,7 @@ def add_map_features(
         _feature("cultural", "admin_1_states_provinces_lakes", resolution,
                  edgecolor="black", linewidth=0.8)
     if counties:
-        _feature("cultural", "admin_2_counties", resolution,
+        _feature("cultural", "admin_2_counties", "10m",
                  edgecolor="0.5", linewidth=0.4, alpha=0.7)
     if rivers:
         _feature("physical", "rivers_lake_centerlines", resolution,
@@ -99,7 +226,7 @@ def add_waypoints(ax, waypoints, *, transform=None, fontsize=7, annotate=True):
         ``{name: {"lat": ..., "lon": ...}}`` mapping.
     """
     if transform is None:
-        transform = ccrs.PlateCarree()
+        transform = _PLATE_CARREE
     for name, wp in waypoints.items():
         ax.plot(
             wp["lon"], wp["lat"], "k^", markersize=5,
@@ -132,6 +259,7 @@ def plot_planview(
     contour_var: str | None = None,
     contour_levels: np.ndarray | None = None,
     contour_colors: str = "black",
+    label_contours: bool | str = True,
     wind_barbs: bool = False,
     barb_skip: int = 5,
     waypoints: dict | None = None,
@@ -140,6 +268,7 @@ def plot_planview(
     obs_marker_size: float = 80,
     obs_annotate_values: bool = True,
     title: str | None = None,
+    coarsen: int = 1,
 ) -> plt.Axes:
     """Render a single plan-view time step.
 
@@ -160,6 +289,10 @@ def plot_planview(
         Variable to overlay as contour lines (e.g. ``"mslp"``).
     contour_levels : array, optional
         Contour levels.
+    label_contours : bool or ``"sparse"``
+        Label every other contour level.  Label placement walks every contour
+        segment, so pass *False* for thumbnails too small to read them, and
+        ``"sparse"`` in batch runs to skip the labels only on dense contour sets.
     wind_barbs : bool
         If *True*, overlay wind barbs from ``wind_u_10m`` / ``wind_v_10m``.
     barb_skip : int
@@ -179,45 +312,60 @@ def plot_planview(
         If *True*, annotate each station marker with the observed value.
     title : str, optional
         Axes title.
+    coarsen : int
+        Block-average the grid by this factor in each direction before drawing
+        (``1`` = native).  An overview panel a few hundred pixels wide cannot
+        resolve a 3 km grid, and every cell is a projected quad; ``barb_skip``
+        then counts coarsened points.
 
     Returns
     -------
     ax : matplotlib Axes
     """
-    # Select time slice
-    ds_t = _select_time(ds, time_idx, valid_time)
+    # Select time slice, carrying only the variables this panel draws so the
+    # slice/coarsen below never touches the rest of a many-field dataset
+    needed = [variable, contour_var]
+    if wind_barbs:
+        needed += ["wind_u_10m", "wind_v_10m"]
+    ds = ds[[v for v in dict.fromkeys(needed) if v is not None and v in ds.data_vars]]
+    ds_t = _coarsen_grid(_select_time(ds, time_idx, valid_time), coarsen, variable)
 
     lat, lon = _get_latlon(ds_t)
-    field = ds_t[variable].values
+    field = fill_array(ds_t[variable].values)  # float32 shading
 
     # Create axes if needed
     if ax is None:
         fig, ax = plt.subplots(
             figsize=(10, 8),
-            subplot_kw={"projection": ccrs.PlateCarree()},
+            subplot_kw={"projection": _PLATE_CARREE},
+            layout="constrained",
         )
 
-    transform = ccrs.PlateCarree()
+    transform = _PLATE_CARREE
     norm = mcolors.Normalize(vmin=vmin, vmax=vmax)
+    # Fill and contours share one grid: project it into the axes CRS once here
+    # instead of letting each artist re-project it through transform=.
+    gx, gy = _project_grid(ax, lon, lat)
 
     # Main fill
+    # Rasterized: a PDF/SVG carries the field as one image, while the borders,
+    # barbs and labels drawn over it stay vector.
     cf = ax.pcolormesh(
-        lon, lat, field,
+        gx, gy, field,
         cmap=cmap, norm=norm,
-        shading="nearest", transform=transform,
+        shading="nearest", rasterized=True,
     )
 
     # Contour overlay
     if contour_var is not None and contour_var in ds_t.data_vars:
-        cfield = ds_t[contour_var].values
+        cfield = ds_t[contour_var].values.astype(np.float32, copy=False)
         try:
             cs = ax.contour(
-                lon, lat, cfield,
+                gx, gy, cfield,
                 levels=contour_levels,
                 colors=contour_colors, linewidths=0.6,
-                transform=transform,
             )
-            ax.clabel(cs, fontsize=6, fmt="%.0f")
+            clabel_for(ax, cs, label_contours, cs.levels[::2], fontsize=6, fmt="%.0f")
         except Exception:
             pass
 
@@ -233,7 +381,7 @@ def plot_planview(
         )
 
     # Map features
-    add_map_features(ax)
+    add_map_features(ax, extent=_data_extent(lon, lat))
 
     # Waypoints
     if waypoints is not None:
@@ -314,21 +462,25 @@ def plot_planview_evolution(
     if figsize is None:
         figsize = (5.5 * ncols, 4.5 * nrows)
 
+    # Constrained layout is solved inside the final draw; ``tight_layout`` would
+    # force an extra full Cartopy render just to measure the text.
     fig, axes = plt.subplots(
         nrows, ncols, figsize=figsize,
-        subplot_kw={"projection": ccrs.PlateCarree()},
-        squeeze=False,
+        subplot_kw={"projection": _PLATE_CARREE},
+        squeeze=False, layout="constrained",
     )
     axes_flat = axes.flatten()
 
     # Compute shared vmin/vmax if not provided
     if shared_colorbar:
-        if "vmin" not in planview_kwargs or planview_kwargs.get("vmin") is None:
-            all_vals = ds[variable].values
-            planview_kwargs["vmin"] = float(np.nanpercentile(all_vals, 2))
-        if "vmax" not in planview_kwargs or planview_kwargs.get("vmax") is None:
-            all_vals = ds[variable].values
-            planview_kwargs["vmax"] = float(np.nanpercentile(all_vals, 98))
+        missing = [k for k in ("vmin", "vmax") if planview_kwargs.get(k) is None]
+        if missing:
+            # Both bounds from one percentile call: a single NaN-stripped copy and
+            # partition of the whole (time, y, x) field instead of one per bound.
+            lo, hi = np.nanpercentile(ds[variable].values, [2, 98])
+            bounds = {"vmin": float(lo), "vmax": float(hi)}
+            for k in missing:
+                planview_kwargs[k] = bounds[k]
 
     for panel_idx, t_idx in enumerate(time_indices):
         ax = axes_flat[panel_idx]
@@ -348,9 +500,8 @@ def plot_planview_evolution(
         axes_flat[j].set_visible(False)
 
     if suptitle:
-        fig.suptitle(suptitle, fontsize=13, y=1.01)
+        fig.suptitle(suptitle, fontsize=13)
 
-    fig.tight_layout()
     return fig
 
 
@@ -358,6 +509,18 @@ def plot_planview_evolution(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _coarsen_grid(ds, factor, variable):
+    """Block-mean ``ds`` by ``factor`` on the grid dims of ``variable``.
+
+    The dims come from the field, not the coordinates: on a regular grid
+    ``latitude``/``longitude`` are 1-D, each coarsened along its own dim.
+    """
+    if factor <= 1:
+        return ds
+    y_dim, x_dim = ds[variable].dims[-2:]
+    return ds.coarsen({y_dim: factor, x_dim: factor}, boundary="trim").mean()
+
+
 def _select_time(ds, time_idx, valid_time):
     """Return a single-time slice of the dataset."""
     if valid_time is not None:
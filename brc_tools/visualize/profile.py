@@ -240,17 +240,21 @@ def _draw_parcel(skew, model: Sounding, parcel: str, *, mark_levels: bool, shade
     except Exception:  # noqa: BLE001 - any MetPy failure here is non-fatal
         return
 
-    p = model.pressure_hpa * units.hPa
-    skew.plot(p, prof_c * units.degC, "0.25", lw=1.2, ls=":", label=f"{parcel} parcel")
+    skew.plot(model.pressure_hpa, prof_c, "0.25", lw=1.2, ls=":",
+              label=f"{parcel} parcel")
 
     if shade_cape:
+        # MetPy's shading finds the parcel/environment crossings itself and
+        # needs the units for that; the plain line above does not.
+        p = model.pressure_hpa * units.hPa
+        prof = prof_c * units.degC
+        temp = model.temperature_c * units.degC
         try:
-            skew.shade_cape(p, model.temperature_c * units.degC, prof_c * units.degC,
-                            alpha=0.2, color="tab:red")
+            skew.shade_cape(p, temp, prof, alpha=0.2, color="tab:red")
             # Passing dewpoint makes MetPy exclude negative area below the LCL and
             # ABOVE THE EL. Without it the whole stable stratosphere above the EL
             # shades blue and reads as inhibition, which it is not.
-            skew.shade_cin(p, model.temperature_c * units.degC, prof_c * units.degC,
+            skew.shade_cin(p, temp, prof,
                            dewpoint=model.dewpoint_c * units.degC,
                            alpha=0.2, color="tab:blue")
         except Exception:  # noqa: BLE001
@@ -311,23 +315,26 @@ def plot_skewt(
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt
     from metpy.plots import SkewT
-    from metpy.units import units
 
     out = Path(out_path)
     fig = plt.figure(figsize=figsize)
     skew = SkewT(fig, rotation=45)
 
-    p = model.pressure_hpa * units.hPa
-    skew.plot(p, model.temperature_c * units.degC, "tab:red", lw=1.6, label=f"{model.source} T")
-    skew.plot(p, model.dewpoint_c * units.degC, "tab:green", lw=1.6, label=f"{model.source} Td")
+    # The skew-T axes are already hPa / degC, which is what a Sounding holds, so
+    # the traces go in as plain arrays: wrapping them in pint only to have the
+    # axis convert them straight back costs a unit dispatch per call.
+    p = np.asarray(model.pressure_hpa, dtype=float)
+    skew.plot(p, model.temperature_c, "tab:red", lw=1.6, label=f"{model.source} T")
+    skew.plot(p, model.dewpoint_c, "tab:green", lw=1.6, label=f"{model.source} Td")
     if model.u_kt is not None and model.v_kt is not None:
         idx = slice(None, None, max(1, len(model.pressure_hpa) // 30))
-        skew.plot_barbs(p[idx], (model.u_kt * units.knots)[idx], (model.v_kt * units.knots)[idx])
+        skew.plot_barbs(p[idx], np.asarray(model.u_kt)[idx],
+                        np.asarray(model.v_kt)[idx])
 
     if obs is not None:
-        po = obs.pressure_hpa * units.hPa
-        skew.plot(po, obs.temperature_c * units.degC, "k", lw=1.4, ls="--", label=f"{obs.source} T")
-        skew.plot(po, obs.dewpoint_c * units.degC, "0.4", lw=1.4, ls="--", label=f"{obs.source} Td")
+        po = np.asarray(obs.pressure_hpa, dtype=float)
+        skew.plot(po, obs.temperature_c, "k", lw=1.4, ls="--", label=f"{obs.source} T")
+        skew.plot(po, obs.dewpoint_c, "0.4", lw=1.4, ls="--", label=f"{obs.source} Td")
 
     if parcel is not None:
         _draw_parcel(skew, model, parcel, mark_levels=mark_levels, shade_cape=shade_cape)
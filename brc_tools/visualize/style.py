@@ -7,12 +7,13 @@ their own limits.
 
 Like ``grid.py`` this module keeps ``matplotlib`` a lazy import: importing the
 registry (``VAR_STYLES`` etc.) does not pull in matplotlib, only
-``use_publication_style`` does.
+``use_publication_style`` and ``save_figure`` do.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
+from pathlib import Path
 
 import numpy as np
 
@@ -369,6 +370,55 @@ def use_publication_style(*, dpi: int = 300) -> None:
     )
 
 
+# zlib level for PNG output: a few percent larger than matplotlib's default 6, and
+# several times faster to deflate at publication DPI.
+PNG_COMPRESS_LEVEL = 3
+
+
+def save_figure(fig, out_path, *, dpi) -> Path:
+    """Write a laid-out figure to ``out_path`` without a tight-bbox pass.
+
+    For figures sized by the constrained layout engine: ``bbox_inches="tight"``
+    (which ``use_publication_style`` makes the default) costs a second full draw
+    to measure a bbox the layout already fills, so it is overridden here and the
+    image comes out at exactly ``figsize * dpi``.  PNGs are deflated at
+    :data:`PNG_COMPRESS_LEVEL`.
+
+    Only for the sweep renderers (:mod:`~brc_tools.visualize.nwp_maps`).  The
+    manuscript renderers keep a plain ``fig.savefig`` so their output stays the
+    publication style's tight bbox.
+    """
+    import matplotlib
+
+    out = Path(out_path)
+    kw = {}
+    if out.suffix.lower() == ".png":
+        kw["pil_kwargs"] = {"compress_level": PNG_COMPRESS_LEVEL}
+    with matplotlib.rc_context({"savefig.bbox": "standard"}):
+        fig.savefig(out, dpi=dpi, **kw)
+    return out
+
+
+# Lossless WebP settings for archived figures: about half the size of the
+# matching PNG, with effort kept moderate so a sweep is not bound by encoding.
+WEBP_PIL_KWARGS = {"lossless": True, "quality": 50, "method": 4}
+
+
+def png_to_webp(png_path, out_path) -> Path:
+    """Re-encode a rendered PNG as lossless WebP at ``out_path``.
+
+    A post-processing step rather than a ``savefig`` format, so every renderer --
+    :func:`save_figure` or its own ``savefig`` call -- gets the same encoder
+    settings without being told.
+    """
+    from PIL import Image
+
+    out = Path(out_path)
+    with Image.open(png_path) as im:
+        im.save(out, format="WEBP", **WEBP_PIL_KWARGS)
+    return out
+
+
 def get_style(var: str) -> VarStyle:
     """Return the fixed :class:`VarStyle` for a variable key (KeyError if unknown)."""
     return VAR_STYLES[var]
@@ -36,17 +36,16 @@ def plot_domain_panels(
     and optionally ``terrain``, ``u``, ``v``.  ``extent`` (lon0, lon1, lat0, lat1)
     crops every panel to the same area for a like-for-like resolution comparison.
     """
-    import matplotlib
+    from matplotlib.figure import Figure
 
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    from brc_tools.visualize.grid import terrain_contour_levels
+    from brc_tools.visualize.basemap import add_reference_overlays, draw_waypoints
+    from brc_tools.visualize.grid import terrain_contour_levels, view_window
     from brc_tools.visualize.style import shared_range
 
     out = Path(out_path)
     n = len(panels)
-    fig, axes = plt.subplots(1, n, figsize=(4.8 * n, 5.2), constrained_layout=True)
+    fig = Figure(figsize=(4.8 * n, 5.2), layout="constrained")
+    axes = fig.subplots(1, n)
     if n == 1:
         axes = [axes]
 
@@ -59,31 +58,38 @@ def plot_domain_panels(
     for ax, p in zip(axes, panels):
         lon = np.asarray(p["lon"])
         lat = np.asarray(p["lat"])
-        field = np.asarray(p["field"])
+        # An outer domain cropped to an inner one's extent would otherwise mesh,
+        # contour and clip its whole grid; slice it to the view first.
+        win = (view_window(lon, lat, extent) if extent is not None
+               else (slice(None), slice(None)))
+        lon, lat = lon[win], lat[win]
+        field = np.asarray(p["field"])[win]
         mesh = ax.pcolormesh(lon, lat, field, shading="auto", cmap=style.cmap,
                              vmin=vmin, vmax=vmax, alpha=0.95)
         if terrain_contours and p.get("terrain") is not None:
-            levels = terrain_contour_levels(np.asarray(p["terrain"]))
+            terrain = np.asarray(p["terrain"])[win]
+            levels = terrain_contour_levels(terrain)
             if levels is not None:
-                ax.contour(lon, lat, np.asarray(p["terrain"]), levels=levels,
+                ax.contour(lon, lat, terrain, levels=levels,
                            colors="black", linewidths=0.3, alpha=0.4)
         if wind and p.get("u") is not None and p.get("v") is not None:
             u = np.asarray(p["u"])
-            v = np.asarray(p["v"])
+            # Stride and phase come from the full grid, so the crop keeps the
+            # arrow density and positions the uncropped panel had.
             sy = max(1, u.shape[0] // 22)
             sx = max(1, u.shape[1] // 22)
-            quiver = ax.quiver(lon[::sy, ::sx], lat[::sy, ::sx], u[::sy, ::sx], v[::sy, ::sx],
-                               color="black", scale=wind_scale, width=0.004, alpha=0.7)
+            thin = (slice((-(win[0].start or 0)) % sy, None, sy),
+                    slice((-(win[1].start or 0)) % sx, None, sx))
+            u = u[win][thin]
+            v = np.asarray(p["v"])[win][thin]
+            quiver = ax.quiver(lon[thin], lat[thin], u, v, color="black",
+                               scale=wind_scale, width=0.004, alpha=0.7)
         panel_extent = extent or (
             float(lon.min()), float(lon.max()), float(lat.min()), float(lat.max())
         )
         if overlays and any(overlays.values()):
-            from brc_tools.visualize.basemap import add_reference_overlays
-
             add_reference_overlays(ax, panel_extent, layers=overlays)
         if waypoints:
-            from brc_tools.visualize.basemap import draw_waypoints
-
             draw_waypoints(ax, waypoints, panel_extent, zorder=6)
         if extent is not None:
             ax.set_xlim(extent[0], extent[1])
@@ -101,7 +107,6 @@ def plot_domain_panels(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
 
 
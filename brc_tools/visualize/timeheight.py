@@ -144,17 +144,16 @@ def plot_time_height(
     that decides whether a feature is before or after sunset, which is usually
     the point of looking.
     """
-    import matplotlib
-    matplotlib.use("Agg")
     import matplotlib.dates as mdates
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     t = mdates.date2num(list(times))
     z = np.asarray(height_agl, dtype=float)
     f = np.asarray(field, dtype=float)
     T = np.broadcast_to(t[:, None], z.shape)
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     ax.set_facecolor("0.6")
     # Flat shading on the model's own cells; "gouraud" would smooth across the
     # very level spacing that makes this figure worth drawing.
@@ -205,5 +204,4 @@ def plot_time_height(
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
     return out
@@ -246,10 +246,9 @@ def plot_verification_timeseries(
 
         # Error shading: interpolate NWP to obs times for fill_between
         if show_error and len(obs_times) > 1:
-            nwp_ts = np.array([t.timestamp() if hasattr(t, "timestamp") else 0
-                               for t in nwp_times])
-            obs_ts = np.array([t.timestamp() if hasattr(t, "timestamp") else 0
-                               for t in obs_times])
+            # epoch seconds straight from the datetime columns, no per-row Python
+            nwp_ts = nwp_wp["valid_time"].dt.epoch("ms").to_numpy() / 1000.0
+            obs_ts = obs_wp["valid_time"].dt.epoch("ms").to_numpy() / 1000.0
             nwp_interp = np.interp(obs_ts, nwp_ts, nwp_vals)
             ax.fill_between(
                 obs_times, obs_vals, nwp_interp,
@@ -29,6 +29,7 @@ same.
 """
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import numpy as np
@@ -38,6 +39,8 @@ from brc_tools.visualize.basemap import add_reference_overlays, draw_waypoints
 from brc_tools.visualize.nwp_maps import _draw_section_towns, _geo_locator_inset
 from brc_tools.visualize.wrf_curtain import _edges1d, curtain_mesh
 
+LOG = logging.getLogger(__name__)
+
 __all__ = ["SOURCE_COLOURS", "UNTAGGED_COLOUR", "source_colours",
            "purity_alpha", "plot_origin_curtain", "plot_tracer_spectrum",
            "plot_origin_map"]
@@ -79,8 +82,8 @@ _ALPHA_MIN = 0.25
 def source_colours(n: int) -> list[str]:
     """``n`` distinguishable fill colours, cycling the palette if pushed past it."""
     if n > len(SOURCE_COLOURS):
-        print(f"[WARN] {n} tracer sources but only {len(SOURCE_COLOURS)} distinct "
-              "colours; two sources will share a colour")
+        LOG.warning("%d tracer sources but only %d distinct colours; two sources "
+                    "will share a colour", n, len(SOURCE_COLOURS))
     return [SOURCE_COLOURS[i % len(SOURCE_COLOURS)] for i in range(n)]
 
 
@@ -117,7 +120,8 @@ def _draw_untagged(ax, xc, yc, index, *, zorder=1.8):
     Drawn with ``contourf`` on the cell CENTRES rather than the mesh corners:
     a QuadMesh cannot carry a hatch, and the boundary of an untagged region is
     a qualitative "the plume stops here", so an outline good to half a cell is
-    the right precision for it.
+    the right precision for it.  It is a single band, so the polygon cost is
+    small; it stays vector so the hatch prints crisply over the rasterized fills.
     """
     untagged = (np.asarray(index) < 0).astype(float)
     if not untagged.any() or untagged.all():
@@ -129,7 +133,7 @@ def _draw_untagged(ax, xc, yc, index, *, zorder=1.8):
 
 
 def _categorical_layers(ax, X, Y, index, alpha, colours):
-    """Paint one masked ``pcolormesh`` per source, faded by ``alpha``.
+    """Paint one masked, rasterized ``pcolormesh`` per source, faded by ``alpha``.
 
     One mesh per source rather than a ``ListedColormap``: the per-cell opacity
     has to vary, and an alpha array is applied to the whole mappable, so the
@@ -145,7 +149,7 @@ def _categorical_layers(ax, X, Y, index, alpha, colours):
         cmap = LinearSegmentedColormap.from_list(f"src{k}", [colour, colour])
         ax.pcolormesh(X, Y, np.where(sel, 1.0, np.nan), cmap=cmap,
                       vmin=0.0, vmax=1.0, shading="flat",
-                      alpha=np.where(sel, alpha, 0.0), zorder=2)
+                      alpha=np.where(sel, alpha, 0.0), zorder=2, rasterized=True)
 
 
 def plot_origin_curtain(
@@ -205,7 +209,7 @@ def plot_origin_curtain(
     grey = LinearSegmentedColormap.from_list("untagged",
                                              [UNTAGGED_COLOUR, UNTAGGED_COLOUR])
     ax.pcolormesh(X, Y, np.where(index < 0, 1.0, np.nan), cmap=grey,
-                  vmin=0.0, vmax=1.0, shading="flat", zorder=1.5)
+                  vmin=0.0, vmax=1.0, shading="flat", zorder=1.5, rasterized=True)
     _categorical_layers(ax, X, Y, index, purity_alpha(purity, stack.shape[0]),
                         colours)
 
@@ -390,7 +394,7 @@ def plot_origin_map(
     grey = LinearSegmentedColormap.from_list("untagged",
                                              [UNTAGGED_COLOUR, UNTAGGED_COLOUR])
     ax.pcolormesh(lon2d, lat2d, np.where(index < 0, 1.0, np.nan), cmap=grey,
-                  vmin=0.0, vmax=1.0, shading="auto", zorder=1.2)
+                  vmin=0.0, vmax=1.0, shading="auto", zorder=1.2, rasterized=True)
     alpha = purity_alpha(purity, stack.shape[0])
     for k, colour in enumerate(colours):
         sel = index == k
@@ -399,7 +403,7 @@ def plot_origin_map(
         cmap = LinearSegmentedColormap.from_list(f"src{k}", [colour, colour])
         ax.pcolormesh(lon2d, lat2d, np.where(sel, 1.0, np.nan), cmap=cmap,
                       vmin=0.0, vmax=1.0, shading="auto",
-                      alpha=np.where(sel, alpha, 0.0), zorder=1.5)
+                      alpha=np.where(sel, alpha, 0.0), zorder=1.5, rasterized=True)
     _draw_untagged(ax, lon2d, lat2d, index)
 
     levels = terrain_contour_levels(np.asarray(terrain, dtype=float))
@@ -111,10 +111,7 @@ def plot_height_surface(
     dpi: int = 300,
 ) -> Path:
     """Render a constant-surface field with wind barbs and temperature advection."""
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     from brc_tools.visualize.grid import terrain_contour_levels
     from brc_tools.visualize.style import get_style
@@ -127,7 +124,8 @@ def plot_height_surface(
         theta = np.where(mask, np.nan, theta)
     out = Path(out_path)
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     mesh = ax.pcolormesh(lon, lat, theta, shading="auto", cmap=style.cmap,
                          vmin=style.vmin, vmax=style.vmax, alpha=0.95)
     fig.colorbar(mesh, ax=ax, shrink=0.8, extend=style.extend, label=style.label)
@@ -182,5 +180,4 @@ def plot_height_surface(
 
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi)
-    plt.close(fig)
     return out
@@ -27,6 +27,7 @@ import numpy as np
 # alongside the rest of visualize/* for the pelican2013 study.  Re-implementing
 # them here to avoid touching a private name would fork the look of every figure
 # the moment one copy is retuned.
+from brc_tools.visualize.grid import clabel_for, fill_array
 from brc_tools.visualize.nwp_maps import _draw_section_towns, _geo_locator_inset
 from brc_tools.visualize.style import get_style, norm_kwargs
 
@@ -209,6 +210,7 @@ def plot_wrf_curtain(
     show_orientation: bool = True,
     theta_contours: bool = True,
     theta_interval: float = 1.0,
+    label_contours: bool | str = True,
     w_exaggeration: float = 10.0,
     quiver_stride: tuple[int, int] = (4, 10),
     y_top_m: float = 3000.0,
@@ -241,7 +243,9 @@ def plot_wrf_curtain(
 
     ``theta_interval`` defaults to 1 K rather than the isobaric renderer's 2 K: a
     nocturnal inversion does its work in the first few kelvin, and on the native
-    grid there is resolution to show it.
+    grid there is resolution to show it.  ``label_contours`` labels every other
+    isentrope; sweeps pass ``"sparse"`` to skip the labels on a dense, noisy
+    theta field (see :func:`brc_tools.visualize.grid.clabel_for`).
 
     ``w_exaggeration`` scales the vertical component of the in-plane vectors and is
     a property of the *regime*, not the plot geometry — see ``docs/WRF-WINDS.md``.
@@ -261,9 +265,7 @@ def plot_wrf_curtain(
     exactly why both are offered; ``y_top_m``/``y_bottom_m`` are read in whichever
     frame is selected.
     """
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
     if vertical not in ("asl", "agl"):
         raise ValueError(f"vertical must be 'asl' or 'agl', got {vertical!r}")
@@ -291,9 +293,10 @@ def plot_wrf_curtain(
     y_bottom = (y_bottom_m if y_bottom_m is not None
                 else float(np.floor(np.nanmin(terrain) / 100.0) * 100.0 - 50.0))
 
-    fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
+    fig = Figure(figsize=figsize, layout="constrained")
+    ax = fig.subplots()
     ax.set_facecolor("0.6")
-    mesh = ax.pcolormesh(X, Y, np.asarray(field, dtype=float), cmap=st.cmap,
+    mesh = ax.pcolormesh(X, Y, fill_array(field), cmap=st.cmap,
                          shading="flat", **norm_kwargs(st))
     fig.colorbar(mesh, ax=ax, shrink=0.85, extend=st.extend,
                  label=cbar_label if cbar_label is not None
@@ -306,7 +309,7 @@ def plot_wrf_curtain(
         hi = np.ceil(np.nanmax(theta) / theta_interval) * theta_interval
         cs = ax.contour(dist2d, zm, theta, levels=np.arange(lo, hi + 0.1, theta_interval),
                         colors="black", linewidths=0.4, alpha=0.5)
-        ax.clabel(cs, cs.levels[::2], fontsize=6, fmt="%.0f")
+        clabel_for(ax, cs, label_contours, cs.levels[::2], fontsize=6, fmt="%.0f")
 
     # In-plane vectors only: along-transect + vertical. The component normal to
     # the section is DISCARDED here, not folded in -- say so, because a vector
@@ -360,5 +363,4 @@ def plot_wrf_curtain(
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out, dpi=dpi, bbox_inches="tight")
-    plt.close(fig)
     return out
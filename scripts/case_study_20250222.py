@@ -419,18 +419,25 @@ def figure5_cross_section(ds_pl, waypoints):
     wspd_xsec = np.full((len(levels), len(lons)), np.nan)
     u_xsec = np.full((len(levels), len(lons)), np.nan)
 
+    # Select the row once for every level and variable, so only that row is
+    # read rather than each full 2-D field being loaded and then sliced.
+    names = [n for lv in levels
+             for n in (f"temp_{lv}", f"wind_u_{lv}", f"wind_v_{lv}")
+             if n in ds_t.data_vars]
+    row = ds_t[names]
+    ydim = ds_t["latitude"].dims[0]
+    if ydim in row.dims:
+        row = row.isel({ydim: y_target})
+
     for li, lv in enumerate(levels):
         tname = f"temp_{lv}"
         uname = f"wind_u_{lv}"
         vname = f"wind_v_{lv}"
-        if tname in ds_t.data_vars:
-            tdata = ds_t[tname].values
-            temp_xsec[li, :] = tdata[y_target, :] if tdata.ndim == 2 else tdata
-        if uname in ds_t.data_vars and vname in ds_t.data_vars:
-            udata = ds_t[uname].values
-            vdata = ds_t[vname].values
-            u_row = udata[y_target, :] if udata.ndim == 2 else udata
-            v_row = vdata[y_target, :] if vdata.ndim == 2 else vdata
+        if tname in row.data_vars:
+            temp_xsec[li, :] = row[tname].values
+        if uname in row.data_vars and vname in row.data_vars:
+            u_row = row[uname].values
+            v_row = row[vname].values
             wspd_xsec[li, :] = np.sqrt(u_row ** 2 + v_row ** 2)
             u_xsec[li, :] = u_row
 
@@ -302,7 +302,7 @@ def render_sections(cfg, dom, plane, out_dir, ctx, args, ledger, *, sources=())
         def _draw(path, spec=spec, key=key, shade=shade, wps=wps):
             section = ws.section_from_plane(
                 plane, tuple(spec["a"]), tuple(spec["b"]),
-                n_points=int(spec.get("n_points", 240)),
+                n_points=we.section_points(spec),
                 termini=tuple(spec.get("termini", ("A", "B"))),
             )
             plot_wrf_curtain(
@@ -316,6 +316,7 @@ def render_sections(cfg, dom, plane, out_dir, ctx, args, ledger, *, sources=())
                 w_exaggeration=(args.w_exag if args.w_exag is not None
                                 else float(spec.get("w_exag", 5.0))),
                 theta_interval=float(spec.get("theta_interval", 2.0)),
+                label_contours="sparse",
                 quiver_stride=tuple(spec.get("quiver_stride", (4, 10))),
                 locator={
                     **locator,
@@ -899,7 +900,8 @@ def main() -> int:
     if args.report:
         return we.report_coverage(out_root)
 
-    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run)
+    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run,
+                             image_format=args.image_format)
 
     # Sweeping the auxiliary stream alone needs its times, not the history's.
     aux_only = families == {"aux"}
@@ -18,6 +18,7 @@ from __future__ import annotations
 import argparse
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -60,15 +61,44 @@ def _subsample(times, stride_min: float) -> slice:
     return slice(None, None, max(1, int(round(stride_min * 60.0 / dt_s))))
 
 
+def _station_paths(spec: dict, run_dir: Path) -> list[Path]:
+    """The profile files ``spec`` reads, one per kind its fields need."""
+    domain = int(spec.get("domain", 2))
+    kinds = _kinds_for(tuple(spec.get("fields", DEFAULT_FIELDS)))
+    return [wts.ts_path(run_dir, str(spec["station"]), domain, k) for k in kinds]
+
+
+def read_station(spec: dict, run_dir: Path,
+                 paths: list[Path] | None = None) -> dict | None:
+    """The station's profiles, or ``None`` if any file is missing (reported later).
+
+    ``paths`` is the :func:`_station_paths` list when the caller already has it.
+    """
+    paths = _station_paths(spec, run_dir) if paths is None else paths
+    if not all(p.exists() for p in paths):
+        return None
+    fields = tuple(spec.get("fields", DEFAULT_FIELDS))
+    return wts.read_ts_profiles(run_dir, str(spec["station"]),
+                                int(spec.get("domain", 2)), kinds=_kinds_for(fields))
+
+
+def _read_ahead(spec: dict, run_dir: Path) -> tuple[list[Path], dict | None]:
+    """``spec``'s profile paths and profiles, built on the read-ahead worker."""
+    paths = _station_paths(spec, run_dir)
+    return paths, read_station(spec, run_dir, paths)
+
+
 def render_station(cfg: dict, spec: dict, run_dir: Path, out_root: Path,
-                   args, ledger) -> int:
+                   args, ledger, profiles: dict | None = None,
+                   paths: list[Path] | None = None) -> int:
+    """Render one ``[[timeheight]]`` entry; ``profiles``/``paths`` may be pre-read."""
     key = spec["key"]
     domain = int(spec.get("domain", 2))
     prefix = str(spec["station"])
     fields = tuple(spec.get("fields", DEFAULT_FIELDS))
     kinds = _kinds_for(fields)
 
-    paths = [wts.ts_path(run_dir, prefix, domain, k) for k in kinds]
+    paths = _station_paths(spec, run_dir) if paths is None else paths
     missing = [p for p in paths if not p.exists()]
     if missing:
         print(f"[SKIP] {key}: {missing[0].name} not written by this run")
@@ -76,7 +106,8 @@ def render_station(cfg: dict, spec: dict, run_dir: Path, out_root: Path,
                     family="timeheight", domain=domain, var=key)
         return 0
 
-    profiles = wts.read_ts_profiles(run_dir, prefix, domain, kinds=kinds)
+    if profiles is None:
+        profiles = read_station(spec, run_dir, paths)
     header = profiles["header"]
     times = list(profiles["valid_times"])
 
@@ -180,17 +211,30 @@ def main() -> int:
     if args.report:
         return we.report_coverage(out_root)
 
-    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run)
+    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run,
+                             image_format=args.image_format)
     print(f"[run ] {run_dir}")
     total = 0
-    for spec in specs:
-        try:
-            total += render_station(cfg, spec, run_dir, out_root, args, ledger)
-        except Exception as exc:
-            print(f"[ERR] timeheight {spec.get('key')}: {exc}")
-            traceback.print_exc()
-            ledger.note(we.ERROR, f"{type(exc).__name__}: {exc}",
-                        family="timeheight", var=spec.get("key"))
+    # The next station's tslist files are read and parsed on a background thread
+    # while the current one renders, as in wrf_quicklook.  One worker: a single
+    # read in flight, never a queue of parsed profiles waiting on matplotlib.
+    # A bad entry raises from ``result()`` inside the try, so it is reported
+    # against that station and the rest still render.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(_read_ahead, specs[0], run_dir)
+        for i, spec in enumerate(specs):
+            current = pending
+            if i + 1 < len(specs):
+                pending = pool.submit(_read_ahead, specs[i + 1], run_dir)
+            try:
+                paths, profiles = current.result()
+                total += render_station(cfg, spec, run_dir, out_root, args, ledger,
+                                        profiles=profiles, paths=paths)
+            except Exception as exc:
+                print(f"[ERR] timeheight {spec.get('key')}: {exc}")
+                traceback.print_exc()
+                ledger.note(we.ERROR, f"{type(exc).__name__}: {exc}",
+                            family="timeheight", var=spec.get("key"))
 
     if args.dry_run:
         print(f"\n[dry ] {ledger.count(we.PLANNED)} figure(s) would be rendered:")
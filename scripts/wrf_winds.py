@@ -33,6 +33,7 @@ from brc_tools.nwp import wrf_engine as we  # noqa: E402
 from brc_tools.nwp import wrf_output as wo  # noqa: E402
 from brc_tools.nwp import wrf_section as ws  # noqa: E402
 from brc_tools.nwp import wrf_tracers as wt  # noqa: E402
+from brc_tools.utils.memo import ArrayMemo  # noqa: E402
 from brc_tools.visualize import coldpool3d as cp3  # noqa: E402
 from brc_tools.visualize import tracer_origin as tro  # noqa: E402
 from brc_tools.visualize.nwp_maps import plot_nwp_surface_map  # noqa: E402
@@ -243,6 +244,7 @@ def render_domain(cfg: dict, dom: dict, valid: datetime, init: datetime,
                         w_exaggeration=(args.w_exag if args.w_exag is not None
                                         else float(s.get("w_exag", 10.0))),
                         theta_interval=float(s.get("theta_interval", 1.0)),
+                        label_contours="sparse",
                         quiver_stride=tuple(s.get("quiver_stride", (4, 10))),
                         locator=section_locator(loc, s, sec_wps),
                         dpi=args.dpi)
@@ -266,14 +268,27 @@ def render_domain(cfg: dict, dom: dict, valid: datetime, init: datetime,
         return made
     finally:
         ds.close()
+        # the cuts hold this plane; drop them before the next one is read
+        _cuts.clear()
+
+
+# Cuts from the current plane, keyed on the line.  One transect feeds its main
+# curtain, its origin curtain and every share curtain; all of them draw from a
+# single nearest-column sampling.
+_cuts = ArrayMemo(maxsize=32)
 
 
 def cut_section(plane, spec: dict):
-    """Cut one ``[[sections]]`` transect from an already-loaded plane."""
-    return ws.section_from_plane(
-        plane, tuple(spec["a"]), tuple(spec["b"]),
-        n_points=int(spec.get("n_points", 240)),
-        termini=tuple(spec.get("termini", ("A", "B"))))
+    """Cut one ``[[sections]]`` transect from an already-loaded plane.
+
+    Reused while the plane is the same, so every figure drawn from one line
+    shares a single cut.
+    """
+    line = (tuple(spec["a"]), tuple(spec["b"]), we.section_points(spec),
+            tuple(spec.get("termini", ("A", "B"))))
+    a, b, n_points, termini = line
+    return _cuts.get(line, lambda: ws.section_from_plane(
+        plane, a, b, n_points=n_points, termini=termini), owner=plane)
 
 
 def curtain_axes(spec: dict) -> dict:
@@ -346,15 +361,26 @@ def render_tracers(cfg, dom, plane, jobs, tag, stamp, sec_base, an, out_dir, arg
                             _origin, sources=sources, family="tracers",
                             domain=domain, var=f"origin_{key}")
 
+        # Every share curtain of this line divides by the same total; compute
+        # the shares once, on first use.
+        line_shares: list = []
+
+        def _line_shares(s=s, line_shares=line_shares):
+            if not line_shares:
+                sec = cut_section(plane, s)
+                share, _total = wt.tracer_shares(sec.tracers2d, floor=floor)
+                line_shares.append((sec, share))
+            return line_shares[0]
+
         for i in shares:
             if i < 0 or i >= plane.tracers.shape[0]:
                 continue
 
-            def _share(path, i=i, s=s, key=key, common=common):
-                sec = cut_section(plane, s)
-                share_i, _total = wt.tracer_shares(sec.tracers2d, floor=floor)
+            def _share(path, i=i, s=s, key=key, common=common,
+                       _line_shares=_line_shares):
+                sec, share = _line_shares()
                 plot_wrf_curtain(
-                    sec, path, values=share_i[i],
+                    sec, path, values=share[i],
                     style=style_for(cfg, "tracer_share"),
                     cbar_label=f"share of the tagged air from {labels[i]}",
                     title=we.compose_title(we.SOURCE_WRF, sec_base,
@@ -363,6 +389,7 @@ def render_tracers(cfg, dom, plane, jobs, tag, stamp, sec_base, an, out_dir, arg
                     w_exaggeration=(args.w_exag if args.w_exag is not None
                                     else float(s.get("w_exag", 10.0))),
                     quiver_stride=tuple(s.get("quiver_stride", (4, 10))),
+                    label_contours="sparse",
                     **common)
 
             made += ledger.emit(
@@ -565,7 +592,8 @@ def main() -> int:
     if args.report:
         return we.report_coverage(out_root)
 
-    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run)
+    ledger = we.FigureLedger(skip_existing=args.skip_existing, dry_run=args.dry_run,
+                             image_format=args.image_format)
 
     print(f"[run ] {run_dir}")
     print(f"[init] {init:{_TIME_FMT}}")
@@ -123,7 +123,8 @@ class TestAviationPayload:
         assert payload["airport"] == "KVEL"
         assert payload["runway_headings_deg"] == [160, 340]
         assert payload["forecast_minutes"] == [0, 15, 30]
-        assert len(payload["valid_times"]) == 3
+        assert payload["valid_times"] == ["2026-04-24T12:00:00Z", "2026-04-24T12:15:00Z",
+                                          "2026-04-24T12:30:00Z"]
         for key in ("wind_speed_kt", "wind_dir_deg", "gust_kt",
                     "crosswind_kt_160", "crosswind_kt_340",
                     "headwind_kt_160", "headwind_kt_340"):
@@ -146,3 +147,58 @@ class TestAviationPayload:
         assert hw_160 > 0
         assert hw_340 < 0
         assert hw_340 == pytest.approx(-hw_160, rel=1e-6)
+
+
+def test_pick_var_follows_name_precedence():
+    from brc_tools.nwp.aviation import _GUST_NAMES, _U10_NAMES, _pick_var
+
+    pt = xr.Dataset({"UGRD": ("time", [1.0]), "u10": ("time", [2.0]),
+                     "i10fg": ("time", [9.0])})
+    assert _pick_var(pt, _U10_NAMES, required=True)[0] == 2.0
+    assert _pick_var(pt, _GUST_NAMES)[0] == 9.0
+    assert _pick_var(pt, ("nope",)) is None
+    with pytest.raises(KeyError):
+        _pick_var(pt, ("nope",), required=True)
+
+
+def test_wind_pieces_reads_all_fields_in_one_search():
+    from brc_tools.nwp import aviation
+
+    calls = []
+
+    class _H:
+        def xarray(self, search, remove_grib=False, **kwargs):
+            calls.append((search, kwargs["backend_kwargs"]["indexpath"]))
+            return [xr.Dataset({"u10": ((), 1.0)}), xr.Dataset({"gust": ((), 2.0)})]
+
+    pieces = aviation._wind_pieces(_H(), 1)
+    # a persistent cfgrib index, so the per-hypercube reopens share one scan
+    assert calls == [(aviation.SEARCH_WINDS, "{path}.{short_hash}.idx")]
+    assert [list(p.data_vars) for p in pieces] == [["u10"], ["gust"]]
+
+
+def test_wind_pieces_falls_back_to_per_field_searches():
+    from brc_tools.nwp import aviation
+
+    calls = []
+
+    class _H:
+        def xarray(self, search, remove_grib=False, **kwargs):
+            calls.append(search)
+            if search == aviation.SEARCH_WINDS:
+                raise ValueError("bad combined read")
+            return xr.Dataset({"v": ((), 0.0)})
+
+    assert len(aviation._wind_pieces(_H(), 1)) == 3
+    assert calls[1:] == [aviation.SEARCH_U10, aviation.SEARCH_V10, aviation.SEARCH_GUST]
+
+
+def test_time_axes_leave_a_missing_step_empty():
+    from brc_tools.nwp import aviation
+
+    times = np.array(["2026-04-24T13:00", "NaT", "2026-04-24T14:30"],
+                     dtype="datetime64[ns]")
+    pt = xr.Dataset(coords={"time": times})
+    valid, minutes = aviation._time_axes(pt, dt.datetime(2026, 4, 24, 12, 0))
+    assert valid == ["2026-04-24T13:00:00Z", None, "2026-04-24T14:30:00Z"]
+    assert minutes == [60, None, 150]
@@ -1,10 +1,14 @@
 """Unit tests for the BasinWX HRRR surface export."""
 
 import datetime as dt
+import json
+from pathlib import Path
 
 import numpy as np
+import pytest
 import xarray as xr
 
+from brc_tools.nwp import basinwx
 from brc_tools.nwp.basinwx import (
     INDEX_FILENAME,
     build_surface_index,
@@ -110,3 +114,70 @@ def test_build_surface_index_preserves_run_metadata():
     assert index_payload["product"] == "surface_layers_index"
     assert index_payload["runs"][0]["filename"].endswith(".json")
     assert INDEX_FILENAME.endswith(".json")
+
+
+def test_export_latest_surface_layers_runs_concurrently_in_init_order(monkeypatch, tmp_path):
+    inits = [dt.datetime(2026, 4, 16, h, tzinfo=dt.UTC) for h in (2, 1, 0)]
+    fetched = []
+
+    def fake_fetch(init_time, **kwargs):
+        fetched.append(init_time)
+        return _sample_raw_dataset()
+
+    monkeypatch.setattr(basinwx, "latest_init_times", lambda count, source=None: inits)
+    monkeypatch.setattr(basinwx, "fetch_surface_dataset", fake_fetch)
+
+    paths = basinwx.export_latest_surface_layers(output_dir=tmp_path, run_workers=3)
+
+    assert sorted(fetched) == sorted(inits)
+    assert [p.name for p in paths[:-1]] == [basinwx._surface_filename(t) for t in inits]
+    assert paths[-1].name == INDEX_FILENAME
+    index = json.loads(paths[-1].read_text())
+    assert [run["filename"] for run in index["runs"]] == [p.name for p in paths[:-1]]
+
+
+def test_export_uploads_each_run_before_the_index(monkeypatch, tmp_path):
+    from brc_tools.download import push_data
+
+    inits = [dt.datetime(2026, 4, 16, h, tzinfo=dt.UTC) for h in (2, 1, 0)]
+    sent = []
+    monkeypatch.setattr(basinwx, "latest_init_times", lambda count, source=None: inits)
+    monkeypatch.setattr(basinwx, "fetch_surface_dataset",
+                        lambda init_time, **kwargs: _sample_raw_dataset())
+    monkeypatch.setattr(push_data, "load_config_urls", lambda: ("key", ["https://x"]))
+    monkeypatch.setattr(push_data, "send_json_to_all",
+                        lambda urls, path, bucket, key: sent.append(Path(path).name))
+
+    paths = basinwx.export_latest_surface_layers(output_dir=tmp_path, upload=True,
+                                                 run_workers=3)
+
+    assert sorted(sent) == sorted(p.name for p in paths)
+    assert sent[-1] == INDEX_FILENAME
+
+
+def test_a_failed_run_still_indexes_the_runs_already_uploaded(monkeypatch, tmp_path):
+    from brc_tools.download import push_data
+
+    inits = [dt.datetime(2026, 4, 16, h, tzinfo=dt.UTC) for h in (2, 1, 0)]
+    sent = []
+
+    def fake_fetch(init_time, **kwargs):
+        if init_time.hour == 1:
+            raise RuntimeError("truncated GRIB")
+        return _sample_raw_dataset()
+
+    monkeypatch.setattr(basinwx, "latest_init_times", lambda count, source=None: inits)
+    monkeypatch.setattr(basinwx, "fetch_surface_dataset", fake_fetch)
+    monkeypatch.setattr(push_data, "load_config_urls", lambda: ("key", ["https://x"]))
+    monkeypatch.setattr(push_data, "send_json_to_all",
+                        lambda urls, path, bucket, key: sent.append(Path(path).name))
+
+    with pytest.raises(RuntimeError, match="truncated GRIB"):
+        basinwx.export_latest_surface_layers(output_dir=tmp_path, upload=True,
+                                             run_workers=3)
+
+    uploaded = [basinwx._surface_filename(t) for t in (inits[0], inits[2])]
+    assert sorted(sent[:-1]) == sorted(uploaded)
+    assert sent[-1] == INDEX_FILENAME
+    index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+    assert [run["filename"] for run in index["runs"]] == uploaded
@@ -87,3 +87,18 @@ class TestFamilies:
         mod = _load(engine)
         assert len(set(mod.FAMILIES)) == len(mod.FAMILIES), "duplicate family"
         assert all(f.islower() and f.isidentifier() for f in mod.FAMILIES)
+
+
+def test_winds_cuts_each_line_once_per_plane(winds):
+    """The main, origin and share curtains of one transect share one cut."""
+    from _wrf_synthetic import make_synthetic_wrf
+
+    from brc_tools.nwp import wrf_section as ws
+
+    spec = {"a": [40.1, -109.9], "b": [40.4, -109.6], "n_points": 20}
+    plane = ws.load_plane(make_synthetic_wrf())
+    sec = winds.cut_section(plane, spec)
+    assert winds.cut_section(plane, dict(spec)) is sec
+    assert winds.cut_section(plane, {**spec, "n_points": 30}) is not sec
+    # a new valid time is a new plane, so nothing carries over
+    assert winds.cut_section(ws.load_plane(make_synthetic_wrf()), spec) is not sec
@@ -154,6 +154,40 @@ def test_fetch_funnel_fields_auto_picks_ncei(monkeypatch):
     assert captured.get("called") and data.source == "ncei"
 
 
+def test_ncei_fetch_opens_only_the_levels_the_panels_read(monkeypatch, tmp_path):
+    import types
+
+    import xarray as xr
+
+    from brc_tools.nwp import wrf_staging
+
+    filters = []
+
+    def fake_open(path, engine=None, backend_kwargs=None):
+        keys = backend_kwargs["filter_by_keys"]
+        filters.append(keys)
+        lat, lon = np.meshgrid(np.linspace(35, 45, 4), np.linspace(250, 260, 5),
+                               indexing="ij")
+        coords = {"latitude": (("y", "x"), lat), "longitude": (("y", "x"), lon)}
+        name = keys.get("shortName", "prmsl")
+        at = keys.get("level")
+        if isinstance(at, list):
+            coords["isobaricInhPa"] = at
+            data = (("isobaricInhPa", "y", "x"), np.ones((len(at), 4, 5)))
+        else:
+            data = (("y", "x"), np.full((4, 5), 50.0 if name == "r" else 1.0e5))
+        return xr.Dataset({name: data}, coords=coords)
+
+    monkeypatch.setattr(xr, "open_dataset", fake_open)
+    monkeypatch.setattr(wrf_staging, "stage_nam_analysis", lambda **kw: [
+        types.SimpleNamespace(local_path=str(tmp_path / "nam.grb"))])
+    full = ff._ncei_fetch_full(dt.datetime(2013, 1, 31), [500, 700], tmp_path)
+    assert "gh500" in full and "q600" in full
+    by_short = {f.get("shortName"): f.get("level") for f in filters}
+    assert by_short["gh"] == by_short["t"] == [500, 600, 700, 850]
+    assert by_short["q"] == 600
+
+
 # ── renderer (headless) ─────────────────────────────────────────────────────
 def _panels_from(full):
     from brc_tools.nwp.source import load_lookups
@@ -203,3 +237,27 @@ def test_plot_forecast_funnel_refuses_repo_path():
                       model_label="NAM test", panels=[])
     with pytest.raises(SystemExit, match="repo checkout"):
         plot_forecast_funnel(data, _REPO_ROOT / "figures" / "nope.png")
+
+
+def test_contour_levels_ignore_nans_and_span_the_data():
+    from brc_tools.visualize.funnel import _contour_levels
+
+    field = np.array([[np.nan, 5312.0], [5488.0, np.nan]])
+    levels = _contour_levels(field, 60.0)
+    assert levels[0] <= 5312.0 and levels[-1] >= 5488.0
+    np.testing.assert_allclose(np.diff(levels), 60.0)
+    assert _contour_levels(np.full((2, 2), np.nan), 60.0).size == 0
+
+
+def test_has_messages_reads_the_index_and_defers_without_one():
+    class _H:
+        def inventory(self, search):
+            return [] if "SPFH" in search else ["row"]
+
+    class _NoIdx:
+        def inventory(self, search):
+            raise ValueError("no index file")
+
+    assert not ff._has_messages(_H(), r":SPFH:600 mb:")
+    assert ff._has_messages(_H(), r":RH:600 mb:")
+    assert ff._has_messages(_NoIdx(), r":SPFH:600 mb:")
@@ -189,3 +189,21 @@ def test_render_context_writes_figure_and_provenance(tmp_path, monkeypatch):
         "modis_uinta_20130202_1800.png",
         "modis_uinta_20130202_1800.pdf",
     }
+
+
+def test_render_context_hashes_match_written_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("MPLCONFIGDIR", str(tmp_path / "mpl"))
+    stem = tmp_path / "output" / "modis_uinta_20130202_1800"
+    result = modis.render_context(
+        TARGET,
+        BBOX,
+        stem,
+        width=720,
+        products=("true-color",),
+        formats=("png", "pdf"),
+        cache_dir=tmp_path / "cache",
+        session=FakeSession(),
+    )
+    outputs = json.loads(result.provenance_path.read_text())["rendering"]["outputs"]
+    for name, digest in outputs.items():
+        assert hashlib.sha256((stem.parent / name).read_bytes()).hexdigest() == digest
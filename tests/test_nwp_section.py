@@ -4,6 +4,7 @@ import numpy as np
 import xarray as xr
 
 from brc_tools.nwp.section import NWPSection, extract_nwp_section
+from brc_tools.utils.memo import ArrayMemo
 
 
 def _synth(levels=(850, 800, 750, 700), ny=10, nx=12, terrain=1200.0, with_time=True):
@@ -45,6 +46,19 @@ class TestExtract:
         np.testing.assert_allclose(np.nanmax(sec.speed2d), 5.0, atol=1e-6)
         assert np.nanmean(sec.along2d) > 4.5
 
+    def test_along_and_normal_rotate_the_wind_onto_the_transect(self):
+        ds = _synth(terrain=0.0)
+        for lev in (850, 800, 750, 700):
+            ds[f"wind_v_{lev}"] = ds[f"wind_v_{lev}"] + 3.0  # (u, v) = (5, 3)
+        start, end = (40.1, -111.5), (40.9, -108.6)
+        sec = extract_nwp_section(ds, start, end, [850, 800, 750, 700])
+        coslat = np.cos(np.deg2rad(0.5 * (start[0] + end[0])))
+        tx, ty = (end[1] - start[1]) * coslat, end[0] - start[0]
+        tx, ty = tx / np.hypot(tx, ty), ty / np.hypot(tx, ty)
+        np.testing.assert_allclose(sec.along2d, 5.0 * tx + 3.0 * ty)
+        np.testing.assert_allclose(sec.normal2d, -5.0 * ty + 3.0 * tx)
+        np.testing.assert_allclose(np.hypot(sec.along2d, sec.normal2d), sec.speed2d)
+
     def test_below_ground_masked(self):
         ds = _synth(terrain=1500.0)  # above the 850 hPa height (1000 m)
         sec = extract_nwp_section(ds, (40.1, -111.5), (40.9, -108.6),
@@ -66,6 +80,71 @@ class TestExtract:
         assert np.allclose(np.nan_to_num(sec.w2d), 0.0)
         assert np.nanmin(sec.theta2d) > 280.0
 
+    def test_nonzero_omega_converts_level_by_level(self):
+        from brc_tools.nwp.section import _G, _RD
+
+        levels = [850, 800, 750, 700]
+        ds = _synth(terrain=0.0)
+        for i, lev in enumerate(levels):
+            ds[f"omega_{lev}"] = ds[f"omega_{lev}"] - 0.5 * (i + 1)
+        sec = extract_nwp_section(ds, (40.1, -111.5), (40.9, -108.6), levels)
+        p_pa = np.array(levels, dtype=float)[:, None] * 100.0
+        omega = -0.5 * np.arange(1, 5)[:, None]
+        expected = -omega * _RD * sec.temp2d / (p_pa * _G)
+        np.testing.assert_allclose(sec.w2d, expected, rtol=1e-12)
+        assert (sec.w2d > 0.0).all()  # rising motion for negative omega
+
+
+def test_sampled_columns_match_the_nearest_grid_values():
+    from scipy.spatial import cKDTree
+
+    from brc_tools.nwp.section import _lon180, _sample_line
+
+    ds = _synth(terrain=0.0)  # nothing masked below ground
+    rng = np.random.default_rng(1)
+    for name in list(ds.data_vars):
+        if name.startswith("temp_"):
+            ds[name] = ds[name] + rng.normal(size=ds[name].shape)
+    start, end = (40.1, -111.5), (40.9, -108.6)
+    sec = extract_nwp_section(ds, start, end, [850, 800, 750, 700], n_points=30)
+
+    lat2d = ds["latitude"].values
+    lon2d = _lon180(ds["longitude"].values)
+    lon_line, lat_line, _ = _sample_line(start, end, 30)
+    _, flat = cKDTree(np.column_stack([lat2d.ravel(), lon2d.ravel()])).query(
+        np.column_stack([lat_line, lon_line]))
+    expected = np.stack([ds[f"temp_{lev}"].isel(time=0).values.ravel()[flat]
+                         for lev in (850, 800, 750, 700)])
+    np.testing.assert_array_equal(sec.temp2d, expected)
+
+
+def test_column_tree_is_reused_for_the_same_grid(monkeypatch):
+    import scipy.spatial
+
+    from brc_tools.nwp import section
+
+    built = []
+    real = scipy.spatial.cKDTree
+
+    def counting(points):
+        built.append(len(points))
+        return real(points)
+
+    monkeypatch.setattr(scipy.spatial, "cKDTree", counting)
+    monkeypatch.setattr(section, "_trees", ArrayMemo(maxsize=4))
+    ds = _synth()
+    a = extract_nwp_section(ds, (40.1, -111.5), (40.9, -108.6), [850, 800, 750, 700])
+    b = extract_nwp_section(ds.copy(deep=True), (40.9, -111.5), (40.1, -108.6),
+                            [850, 800, 750, 700])
+    assert len(built) == 1  # an equal grid reuses the index
+    assert a.distance_km.shape == b.distance_km.shape
+    section.column_tree(ds["latitude"].values, ds["longitude"].values, (2.0, 1.0))
+    assert len(built) == 2  # a different scale is a different index
+    # ... and does not evict the others: alternating scales rebuild nothing
+    for scale in ((3.0, 1.0), (2.0, 1.0), (3.0, 1.0), (2.0, 1.0)):
+        section.column_tree(ds["latitude"].values, ds["longitude"].values, scale)
+    assert len(built) == 3
+
 
 class TestLookups:
     def test_terrain_height_alias(self):
@@ -80,3 +159,20 @@ class TestLookups:
         assert "basin_landmarks" in lu["waypoint_groups"]
         for town in ("salt_lake_city", "rangely", "duchesne"):
             assert town in lu["waypoints"]
+
+
+def test_section_bbox_crop_leaves_the_section_unchanged():
+    from brc_tools.nwp._crop import crop_to_bbox
+    from brc_tools.nwp.section import section_bbox
+
+    ds = _synth(ny=20, nx=24)
+    ramp = np.arange(20 * 24, dtype=float).reshape(1, 20, 24)
+    ds["temp_850"] = (("time", "y", "x"), 270.0 + 0.01 * ramp)
+    a, b = (40.3, -110.9), (40.6, -110.0)
+    bbox = section_bbox(a, b)
+    assert bbox == (40.05, -111.15, 40.85, -109.75)
+    cropped = crop_to_bbox(ds, bbox[:2], bbox[2:])
+    assert cropped.sizes["x"] < ds.sizes["x"] and cropped.sizes["y"] < ds.sizes["y"]
+    full = extract_nwp_section(ds, a, b, [850, 800], n_points=40)
+    part = extract_nwp_section(cropped, a, b, [850, 800], n_points=40)
+    np.testing.assert_array_equal(part.temp2d, full.temp2d)
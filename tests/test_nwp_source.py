@@ -0,0 +1,140 @@
+"""Unit tests for brc_tools.nwp.source.NWPSource.fetch (Herbie stubbed out)."""
+
+import numpy as np
+import xarray as xr
+
+from brc_tools.nwp.source import NWPSource
+
+
+def _grid(ny=40, nx=50):
+    """A 'CONUS-ish' 2-D lat/lon grid in 0..360, wider than the uinta_basin box."""
+    lat1d = np.linspace(37.0, 43.0, ny)
+    lon1d = np.linspace(246.0, 254.0, nx)  # -114 .. -106
+    lon2d, lat2d = np.meshgrid(lon1d, lat1d)
+    return lat2d, lon2d
+
+
+def _fake_fetch(calls):
+    lat2d, lon2d = _grid()
+
+    def fake(self, init_dt, fxx, search, product, retries, *, handles=None):
+        calls.append((fxx, search))
+        return xr.Dataset(
+            {"t2m": (("y", "x"), np.full(lat2d.shape, 270.0 + fxx))},
+            coords={"latitude": (("y", "x"), lat2d),
+                    "longitude": (("y", "x"), lon2d),
+                    "step": np.timedelta64(fxx, "h")},
+        )
+
+    return fake
+
+
+def test_fetch_crops_each_field_to_region(monkeypatch):
+    calls = []
+    monkeypatch.setattr(NWPSource, "_herbie_fetch", _fake_fetch(calls))
+    src = NWPSource("hrrr")
+    ds = src.fetch("2025-02-22 16Z", [0, 1], ["temp_2m"], region="uinta_basin",
+                   max_workers=1)
+
+    assert len(calls) == 2
+    assert ds.sizes["time"] == 2
+    lat = ds["latitude"].values
+    lon = np.where(ds["longitude"].values > 180, ds["longitude"].values - 360,
+                   ds["longitude"].values)
+    full_y, full_x = _grid()[0].shape
+    assert ds.sizes["y"] < full_y and ds.sizes["x"] < full_x
+    assert lat.min() >= 39.4 - 0.2 and lat.max() <= 41.1 + 0.2
+    assert lon.min() >= -110.9 - 0.2 and lon.max() <= -108.5 + 0.2
+    np.testing.assert_allclose(ds["temp_2m"].isel(time=1).values, 271.0)
+
+
+def test_fetch_without_region_keeps_full_grid(monkeypatch):
+    monkeypatch.setattr(NWPSource, "_herbie_fetch", _fake_fetch([]))
+    ds = NWPSource("hrrr").fetch("2025-02-22 16Z", [0], ["temp_2m"], max_workers=1)
+    assert (ds.sizes["y"], ds.sizes["x"]) == _grid()[0].shape
+
+
+def test_fetch_expands_levels_for_every_hour(monkeypatch):
+    calls = []
+    monkeypatch.setattr(NWPSource, "_herbie_fetch", _fake_fetch(calls))
+    ds = NWPSource("hrrr").fetch("2025-02-22 16Z", [0, 1], ["temp_pl"],
+                                 levels=[850, 700], max_workers=1)
+    assert sorted(calls) == [(0, "TMP:700 mb"), (0, "TMP:850 mb"),
+                             (1, "TMP:700 mb"), (1, "TMP:850 mb")]
+    assert {"temp_850", "temp_700"} <= set(ds.data_vars)
+
+
+def test_decoded_cache_serves_repeat_fetch_without_herbie(monkeypatch, tmp_path):
+    monkeypatch.setenv("BRC_TOOLS_DECODED_CACHE", str(tmp_path))
+    calls = []
+    monkeypatch.setattr(NWPSource, "_herbie_fetch", _fake_fetch(calls))
+    kw = dict(region="uinta_basin", max_workers=1)
+    first = NWPSource("hrrr").fetch("2025-02-22 16Z", [0, 1], ["temp_2m"], **kw)
+    assert len(calls) == 2 and len(list(tmp_path.glob("tile_*.nc"))) == 2
+
+    second = NWPSource("hrrr").fetch("2025-02-22 16Z", [0, 1], ["temp_2m"], **kw)
+    assert len(calls) == 2  # both tiles came from the cache
+    xr.testing.assert_identical(first, second)
+
+    NWPSource("hrrr").fetch("2025-02-22 16Z", [0, 1], ["temp_2m"], max_workers=1)
+    assert len(calls) == 4  # a different crop is a different tile
+
+
+def test_herbie_fetch_shares_one_handle_per_grib_file(monkeypatch, tmp_path):
+    import datetime
+
+    from brc_tools.nwp import source
+
+    built = []
+
+    class _FakeHerbie:
+        def __init__(self, init_dt, **kwargs):
+            built.append(kwargs["fxx"])
+            self.grib = None
+
+        def xarray(self, search, remove_grib=True):
+            if search == "BAD":
+                raise OSError("truncated index")
+            return xr.Dataset({"v": ((), 1.0)}, attrs={"search": search})
+
+    monkeypatch.setattr(source, "Herbie", _FakeHerbie)
+    monkeypatch.setattr(source, "purge_cached_files", lambda H: None)
+    monkeypatch.setenv("BRC_TOOLS_LOCK_DIR", str(tmp_path))
+    src = NWPSource("hrrr")
+    init = datetime.datetime(2025, 2, 22, 16)
+    handles = {}
+    for search in ("TMP:2 m", "UGRD:10 m", "VGRD:10 m"):
+        src._herbie_fetch(init, 1, search, "sfc", 1, handles=handles)
+    src._herbie_fetch(init, 2, "TMP:2 m", "sfc", 1, handles=handles)
+    assert built == [1, 2] and set(handles) == {(1, "sfc"), (2, "sfc")}
+
+    # a failure drops only its own file's handle
+    kept = handles[(2, "sfc")]
+    try:
+        src._herbie_fetch(init, 1, "BAD", "sfc", 1, handles=handles)
+    except OSError:
+        pass
+    assert set(handles) == {(2, "sfc")} and handles[(2, "sfc")] is kept
+
+    # without a fetch's dict nothing is shared
+    src._herbie_fetch(init, 2, "TMP:2 m", "sfc", 1)
+    assert built == [1, 2, 2]
+
+
+def test_parallel_fetch_keeps_each_grib_file_on_one_thread(monkeypatch):
+    import threading
+
+    calls = []
+    threads = {}
+    fake = _fake_fetch(calls)
+
+    def tracking(self, init_dt, fxx, search, product, retries, *, handles=None):
+        threads.setdefault(fxx, set()).add(threading.get_ident())
+        return fake(self, init_dt, fxx, search, product, retries)
+
+    monkeypatch.setattr(NWPSource, "_herbie_fetch", tracking)
+    ds = NWPSource("hrrr").fetch("2025-02-22 16Z", [0, 1, 2], ["temp_pl"],
+                                 levels=[850, 700, 500], max_workers=3)
+    assert len(calls) == 9 and ds.sizes["time"] == 3
+    assert all(len(ids) == 1 for ids in threads.values())
+    assert {"temp_850", "temp_700", "temp_500"} <= set(ds.data_vars)
@@ -112,3 +112,13 @@ class TestLegacyCompat:
         with mock.patch.object(push_data, "_post_json_to_url", return_value=True) as m:
             push_data.send_json_to_server("https://a.example", str(fpath), "observations", VALID_KEY)
         m.assert_called_once()
+
+
+def test_upload_path_does_not_load_pandas():
+    """The NWP exporters import this module only to upload JSON."""
+    import subprocess
+    import sys
+
+    code = ("import sys, brc_tools.download.push_data; "
+            "sys.exit('pandas' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
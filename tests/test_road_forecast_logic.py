@@ -91,3 +91,74 @@ def test_build_road_payload_emits_flat_points_for_website():
     assert step_zero["valid_time"] == "2026-03-17T13:00:00Z"
     assert step_zero["temp_2m"] == -1.0
     assert step_zero["wind_speed_10m"] == 3.0
+
+
+def test_fetch_hourly_datasets_keeps_hour_order_and_skips_failures(monkeypatch):
+    import time
+
+    import xarray as xr
+
+    from brc_tools.download import hrrr_access
+
+    def fake_fetch(init_time, fxx, query_map, **kwargs):
+        time.sleep(0.01 * (5 - fxx))  # later hours finish first
+        if fxx == 3:
+            raise RuntimeError("missing")
+        return xr.Dataset({"temp_2m": ((), float(fxx))})
+
+    monkeypatch.setattr(hrrr_access, "fetch_hour_dataset", fake_fetch)
+    out = hrrr_access.fetch_hourly_datasets(
+        dt.datetime(2025, 1, 1), {"temp_2m": ":TMP:"}, max_fxx=4, workers=4
+    )
+    assert list(out) == [1, 2, 4]
+    assert [float(ds["temp_2m"]) for ds in out.values()] == [1.0, 2.0, 4.0]
+
+
+def test_fetch_hour_dataset_persists_the_index_only_for_kept_subsets(monkeypatch):
+    import numpy as np
+    import xarray as xr
+
+    from brc_tools.download import hrrr_access
+
+    calls = []
+
+    class _H:
+        grib = None
+
+        def xarray(self, search, remove_grib=True, **kwargs):
+            calls.append((search, remove_grib, kwargs))
+            return xr.Dataset({"t2m": (("y", "x"), np.zeros((2, 2)))})
+
+    monkeypatch.setattr(hrrr_access, "setup_herbie", lambda *a, **k: _H())
+    init = dt.datetime(2025, 1, 1)
+    hrrr_access.fetch_hour_dataset(init, 1, {"temp_2m": "TMP:2 m"}, remove_grib=False)
+    hrrr_access.fetch_hour_dataset(init, 1, {"temp_2m": "TMP:2 m"})
+    assert calls[0][2] == {"backend_kwargs": {"indexpath": "{path}.{short_hash}.idx"}}
+    assert calls[1][1] is True and calls[1][2] == {}
+
+
+def test_build_route_forecasts_searches_the_grid_once_per_waypoint(monkeypatch):
+    import numpy as np
+    import xarray as xr
+
+    from brc_tools.download import get_road_forecast as grf
+
+    lat, lon = np.meshgrid(np.linspace(39.0, 42.0, 4), np.linspace(-112.0, -108.0, 5),
+                           indexing="ij")
+    ds = xr.Dataset({"temp_2m": (("y", "x"), np.full((4, 5), 273.15))},
+                    coords={"latitude": (("y", "x"), lat), "longitude": (("y", "x"), lon)})
+    corridors = {"r": {"waypoints": [{"lat": 40.0, "lon": -110.0},
+                                     {"lat": 41.0, "lon": -109.0}]}}
+    searches = []
+    real = grf.nearest_grid_index
+
+    def counting(ds, lat, lon):
+        searches.append((lat, lon))
+        return real(ds, lat, lon)
+
+    monkeypatch.setattr(grf, "ROAD_CORRIDORS", corridors)
+    monkeypatch.setattr(grf, "nearest_grid_index", counting)
+    out = grf.build_route_forecasts(hour_datasets={1: ds, 2: ds, 3: None}, max_fxx=3)
+
+    assert len(searches) == 2  # one per waypoint, not per waypoint-hour
+    assert [h["temp_2m"] for h in out["r"][0]] == [0.0, 0.0, None]
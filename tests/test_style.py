@@ -188,3 +188,4 @@ def test_varstyle_still_accepts_levels_for_the_pelican_case_toml_path():
 
     assert _varstyle_from_dict({"cmap": "viridis"}).levels is None
     assert _varstyle_from_dict({"cmap": "viridis", "levels": [1, 2, 3]}).levels == (1, 2, 3)
+
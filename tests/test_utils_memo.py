@@ -0,0 +1,64 @@
+"""Tests for brc_tools.utils.memo.ArrayMemo."""
+
+import numpy as np
+import pytest
+
+from brc_tools.utils.memo import ArrayMemo
+
+
+def _counting():
+    built = []
+
+    def build(tag):
+        def _b():
+            built.append(tag)
+            return object()
+        return _b
+    return built, build
+
+
+def test_equal_arrays_hit_and_different_ones_miss():
+    memo = ArrayMemo(maxsize=2)
+    built, build = _counting()
+    a = np.arange(6.0).reshape(2, 3)
+    first = memo.get("k", build(1), arrays=(a,))
+    assert memo.get("k", build(2), arrays=(a.copy(),)) is first
+    memo.get("k", build(3), arrays=(a + 1.0,))
+    memo.get("other", build(4), arrays=(a,))
+    assert built == [1, 3, 4]
+
+
+def test_the_stored_copy_does_not_follow_an_in_place_edit():
+    memo = ArrayMemo()
+    built, build = _counting()
+    a = np.zeros(4)
+    memo.get(None, build(1), arrays=(a,))
+    a[0] = 1.0
+    memo.get(None, build(2), arrays=(a,))
+    assert built == [1, 2]
+
+
+def test_owner_is_compared_by_identity():
+    memo = ArrayMemo(maxsize=4)
+    built, build = _counting()
+    owner = [1, 2]
+    memo.get("line", build(1), owner=owner)
+    memo.get("line", build(2), owner=owner)
+    memo.get("line", build(3), owner=[1, 2])  # equal, but not the same object
+    assert built == [1, 3]
+
+
+def test_least_recently_used_entry_is_evicted():
+    memo = ArrayMemo(maxsize=2)
+    built, build = _counting()
+    for key in ("a", "b", "a", "c", "a", "b"):
+        memo.get(key, build(key))
+    assert built == ["a", "b", "c", "b"]
+    assert len(memo) == 2
+    memo.clear()
+    assert len(memo) == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError, match="maxsize"):
+        ArrayMemo(maxsize=0)
@@ -13,6 +13,7 @@ from brc_tools.visualize import basemap as bm
 def test_add_reference_overlays_never_raises_without_data(monkeypatch):
     # Force "no staged shapefiles" and assert the overlay is a silent no-op.
     monkeypatch.setattr(bm, "_load_records", lambda layer, res: ())
+    bm._clipped_parts.cache_clear()
     fig, ax = plt.subplots()
     bm.add_reference_overlays(ax, (-110.0, -109.0, 40.0, 41.0),
                               layers={"states": True, "roads": True,
@@ -20,6 +21,35 @@ def test_add_reference_overlays_never_raises_without_data(monkeypatch):
     plt.close(fig)
 
 
+def test_reference_overlays_clip_once_per_extent(monkeypatch):
+    from shapely.geometry import LineString, Polygon
+
+    calls = []
+    records = {
+        "states": ((LineString([(-111.0, 40.5), (-108.0, 40.5)]), {}),),
+        "lakes": ((Polygon([(-109.8, 40.2), (-109.6, 40.2), (-109.6, 40.4)]), {}),),
+        "roads": ((LineString([(-110.5, 40.1), (-109.2, 40.9)]), {"type": "Major Highway"}),
+                  (LineString([(-110.5, 40.9), (-109.2, 40.1)]), {"type": "Track"})),
+    }
+
+    def fake_load(layer, res):
+        calls.append(layer)
+        return records.get(layer, ())
+
+    monkeypatch.setattr(bm, "_load_records", fake_load)
+    bm._clipped_parts.cache_clear()
+    extent = (-110.0, -109.0, 40.0, 41.0)
+    for _ in range(3):
+        fig, ax = plt.subplots()
+        bm.add_reference_overlays(ax, extent, layers={"states": True, "roads": True,
+                                                      "rivers": False, "lakes": True})
+        # one collection per layer: lake fill, the one highway, the state border
+        assert [len(c.get_paths()) for c in ax.collections] == [1, 1, 1]
+        plt.close(fig)
+    assert sorted(calls) == ["lakes", "roads", "states"]  # one clip per layer, not per figure
+    bm._clipped_parts.cache_clear()
+
+
 def test_add_reference_overlays_all_off_is_noop():
     fig, ax = plt.subplots()
     # all layers off -> returns immediately, even if shapely/cartopy were present
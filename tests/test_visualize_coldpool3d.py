@@ -0,0 +1,44 @@
+"""Tests for brc_tools.visualize.coldpool3d (isentrope lid + 3-D render)."""
+
+import numpy as np
+
+from brc_tools.visualize.coldpool3d import isentrope_lid, plot_coldpool_3d
+
+
+def _column_stack(theta_cols, z=(1500.0, 1700.0, 1900.0, 2100.0)):
+    """(nz, 1, ncol) theta/height cubes from per-column theta profiles."""
+    theta = np.array(theta_cols, dtype=float).T[:, None, :]
+    height = np.broadcast_to(np.asarray(z)[:, None, None], theta.shape).copy()
+    return theta, height
+
+
+def test_isentrope_lid_interpolates_and_masks():
+    theta, height = _column_stack([
+        [270.0, 272.0, 276.0, 280.0],  # crosses 274 K halfway between 1700 and 1900 m
+        [275.0, 276.0, 277.0, 278.0],  # ground already above theta_iso: no pool
+        [268.0, 269.0, 270.0, 271.0],  # never reaches theta_iso
+        [270.0, 272.0, 276.0, 280.0],  # lid below the terrain surface
+    ])
+    terrain = np.array([[1450.0, 1450.0, 1450.0, 1850.0]])
+    lid = isentrope_lid(theta, height, terrain, 274.0)
+    np.testing.assert_allclose(lid[0, 0], 1800.0)
+    assert np.isnan(lid[0, 1:]).all()
+
+
+def test_isentrope_lid_respects_max_depth():
+    theta, height = _column_stack([[270.0, 272.0, 276.0, 280.0]])
+    terrain = np.array([[1450.0]])
+    assert np.isnan(isentrope_lid(theta, height, terrain, 274.0, max_depth_m=100.0)).all()
+
+
+def test_plot_coldpool_3d_leaves_lid_untouched(tmp_path):
+    lat, lon = np.meshgrid(np.linspace(40.0, 40.2, 8), np.linspace(-110.2, -110.0, 9),
+                           indexing="ij")
+    terrain = 1500.0 + 50.0 * np.arange(8)[:, None] + np.zeros((8, 9))
+    lid = np.full((8, 9), 1700.0)
+    lid[0, 0] = np.nan
+    before = lid.copy()
+    out = plot_coldpool_3d(lon, lat, terrain, lid, tmp_path / "cp.png",
+                           theta_iso=274.0, title="smoke", dpi=60)
+    assert out.exists()
+    np.testing.assert_array_equal(lid, before)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import logging
+
 import numpy as np
+import pytest
 
 from brc_tools.visualize.grid import (
+    block_mean,
+    clabel_for,
+    clabel_if_sparse,
+    contour_vertex_count,
+    fill_array,
+    interp_columns,
+    pixel_coarsen_factor,
     plot_grid_field,
     plot_vertical_section,
     terrain_contour_levels,
+    view_window,
 )
 
 
@@ -68,3 +79,156 @@ def test_plot_vertical_section_writes_png(tmp_path, monkeypatch) -> None:
     assert result == out
     assert out.exists()
     assert out.stat().st_size > 0
+
+
+def test_pixel_coarsen_factor_only_when_grid_outruns_pixels() -> None:
+    assert pixel_coarsen_factor((120, 160), (1140.0, 1350.0)) == 1
+    assert pixel_coarsen_factor((1059, 1799), (500.0, 800.0)) == 2
+
+
+def test_block_mean_trims_edges_and_skips_nan() -> None:
+    values = np.arange(20.0).reshape(4, 5)
+    values[0, 0] = np.nan
+
+    out = block_mean(values, 2)
+
+    assert out.shape == (2, 2)
+    assert out[0, 0] == np.mean([1.0, 5.0, 6.0])
+    assert out[1, 1] == np.mean([12.0, 13.0, 17.0, 18.0])
+
+
+def test_block_mean_keeps_float32_and_promotes_integers():
+    from brc_tools.visualize.grid import block_mean
+
+    assert block_mean(np.ones((4, 4), dtype=np.float32), 2).dtype == np.float32
+    assert block_mean(np.ones((4, 4), dtype=np.int16), 2).dtype == np.float64
+
+
+def test_fill_array_is_float32_and_reuses_float32_input():
+    wrf = np.ones((3, 4), dtype=np.float32)
+    assert fill_array(wrf) is wrf
+    assert fill_array(np.ones((3, 4))).dtype == np.float32
+
+
+def test_view_window_covers_extent_with_one_cell_margin() -> None:
+    lon2d, lat2d = np.meshgrid(np.arange(-112.0, -108.0, 0.5), np.arange(39.0, 42.0, 0.5))
+    rows, cols = view_window(lon2d, lat2d, (-110.6, -109.4, 40.1, 40.9))
+    assert lat2d[rows, 0].tolist() == [40.0, 40.5, 41.0]
+    assert lon2d[0, cols].tolist() == [-111.0, -110.5, -110.0, -109.5, -109.0]
+    assert view_window(lon2d, lat2d, (0.0, 1.0, 0.0, 1.0)) == (slice(None), slice(None))
+
+
+def test_clabel_if_sparse_skips_dense_contours() -> None:
+    from matplotlib.figure import Figure
+
+    ax = Figure().subplots()
+    y, x = np.mgrid[0:1:40j, 0:1:40j]
+    smooth = ax.contour(x, y, x + y, levels=[0.5, 1.0])
+    rng = np.random.default_rng(0)
+    noisy = ax.contour(x, y, rng.normal(size=x.shape), levels=[-1.0, 0.0, 1.0])
+
+    assert contour_vertex_count(noisy) > contour_vertex_count(smooth)
+    assert clabel_if_sparse(ax, smooth, fmt="%.1f")
+    assert len(smooth.labelTexts) == 2
+    budget = contour_vertex_count(noisy) - 1
+    assert not clabel_if_sparse(ax, noisy, max_vertices=budget)
+    assert not getattr(noisy, "labelTexts", [])
+
+
+def test_clabel_for_only_guards_the_sparse_mode(monkeypatch, caplog) -> None:
+    from matplotlib.figure import Figure
+
+    monkeypatch.setattr(clabel_if_sparse, "__kwdefaults__", {"max_vertices": 0})
+    ax = Figure().subplots()
+    y, x = np.mgrid[0:1:40j, 0:1:40j]
+
+    labelled = ax.contour(x, y, x + y, levels=[0.5, 1.0])
+    assert clabel_for(ax, labelled, True, fmt="%.1f")
+    assert len(labelled.labelTexts) == 2
+
+    unlabelled = ax.contour(x, y, x + y, levels=[0.5, 1.0])
+    assert not clabel_for(ax, unlabelled, False)
+    with caplog.at_level(logging.INFO, logger="brc_tools.visualize.grid"):
+        assert not clabel_for(ax, unlabelled, "sparse")
+    assert not getattr(unlabelled, "labelTexts", [])
+    assert "Skipping contour labels" in caplog.text
+
+    with pytest.raises(ValueError, match="label_contours"):
+        clabel_for(ax, unlabelled, "dense")
+
+
+def test_publication_renderers_label_dense_contours(tmp_path, monkeypatch) -> None:
+    from matplotlib.axes import Axes
+
+    # The frozen grid renderers keep their labels however dense the field is.
+    monkeypatch.setattr(clabel_if_sparse, "__kwdefaults__", {"max_vertices": 0})
+    calls = []
+    monkeypatch.setattr(Axes, "clabel", lambda self, cs, *a, **k: calls.append(cs))
+    distance = np.linspace(0.0, 40.0, 20)
+    height = np.tile(np.linspace(0.0, 2500.0, 12).reshape(-1, 1), (1, distance.size))
+    plot_vertical_section(distance, height, 290.0 + height / 600.0,
+                          tmp_path / "section.png", title="t", colorbar_label="K")
+    assert len(calls) == 1
+
+
+def _interp_columns_reference(field, z, heights, fill_below):
+    out = np.full((heights.size, field.shape[1]), np.nan)
+    for i in range(field.shape[1]):
+        m = np.isfinite(z[:, i]) & np.isfinite(field[:, i])
+        if m.sum() >= 2:
+            order = np.argsort(z[m, i])
+            zz, ff = z[m, i][order], field[m, i][order]
+            out[:, i] = np.interp(heights, zz, ff,
+                                  left=ff[0] if fill_below else np.nan, right=np.nan)
+    return out
+
+
+def test_interp_columns_matches_per_column_np_interp() -> None:
+    rng = np.random.default_rng(3)
+    nz, n = 12, 40
+    # descending isobaric order, uneven spacing, per-column offsets
+    z = np.sort(rng.uniform(1000.0, 6000.0, (nz, n)), axis=0)[::-1]
+    field = rng.normal(280.0, 5.0, (nz, n))
+    field[-3:, :10] = np.nan  # below-ground levels at the bottom of some columns
+    field[:, 20] = np.nan  # an empty column
+    field[5, 25] = np.nan  # an interior gap
+    heights = np.concatenate([np.linspace(0.0, 7000.0, 71), z[4, :3]])  # exact hits too
+
+    for fill in (False, True):
+        np.testing.assert_allclose(
+            interp_columns(field, z, heights, fill_below=fill),
+            _interp_columns_reference(field, z, heights, fill),
+            rtol=1e-12, equal_nan=True,
+        )
+
+
+def test_interp_columns_finite_field_with_missing_heights() -> None:
+    # A field finite everywhere takes the no-re-rank path; NaN heights must still
+    # drop out of the bracketing exactly as in the general one.
+    rng = np.random.default_rng(5)
+    z = np.sort(rng.uniform(1000.0, 6000.0, (10, 30)), axis=0)
+    z[:2, :5] = np.nan
+    field = rng.normal(280.0, 5.0, (10, 30))
+    heights = np.linspace(500.0, 6500.0, 50)
+    for fill in (False, True):
+        np.testing.assert_allclose(
+            interp_columns(field, z, heights, fill_below=fill),
+            _interp_columns_reference(field, z, heights, fill),
+            rtol=1e-12, equal_nan=True,
+        )
+
+
+def test_interp_columns_stack_matches_single_fields() -> None:
+    rng = np.random.default_rng(4)
+    z = np.sort(rng.uniform(1000.0, 6000.0, (10, 25)), axis=0)
+    fields = rng.normal(size=(3, 10, 25))
+    fields[1, :4, :8] = np.nan  # each field masks different samples
+    fields[2, 6, :] = np.nan
+    heights = np.linspace(500.0, 6500.0, 40)
+
+    stacked = interp_columns(fields, z, heights, fill_below=True)
+    assert stacked.shape == (3, 40, 25)
+    for one, f in zip(stacked, fields, strict=True):
+        np.testing.assert_array_equal(one, interp_columns(f, z, heights, fill_below=True))
+        np.testing.assert_allclose(one, _interp_columns_reference(f, z, heights, True),
+                                   rtol=1e-12, equal_nan=True)
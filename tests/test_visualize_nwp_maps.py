@@ -62,3 +62,62 @@ def test_section_smoke(tmp_path):
                      terrain2d=ds["terrain_height"].isel(time=0).values,
                      extent=(-112.0, -108.5, 39.9, 41.1), waypoints=_TOWNS))
     assert out.exists() and out.stat().st_size > 0
+
+
+def test_surface_map_pdf_rasterizes_field(tmp_path):
+    out = plot_nwp_surface_map(_synth(), "wind_speed_10m", tmp_path / "map.pdf",
+                               wind_barbs=False, overlays={}, title="pdf")
+    # The shaded field goes in as one embedded image, not a path per grid cell.
+    assert b"/Subtype /Image" in out.read_bytes()
+
+
+def test_surface_map_leaves_no_pyplot_figures(tmp_path):
+    import matplotlib.pyplot as plt
+
+    before = set(plt.get_fignums())
+    plot_nwp_surface_map(_synth(), "wind_speed_10m", tmp_path / "m.png",
+                         wind_barbs=False, title="registry")
+    assert set(plt.get_fignums()) == before
+
+
+def test_surface_map_png_is_exactly_figsize_times_dpi(tmp_path):
+    from PIL import Image
+
+    out = plot_nwp_surface_map(_synth(), "wind_speed_10m", tmp_path / "m.png",
+                               wind_barbs=False, overlays={}, figsize=(6.0, 5.0), dpi=100)
+    assert Image.open(out).size == (600, 500)
+
+
+def test_surface_map_terrain_contour_uses_coarsened_grid(tmp_path, monkeypatch):
+    from matplotlib.axes import Axes
+
+    shapes = []
+    real = Axes.contour
+
+    def _spy(self, x, y, z, *args, **kwargs):
+        shapes.append(np.shape(z))
+        return real(self, x, y, z, *args, **kwargs)
+
+    monkeypatch.setattr(Axes, "contour", _spy)
+    plot_nwp_surface_map(_synth(), "wind_speed_10m", tmp_path / "c.png",
+                         wind_barbs=False, overlays={}, title="coarse", coarsen=2)
+    assert shapes == [(6, 8)]
+
+
+def test_locator_inset_meshes_only_the_extent(monkeypatch):
+    from matplotlib.collections import QuadMesh
+    from matplotlib.figure import Figure
+
+    from brc_tools.visualize import nwp_maps
+
+    monkeypatch.setattr(nwp_maps, "add_reference_overlays", lambda *a, **k: None)
+    ds = _synth(ny=40, nx=60)
+    sec = extract_nwp_section(ds, (40.3, -111.4), (40.4, -110.9),
+                              [850, 800, 750, 700], n_points=20)
+    ax = Figure().subplots()
+    nwp_maps._geo_locator_inset(ax, sec, dict(
+        lon2d=ds.longitude.values, lat2d=ds.latitude.values,
+        terrain2d=ds["terrain_height"].isel(time=0).values,
+        extent=(-111.6, -110.6, 40.2, 40.6)))
+    mesh = [c for c in ax.child_axes[0].collections if isinstance(c, QuadMesh)][0]
+    assert mesh.get_array().size < 40 * 60 / 4
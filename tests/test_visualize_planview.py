@@ -0,0 +1,275 @@
+"""Tests for brc_tools.visualize.planview map helpers (no shapefiles needed)."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import cartopy.crs as ccrs
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from shapely.geometry import LineString
+
+from brc_tools.visualize import planview
+
+
+class _FakeNE:
+    """Stand-in for ``NaturalEarthFeature`` that counts bbox intersections."""
+
+    calls = 0
+
+    def __init__(self, category, name, scale, **kwargs):
+        self.name = name
+
+    def intersecting_geometries(self, extent):
+        type(self).calls += 1
+        return iter([LineString([(-111.0, 40.0), (-109.0, 40.5)])])
+
+
+@pytest.fixture(autouse=True)
+def _offline_features(monkeypatch):
+    """No shapefile reads, and no feature cached by one test leaking into the next."""
+    monkeypatch.setattr(planview.cfeature, "NaturalEarthFeature", _FakeNE)
+    _FakeNE.calls = 0
+    planview._clipped_feature.cache_clear()
+    planview._ne_feature.cache_clear()
+    yield
+    planview._clipped_feature.cache_clear()
+    planview._ne_feature.cache_clear()
+
+
+def _grid(ny=7, nx=9):
+    """A small 0..360 lon/lat mesh over the basin, ``(lon, lat)``."""
+    return np.meshgrid(np.linspace(249.0, 251.0, nx), np.linspace(39.5, 41.0, ny))
+
+
+def _planview_ds(temp, **extra):
+    """HRRR-like ``(time, y, x)`` dataset of ``temp_2m`` plus any ``extra`` fields."""
+    import xarray as xr
+
+    nt, ny, nx = temp.shape
+    lon, lat = _grid(ny, nx)
+    dims = ("time", "y", "x")
+    data = {"temp_2m": (dims, temp), **{k: (dims, v) for k, v in extra.items()}}
+    times = (np.datetime64("2025-02-22T16", "ns")
+             + np.arange(nt) * np.timedelta64(1, "h"))
+    return xr.Dataset(data, coords={"time": times, "latitude": (("y", "x"), lat),
+                                    "longitude": (("y", "x"), lon)})
+
+
+def test_clipped_feature_intersects_once_per_extent():
+    extent = (-111.5, -108.5, 39.5, 41.0)
+
+    for _ in range(3):
+        fig, ax = plt.subplots(subplot_kw={"projection": ccrs.PlateCarree()})
+        planview.add_map_features(ax, states=True, counties=True, extent=extent)
+        plt.close(fig)
+
+    assert _FakeNE.calls == 2  # one per layer, not per figure
+
+
+def test_data_extent_is_hashable_and_ordered():
+    lon, lat = np.meshgrid([-111.0, -110.0, -109.0], [40.0, 41.0])
+    ext = planview._data_extent(lon, lat)
+    assert ext == (-111.0, -109.0, 40.0, 41.0)
+    hash(ext)
+
+
+def test_terrain_fill_is_a_single_quadmesh():
+    from matplotlib.collections import QuadMesh
+
+    lon, lat = np.meshgrid(np.linspace(-111, -109, 20), np.linspace(39.5, 41, 15))
+    terrain = 1400.0 + 400.0 * np.sin(lon) * np.cos(lat)
+    fig, ax = plt.subplots(subplot_kw={"projection": ccrs.PlateCarree()})
+    planview.add_map_features(ax, states=False, terrain=terrain,
+                              terrain_lonlat=(lon, lat))
+    meshes = [c for c in ax.collections if isinstance(c, QuadMesh)]
+    assert len(meshes) == 1
+    plt.close(fig)
+
+
+def test_coarsen_grid_block_means_data_and_coords():
+    import xarray as xr
+
+    lon, lat = np.meshgrid(np.linspace(249.0, 251.0, 9), np.linspace(39.5, 41.0, 7))
+    ds = xr.Dataset({"t2m": (("y", "x"), np.arange(63.0).reshape(7, 9))},
+                    coords={"latitude": (("y", "x"), lat),
+                            "longitude": (("y", "x"), lon)})
+    out = planview._coarsen_grid(ds, 2, "t2m")
+    assert out["t2m"].shape == (3, 4)
+    assert out["latitude"].shape == (3, 4)
+    np.testing.assert_allclose(out["t2m"].values[0, 0], np.mean([0, 1, 9, 10]))
+    np.testing.assert_allclose(out["longitude"].values[0, 0], lon[0, :2].mean())
+    assert planview._coarsen_grid(ds, 1, "t2m") is ds
+
+
+def test_coarsen_grid_handles_a_regular_1d_latlon_grid():
+    import xarray as xr
+
+    lon1d, lat1d = np.linspace(249.0, 251.0, 9), np.linspace(39.5, 41.0, 7)
+    ds = xr.Dataset({"t2m": (("latitude", "longitude"), np.arange(63.0).reshape(7, 9))},
+                    coords={"latitude": lat1d, "longitude": lon1d})
+    out = planview._coarsen_grid(ds, 2, "t2m")
+    assert out["t2m"].shape == (3, 4)
+    np.testing.assert_allclose(out["latitude"].values, lat1d[:6].reshape(3, 2).mean(1))
+    np.testing.assert_allclose(out["longitude"].values, lon1d[:8].reshape(4, 2).mean(1))
+
+
+def test_plot_planview_draws_float32_mesh_from_needed_vars_only():
+    from matplotlib.collections import QuadMesh
+
+    ds = _planview_ds(np.full((2, 7, 9), 270.0), mslp=np.full((2, 7, 9), 1.0e5),
+                      unused=np.zeros((2, 7, 9)))
+    ax = planview.plot_planview(ds, "temp_2m", time_idx=1, coarsen=2)
+    mesh = next(c for c in ax.collections if isinstance(c, QuadMesh))
+    assert mesh.get_array().dtype == np.float32
+    assert mesh.get_array().shape == (3, 4)
+    assert ax.projection is planview._PLATE_CARREE  # one CRS for every figure
+    plt.close(ax.figure)
+
+
+def test_project_grid_matches_axes_crs():
+    lon, lat = np.meshgrid([-111.0, -110.0], [40.0, 41.0])
+    fig, ax = plt.subplots(subplot_kw={"projection": ccrs.LambertConformal(
+        central_longitude=-110.0, standard_parallels=(40.0, 41.0))})
+    gx, gy = planview._project_grid(ax, lon, lat)
+    ref = ax.projection.transform_point(-111.0, 41.0, ccrs.PlateCarree())
+    np.testing.assert_allclose((gx[1, 0], gy[1, 0]), ref)
+    plt.close(fig)
+
+
+def test_project_grid_meshes_1d_coordinates_of_a_regular_grid():
+    lon1d, lat1d = np.array([-111.0, -110.5, -110.0]), np.array([40.0, 41.0])
+    fig, ax = plt.subplots(subplot_kw={"projection": ccrs.LambertConformal(
+        central_longitude=-110.0, standard_parallels=(40.0, 41.0))})
+    gx, gy = planview._project_grid(ax, lon1d, lat1d)
+    assert gx.shape == gy.shape == (2, 3)
+    ref = ax.projection.transform_point(-110.5, 41.0, ccrs.PlateCarree())
+    np.testing.assert_allclose((gx[1, 1], gy[1, 1]), ref)
+    plt.close(fig)
+
+
+def test_transform_lonlat_threaded_matches_cartopy(monkeypatch):
+    proj = ccrs.LambertConformal(central_longitude=-110.0)
+    lon, lat = np.meshgrid(np.linspace(-112, -108, 30), np.linspace(39, 42, 20))
+    monkeypatch.setattr(planview, "_THREADED_POINTS", 100)
+    monkeypatch.setattr(planview.os, "cpu_count", lambda: 4)
+    gx, gy = planview._transform_lonlat(proj, lon, lat)
+    ref = proj.transform_points(ccrs.PlateCarree(), lon, lat)
+    assert gx.shape == lon.shape
+    np.testing.assert_allclose(gx, ref[..., 0])
+    np.testing.assert_allclose(gy, ref[..., 1])
+
+    gx1, gy1 = planview._transform_lonlat(proj, lon[0], lat[:, 0])  # 1-D axes
+    np.testing.assert_allclose(gx1, gx)
+    np.testing.assert_allclose(gy1, gy)
+
+
+def test_planview_evolution_uses_constrained_layout():
+    ds = _planview_ds(270.0 + np.random.rand(2, 7, 9))
+    fig = planview.plot_planview_evolution(ds, "temp_2m", ncols=2, suptitle="t")
+    assert fig.get_layout_engine().__class__.__name__ == "ConstrainedLayoutEngine"
+    plt.close(fig)
+
+
+def test_planview_evolution_shared_bounds_fill_only_missing_limits():
+    from matplotlib.collections import QuadMesh
+
+    vals = np.arange(200.0, dtype=float).reshape(2, 10, 10)
+    vals[0, 0, 0] = np.nan
+    ds = _planview_ds(vals)
+    fig = planview.plot_planview_evolution(ds, "temp_2m", ncols=2, vmin=-5.0)
+    meshes = [c for ax in fig.axes for c in ax.collections if isinstance(c, QuadMesh)]
+    hi = float(np.nanpercentile(vals, 98))
+    assert meshes and all(m.get_clim() == (-5.0, hi) for m in meshes)
+    plt.close(fig)
+
+
+def test_plot_planview_contour_labels_are_optional():
+    lon, _ = _grid()
+    ds = _planview_ds(np.full((1, 7, 9), 270.0), mslp=(1.0e5 + 100.0 * lon)[None])
+    counts = {}
+    for label in (True, False):
+        ax = planview.plot_planview(ds, "temp_2m", contour_var="mslp",
+                                    label_contours=label)
+        counts[label] = len(ax.texts)
+        plt.close(ax.figure)
+    assert counts[True] > counts[False] == 0
+
+
+def test_terrain_mesh_is_drawn_in_axes_coordinates():
+    from matplotlib.collections import QuadMesh
+
+    lon, lat = np.meshgrid(np.linspace(-111, -109, 20), np.linspace(39.5, 41, 15))
+    fig, ax = plt.subplots(subplot_kw={"projection": ccrs.LambertConformal(
+        central_longitude=-110.0, standard_parallels=(40.0, 41.0))})
+    planview.add_map_features(ax, states=False, terrain=1500.0 + 0.0 * lon,
+                              terrain_lonlat=(lon, lat))
+    mesh = next(c for c in ax.collections if isinstance(c, QuadMesh))
+    # mesh vertices are already Lambert metres, not degrees awaiting reprojection
+    assert np.abs(mesh.get_coordinates()).max() > 1.0e4
+    plt.close(fig)
+
+
+def test_unclipped_features_are_built_once_per_layer(monkeypatch):
+    built = []
+
+    class _CountingNE(_FakeNE):
+        def __init__(self, category, name, scale, **kwargs):
+            built.append(name)
+            super().__init__(category, name, scale, **kwargs)
+
+    monkeypatch.setattr(planview.cfeature, "NaturalEarthFeature", _CountingNE)
+    for _ in range(3):
+        fig, ax = plt.subplots(subplot_kw={"projection": ccrs.PlateCarree()})
+        planview.add_map_features(ax, states=True, counties=True)
+        plt.close(fig)
+    assert sorted(built) == ["admin_1_states_provinces_lakes", "admin_2_counties"]
+
+
+def test_plot_planview_pdf_carries_the_field_as_an_image(tmp_path):
+    ds = _planview_ds(270.0 + np.random.rand(1, 7, 9))
+    ax = planview.plot_planview(ds, "temp_2m")
+    out = tmp_path / "pv.pdf"
+    ax.figure.savefig(out)
+    plt.close(ax.figure)
+    assert b"/Subtype /Image" in out.read_bytes()
+
+
+def test_wide_extents_use_the_50m_natural_earth_scale(monkeypatch):
+    scales = []
+
+    class _ScaleNE(_FakeNE):
+        def __init__(self, category, name, scale, **kwargs):
+            scales.append((name, scale))
+            super().__init__(category, name, scale, **kwargs)
+
+    monkeypatch.setattr(planview.cfeature, "NaturalEarthFeature", _ScaleNE)
+    fig, ax = plt.subplots(subplot_kw={"projection": ccrs.PlateCarree()})
+    planview.add_map_features(ax, states=True, counties=True,
+                              extent=(-125.0, -66.0, 24.0, 50.0))
+    plt.close(fig)
+    assert sorted(scales) == [("admin_1_states_provinces_lakes", "50m"),
+                              ("admin_2_counties", "10m")]
+    assert planview._ne_scale((-111.5, -108.5, 39.5, 41.0)) == "10m"
+
+
+def test_project_grid_reuses_the_last_projection(monkeypatch):
+    lon, lat = np.meshgrid(np.linspace(-111, -109, 6), np.linspace(39.5, 41, 4))
+    calls = []
+    real = planview._transform_lonlat
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(planview, "_transform_lonlat", counting)
+    planview._projections.clear()
+    fig, axes = plt.subplots(1, 2, subplot_kw={"projection": ccrs.PlateCarree()})
+    first = planview._project_grid(axes[0], lon, lat)
+    second = planview._project_grid(axes[1], lon.copy(), lat.copy())
+    assert len(calls) == 1 and second[0] is first[0]
+    planview._project_grid(axes[1], lon + 0.5, lat)
+    assert len(calls) == 2
+    plt.close(fig)
+    planview._projections.clear()
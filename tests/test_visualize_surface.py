@@ -8,6 +8,7 @@ import numpy as np
 from _wrf_synthetic import make_synthetic_wrf
 
 from brc_tools.nwp import wrf_output as wo
+from brc_tools.visualize.grid import view_window
 from brc_tools.visualize.style import get_style
 from brc_tools.visualize.surface import plot_domain_panels, plot_field_difference
 from brc_tools.visualize.timeseries import plot_scalar_timeseries
@@ -40,6 +41,16 @@ def test_plot_domain_panels_writes_png(tmp_path, monkeypatch):
     assert out.exists() and out.stat().st_size > 0
 
 
+def test_plot_domain_panels_leaves_no_pyplot_figures(tmp_path):
+    import matplotlib.pyplot as plt
+
+    ds = make_synthetic_wrf(nz=4, ny=10, nx=10)
+    before = set(plt.get_fignums())
+    plot_domain_panels([_panel(ds, "d01")], tmp_path / "one.png",
+                       style=get_style("theta_2m"), suptitle="one")
+    assert set(plt.get_fignums()) == before
+
+
 def test_plot_field_difference_writes_png(tmp_path, monkeypatch):
     monkeypatch.setenv("MPLCONFIGDIR", str(tmp_path / "mpl"))
     ds = make_synthetic_wrf(nz=4, ny=10, nx=10)
@@ -67,3 +78,28 @@ def test_plot_scalar_timeseries_writes_png(tmp_path, monkeypatch):
     plot_scalar_timeseries(series, out, ylabel="heat deficit (J m-2)", title="cold pool")
 
     assert out.exists() and out.stat().st_size > 0
+
+
+def test_cropped_panel_keeps_the_full_grid_arrow_lattice(tmp_path, monkeypatch):
+    from matplotlib.axes import Axes
+
+    lon, lat = np.meshgrid(np.linspace(-111.0, -108.0, 88), np.linspace(39.0, 41.0, 66))
+    panel = {"label": "d01", "lon": lon, "lat": lat, "field": lon + lat,
+             "u": np.ones_like(lon), "v": np.ones_like(lon)}
+    drawn = []
+
+    def fake_quiver(self, x, y, *args, **kwargs):
+        drawn.append(set(zip(np.ravel(x).tolist(), np.ravel(y).tolist(), strict=True)))
+
+    monkeypatch.setattr(Axes, "quiver", fake_quiver)
+    plot_domain_panels([panel], tmp_path / "full.png", style=get_style("theta_2m"),
+                       wind=True, suptitle="full")
+    plot_domain_panels([panel], tmp_path / "crop.png", style=get_style("theta_2m"),
+                       wind=True, suptitle="crop", extent=(-110.3, -109.1, 39.6, 40.4))
+    full, crop = drawn
+    rows, cols = view_window(lon, lat, (-110.3, -109.1, 39.6, 40.4))
+    x0, x1 = lon[0, cols][[0, -1]]
+    y0, y1 = lat[rows, 0][[0, -1]]
+    inside = {(x, y) for x, y in full if x0 <= x <= x1 and y0 <= y <= y1}
+    assert crop and crop <= full
+    assert inside <= crop
@@ -0,0 +1,34 @@
+"""Tests for brc_tools.visualize.timeseries NWP-vs-obs panels."""
+
+import datetime as dt
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+
+from brc_tools.visualize.timeseries import plot_verification_timeseries
+
+
+def test_verification_error_band_interpolates_nwp_to_obs_times():
+    t0 = dt.datetime(2025, 2, 22, 12)
+    nwp = pl.DataFrame({
+        "waypoint": ["vernal"] * 3,
+        "valid_time": [t0 + dt.timedelta(hours=h) for h in (0, 1, 2)],
+        "temp_2m": [0.0, 10.0, 20.0],
+    })
+    obs = pl.DataFrame({
+        "waypoint": ["vernal"] * 2,
+        "valid_time": [t0 + dt.timedelta(minutes=30), t0 + dt.timedelta(minutes=90)],
+        "temp_2m": [4.0, 16.0],
+    })
+    ax = plot_verification_timeseries(nwp, obs, "temp_2m", "vernal")
+    band = ax.collections[-1]  # fill_between goes on last
+    ys = band.get_paths()[0].vertices[:, 1]
+    # NWP interpolated to the obs times is 5 and 15 -> the band spans obs..nwp
+    assert np.isclose(ys.min(), 4.0) and np.isclose(ys.max(), 16.0)
+    assert np.any(np.isclose(ys, 5.0)) and np.any(np.isclose(ys, 15.0))
+    plt.close(ax.figure)
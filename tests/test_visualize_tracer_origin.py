@@ -36,9 +36,10 @@ class TestPalette:
             r, g, b = (int(hexcode[i:i + 2], 16) for i in (1, 3, 5))
             assert max(r, g, b) - min(r, g, b) > 40, hexcode
 
-    def test_it_warns_rather_than_silently_reusing_a_colour(self, capsys):
-        colours = tro.source_colours(len(tro.SOURCE_COLOURS) + 2)
-        assert "WARN" in capsys.readouterr().out
+    def test_it_warns_rather_than_silently_reusing_a_colour(self, caplog):
+        with caplog.at_level("WARNING", logger=tro.LOG.name):
+            colours = tro.source_colours(len(tro.SOURCE_COLOURS) + 2)
+        assert "share a colour" in caplog.text
         assert colours[0] == colours[len(tro.SOURCE_COLOURS)]
 
 
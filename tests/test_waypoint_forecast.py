@@ -101,3 +101,16 @@ def test_unknown_group_raises(basin_dataset):
             init_time=dt.datetime(2026, 4, 24, 12, 0),
             forecast_hours=[0],
         )
+
+
+def test_valid_times_iso_formats_nanosecond_steps():
+    from brc_tools.nwp.point_extract import valid_times_iso
+
+    times = np.array(["2026-04-24T12:00:00.000000000", "2026-04-24T13:30:00.5"],
+                     dtype="datetime64[ns]")
+    ds = xr.Dataset(coords={"time": times})
+    assert valid_times_iso(ds) == ["2026-04-24T12:00:00Z", "2026-04-24T13:30:00Z"]
+    assert valid_times_iso(xr.Dataset()) == []
+    gap = xr.Dataset(coords={"time": np.array(["2026-04-24T12:00", "NaT"],
+                                              dtype="datetime64[ns]")})
+    assert valid_times_iso(gap) == ["2026-04-24T12:00:00Z", None]
@@ -99,6 +99,13 @@ class TestCloud:
         assert layers["mid"].max() == pytest.approx(0.0)
         assert layers["high"].max() == pytest.approx(0.0)
 
+    def test_float32_input_is_not_upcast_and_gives_the_same_answer(self, ds):
+        """WRF writes CLDFRA as float32; thresholding it needs no float64 copy."""
+        ds32 = ds.assign(CLDFRA=ds["CLDFRA"].astype(np.float32))
+        np.testing.assert_array_equal(wd.cloud_base_agl(ds32), wd.cloud_base_agl(ds))
+        np.testing.assert_array_equal(wd.ceiling_agl(ds32), wd.ceiling_agl(ds))
+        assert wd.cloud_fraction_layers(ds32)["low"].dtype == np.float32
+
 
 class TestHumidity:
     def test_saturated_air_is_a_hundred_percent(self):
@@ -334,6 +334,38 @@ class TestFigureLedger:
         led.emit(tmp_path / "b.png", self._ok(), family="beam")
         assert (led.rendered, led.errors) == (1, 1)
 
+    def test_webp_format_re_encodes_the_png_and_drops_it(self, tmp_path):
+        from PIL import Image
+
+        def render(path):
+            Image.new("RGB", (8, 6), "white").save(path)
+
+        led = we.FigureLedger(image_format="webp")
+        assert led.emit(tmp_path / "a.png", render, family="surface") == 1
+        assert not (tmp_path / "a.png").exists()
+        with Image.open(tmp_path / "a.webp") as im:
+            assert im.format == "WEBP" and im.size == (8, 6)
+        assert led.records[0].path.endswith("a.webp")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.webp"]
+
+    def test_webp_format_leaves_an_earlier_png_alone(self, tmp_path):
+        from PIL import Image
+
+        def render(path):
+            Image.new("RGB", (8, 6), "white").save(path)
+
+        earlier = tmp_path / "a.png"
+        earlier.write_text("from a png run")
+        led = we.FigureLedger(image_format="webp")
+        assert led.emit(earlier, self._boom, family="surface") == 0
+        assert led.emit(earlier, render, family="surface") == 1
+        assert earlier.read_text() == "from a png run"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.png", "a.webp"]
+
+    def test_an_unknown_image_format_is_refused(self):
+        with pytest.raises(ValueError, match="image_format"):
+            we.FigureLedger(image_format="gif")
+
     # -- idempotence (gap 1) ------------------------------------------------ #
     def test_without_skip_existing_it_re_renders(self, tmp_path):
         out, src = tmp_path / "a.png", tmp_path / "wrfout"
@@ -59,6 +59,54 @@ def test_nearest_column_index(ds):
     assert wo.nearest_column_index(ds, 40.5, -109.6) == (5, 4)
 
 
+def test_temperature_k_reuses_supplied_theta_and_pressure(ds):
+    theta, p = wo.potential_temperature(ds), wo.pressure_pa(ds)
+    expected = theta * (p / wo.P0) ** wo.RCP
+    np.testing.assert_allclose(wo.temperature_k(ds), expected, rtol=1e-12)
+    np.testing.assert_allclose(wo.temperature_k(ds, theta=theta, pressure=p), expected,
+                               rtol=1e-12)
+    # the caller's arrays are inputs, not scratch space
+    np.testing.assert_array_equal(p, wo.pressure_pa(ds))
+
+
+def test_temperature_k_keeps_the_wider_input_precision(ds):
+    theta, p = wo.potential_temperature(ds).astype(np.float64), wo.pressure_pa(ds)
+    out = wo.temperature_k(ds, theta=theta, pressure=p.astype(np.float32))
+    assert out.dtype == np.float64
+    np.testing.assert_allclose(
+        out, theta * (p.astype(np.float32).astype(np.float64) / wo.P0) ** wo.RCP,
+        rtol=1e-12)
+
+
+def test_theta_2m_derives_from_t2_and_psfc_without_th2(ds):
+    bare = ds.drop_vars("TH2")
+    t2, psfc = wo.surface_field(bare, "T2"), wo.surface_field(bare, "PSFC")
+    np.testing.assert_allclose(wo.theta_2m(bare), t2 * (wo.P0 / psfc) ** wo.RCP,
+                               rtol=1e-6)
+
+
+def test_theta_2m_keeps_the_wider_input_precision(ds):
+    bare = ds.drop_vars("TH2")
+    bare["T2"] = bare["T2"].astype(np.float64)
+    bare["PSFC"] = bare["PSFC"].astype(np.float32)
+    t2, psfc = wo.surface_field(bare, "T2"), wo.surface_field(bare, "PSFC")
+    out = wo.theta_2m(bare)
+    assert out.dtype == np.float64
+    np.testing.assert_allclose(out, t2 * (wo.P0 / psfc.astype(np.float64)) ** wo.RCP,
+                               rtol=1e-12)
+
+
+def test_nearest_column_index_reuses_the_grid_tree(ds):
+    from brc_tools.nwp import section
+
+    section._trees.clear()
+    wo.nearest_column_index(ds, 40.3, -109.7)
+    assert len(section._trees) == 1
+    # another file of the same domain (a later time) hits the same tree
+    assert wo.nearest_column_index(ds.copy(deep=True), 40.5, -109.6) == (5, 4)
+    assert len(section._trees) == 1
+
+
 def test_theta_2m_prefers_TH2(ds):
     np.testing.assert_allclose(wo.theta_2m(ds), 275.0)
 
@@ -218,6 +266,19 @@ def test_transect_deficit_flux_normal_convention():
     np.testing.assert_array_equal(reused.i, tf.i)
 
 
+def test_transect_deficit_flux_derives_only_the_crossed_block():
+    """A short interior line crops the column integral to the block it crosses;
+    the per-column result must match the full-domain field exactly."""
+    ds = make_synthetic_wrf(nz=8, ny=16, nx=16)
+    crest = 1900.0
+    tf = wo.transect_deficit_flux(ds, crest, 40.1, -109.9, 40.3, -109.7)
+    fx, fy = wo.deficit_flux_field(ds, crest)
+    full = wo.integrate_flux_transect(ds, fx, fy, 40.1, -109.9, 40.3, -109.7)
+    assert tf.j.max() - tf.j.min() < ds.sizes["south_north"] - 1
+    np.testing.assert_allclose(tf.f_normal, full.f_normal, rtol=1e-12)
+    assert tf.total_w == pytest.approx(full.total_w)
+
+
 def test_transect_deficit_flux_zero_length_raises():
     ds = make_synthetic_wrf()
     with pytest.raises(ValueError):
@@ -9,9 +9,11 @@ so the patch target is the source module attribute ``case_study.fetch_obs``.
 from __future__ import annotations
 
 import datetime as dt
+import os
 from pathlib import Path
 
 import polars as pl
+import pytest
 
 from brc_tools.nwp import case_study, wrf_quicklook
 
@@ -62,3 +64,131 @@ def test_obs_sanity_overlay_none_when_empty(tmp_path, monkeypatch):
         )
         is None
     )
+
+
+def _write_png(path: Path, region: str | None = None) -> bytes:
+    """A 1x1 PNG, tagged with ``region`` as a quicklook save would tag it."""
+    from PIL import Image, PngImagePlugin
+
+    info = PngImagePlugin.PngInfo()
+    if region is not None:
+        info.add_text("Region", region)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (1, 1)).save(path, pnginfo=info)
+    return path.read_bytes()
+
+
+def test_quicklook_keeps_a_png_newer_than_the_staged_grib(tmp_path):
+    staged = tmp_path / "gefs.grib2"
+    staged.write_bytes(b"not a grib")  # never opened while the PNG is current
+    png = tmp_path / "t" / "tmp_2m_f024.png"
+    before = _write_png(png)  # untagged, as written before the region tag
+    os.utime(staged, (1_000_000, 1_000_000))
+
+    out = wrf_quicklook.quicklook_staged_grib(
+        staged, variable_level="tmp_2m", figure_dir=tmp_path / "t", case="t"
+    )
+    assert out == png and png.read_bytes() == before
+
+    with pytest.raises(EOFError):  # forced: the junk GRIB is actually opened
+        wrf_quicklook.quicklook_staged_grib(
+            staged, variable_level="tmp_2m", figure_dir=tmp_path / "t", case="t",
+            overwrite=True,
+        )
+
+
+def test_quicklook_for_another_region_does_not_reuse_the_png(tmp_path):
+    staged = tmp_path / "gefs.grib2"
+    staged.write_bytes(b"not a grib")
+    png = tmp_path / "t" / "tmp_2m_f024.png"
+    before = _write_png(png, region="uinta_basin_wide")
+    os.utime(staged, (1_000_000, 1_000_000))
+
+    assert wrf_quicklook.quicklook_staged_grib(
+        staged, variable_level="tmp_2m", figure_dir=tmp_path / "t", case="t",
+        region="uinta_basin_wide",
+    ) == png
+    with pytest.raises(EOFError):  # not current for this region, so it is read
+        wrf_quicklook.quicklook_staged_grib(
+            staged, variable_level="tmp_2m", figure_dir=tmp_path / "t", case="t",
+            region="uinta_basin",
+        )
+    assert png.read_bytes() == before
+
+
+def test_quicklook_batch_prefetches_and_skips_failures(tmp_path, monkeypatch):
+    import threading
+
+    loads, renders = [], []
+
+    def fake_load(path, *, fxx, region):
+        loads.append((path, threading.current_thread() is threading.main_thread()))
+        if path == "bad.grib2":
+            raise ValueError("corrupt")
+        return f"ds:{path}", None
+
+    def fake_render(field_ds, valid, out_path, *, variable_level, fxx, case, region,
+                    figure=None):
+        renders.append((field_ds, out_path.name))
+
+    monkeypatch.setattr(wrf_quicklook, "_load_quicklook_field", fake_load)
+    monkeypatch.setattr(wrf_quicklook, "_render_quicklook", fake_render)
+
+    out = wrf_quicklook.quicklook_staged_gribs(
+        [("a.grib2", "tmp_2m"), ("bad.grib2", "weasd_sfc"), ("c.grib2", "tmp_sfc")],
+        figure_dir=tmp_path, case="t",
+    )
+    names = ["tmp_2m_f024.png", "tmp_sfc_f024.png"]
+    assert [p.name for p in out] == names
+    assert renders == [("ds:a.grib2", names[0]), ("ds:c.grib2", names[1])]
+    # every read ran off the render (main) thread
+    assert [p for p, _ in loads] == ["a.grib2", "bad.grib2", "c.grib2"]
+    assert not any(on_main for _, on_main in loads)
+
+
+def test_quicklook_batch_redraws_one_figure_for_fields_on_one_grid(tmp_path, monkeypatch):
+    import numpy as np
+    import xarray as xr
+
+    from brc_tools.visualize import planview
+
+    lon, lat = np.meshgrid(np.linspace(-110.5, -109.0, 8), np.linspace(40.0, 41.0, 6))
+
+    def field(name, scale, shift=0.0):
+        values = scale * np.arange(48.0).reshape(6, 8)
+        return xr.Dataset({name: (("y", "x"), values)},
+                          coords={"latitude": (("y", "x"), lat),
+                                  "longitude": (("y", "x"), lon + shift)})
+
+    fields = {"a.grib2": field("t2m", 1.0), "b.grib2": field("sdwe", 2.0),
+              "c.grib2": field("t", 3.0, shift=1.0)}
+    valid = np.datetime64("2013-01-31T00", "ns")
+    monkeypatch.setattr(wrf_quicklook, "_load_quicklook_field",
+                        lambda path, *, fxx, region: (fields[path], valid))
+    monkeypatch.setattr(planview, "add_map_features", lambda ax, **kw: None)
+    built, real = [], planview.plot_planview
+
+    def spy(*args, **kwargs):
+        built.append(real(*args, **kwargs))
+        return built[-1]
+
+    monkeypatch.setattr(planview, "plot_planview", spy)
+
+    out = wrf_quicklook.quicklook_staged_gribs(
+        [("a.grib2", "tmp_2m"), ("b.grib2", "weasd_sfc"), ("c.grib2", "tmp_sfc")],
+        figure_dir=tmp_path, case="t",
+    )
+    assert [p.name for p in out] == ["tmp_2m_f024.png", "weasd_sfc_f024.png",
+                                     "tmp_sfc_f024.png"]
+    assert all(p.stat().st_size for p in out)
+    from PIL import Image
+
+    for p in out:  # the redrawn PNG is tagged as well as the freshly built ones
+        with Image.open(p) as im:
+            assert im.text["Region"] == "uinta_basin_wide"
+    # b redrew a's figure; c sits on another grid and gets its own
+    assert len(built) == 2
+    mesh = built[0].collections[0]
+    assert mesh.get_clim() == (0.0, 94.0)
+    assert mesh.colorbar.ax.get_xlabel() == "sdwe"
+    assert built[0].get_title().startswith("weasd_sfc")
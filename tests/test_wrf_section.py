@@ -38,6 +38,39 @@ class TestGridSpacing:
             ws.grid_spacing_km(np.array([[40.0]]), np.array([[-110.0]]))
 
 
+def test_section_n_points_scales_with_line_length():
+    # 0.5 deg of latitude is ~55 km: 1.5 samples per 1 km cell, never below 50.
+    a, b = (40.0, -110.0), (40.5, -110.0)
+    assert ws.section_n_points(a, b, 1.0) == 84
+    assert ws.section_n_points(a, b, 10.0) == 50
+    assert ws.section_n_points(a, (42.0, -110.0), 1.0) > 300
+
+
+def test_section_n_points_reaches_the_columns_a_diagonal_crosses():
+    # An isotropic ~1 km grid, and a 100 km line at 45 degrees across it.
+    coslat = np.cos(np.deg2rad(40.3))
+    lon2d, lat2d = np.meshgrid(-110.0 + np.arange(150) / (111.32 * coslat),
+                               40.0 + np.arange(150) / 110.574)
+    spacing = ws.grid_spacing_km(lat2d, lon2d)
+    step = 100.0 / np.sqrt(2.0)
+    a = (40.0 + 20.3 / 110.574, -110.0 + 20.7 / (111.32 * coslat))
+    b = (a[0] + step / 110.574, a[1] + step / (111.32 * coslat))
+
+    def visited(n):
+        lon_line, lat_line, _ = ws._sample_line(a, b, n)
+        jj, ii, _ = ws._nearest_columns(lat2d, lon2d, lat_line, lon_line)
+        return len(set(zip(jj.tolist(), ii.tolist(), strict=True)))
+
+    n = ws.section_n_points(a, b, spacing)
+    assert visited(n) >= 0.9 * visited(50 * n)
+
+
+def test_section_from_plane_sizes_the_line_when_n_points_is_omitted(plane):
+    sec = ws.section_from_plane(plane, INSIDE_A, INSIDE_B)
+    spacing = ws.grid_spacing_km(plane.lat2d, plane.lon2d)
+    assert sec.distance_km.size == ws.section_n_points(INSIDE_A, INSIDE_B, spacing)
+
+
 class TestSectionCoverage:
     def test_a_transect_inside_the_nest_is_fully_covered(self, plane):
         cov = ws.section_coverage(plane, INSIDE_A, INSIDE_B, n_points=50)
@@ -183,3 +216,38 @@ class TestSectionNormalComponent:
         assert sec.offgrid1d.any()
         assert np.isnan(sec.normal2d[:, sec.offgrid1d]).all()
         assert not np.isnan(sec.normal2d[:, ~sec.offgrid1d]).any()
+
+
+def test_extract_reads_only_the_line_window_and_matches_the_full_cut():
+    ds = make_synthetic_wrf(nz=6, ny=24, nx=24, convective=True)
+    window = ws.plane_window(ds, [((40.2, -109.9), (40.3, -109.7))], n_points=30)
+    assert window["south_north"].stop - window["south_north"].start < ds.sizes["south_north"]
+    assert window["west_east"].stop - window["west_east"].start < ds.sizes["west_east"]
+    assert window["west_east_stag"].stop == window["west_east"].stop + 1
+
+    full = ws.section_from_plane(ws.load_plane(ds), (40.2, -109.9), (40.3, -109.7),
+                                 n_points=30)
+    cut = ws.extract_wrf_section(ds, (40.2, -109.9), (40.3, -109.7), n_points=30)
+    for name in ("speed2d", "theta2d", "along2d", "w2d", "height2d", "refl2d"):
+        np.testing.assert_allclose(getattr(cut, name), getattr(full, name))
+    np.testing.assert_array_equal(cut.offgrid1d, full.offgrid1d)
+
+
+def test_repeated_extracts_build_the_full_grid_tree_once(monkeypatch):
+    import scipy.spatial
+
+    from brc_tools.nwp import section
+
+    built = []
+    real = scipy.spatial.cKDTree
+
+    def counting(points):
+        built.append(len(points))
+        return real(points)
+
+    monkeypatch.setattr(scipy.spatial, "cKDTree", counting)
+    section._trees.clear()
+    ds = make_synthetic_wrf(nz=6, ny=24, nx=24)
+    for _ in range(3):
+        ws.extract_wrf_section(ds, (40.2, -109.9), (40.3, -109.7), n_points=30)
+    assert built == [24 * 24]  # no per-call window tree, no full-grid rebuild
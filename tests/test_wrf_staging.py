@@ -123,6 +123,13 @@ def test_canonical_staging_path():
     assert p1.parent.name == "p01"
 
 
+def test_herbie_cache_defaults_beside_the_staging_tree(tmp_path):
+    # same filesystem as the destination, so staging moves are renames
+    assert wrf_staging._herbie_save_dir(None, tmp_path) == tmp_path / ".herbie_cache"
+    assert (tmp_path / ".herbie_cache").is_dir()
+    assert wrf_staging._herbie_save_dir(tmp_path / "c", tmp_path) == tmp_path / "c"
+
+
 def test_sha256_and_size(tmp_path):
     blob = b"hello-grib-bytes" * 100
     f = tmp_path / "x.bin"
@@ -830,6 +837,45 @@ def test_build_contract_rap_only():
     assert c["source_file_counts"] == {"rap_analysis": 1}
 
 
+def test_stage_gfs_soil_warm_rerun_makes_no_herbie_probe(tmp_path, monkeypatch):
+    # The ideal candidate for a 23Z init is the 18Z cycle at f05; once it is
+    # staged, a rerun must take it straight from disk.
+    dest = tmp_path / "ashley" / "gfs_soil" / "gfs_2026042418_f05_pgrb20p25.grib2"
+    dest.parent.mkdir(parents=True)
+    dest.write_bytes(_VALID_GRIB)
+
+    def _no_network(*args, **kwargs):
+        raise AssertionError("Herbie constructed on a warm rerun")
+
+    monkeypatch.setattr(wrf_staging, "Herbie", _no_network)
+    monkeypatch.setenv("BRC_TOOLS_LOCK_DIR", str(tmp_path))
+    staged = wrf_staging.stage_gfs_soil(init="2026-04-24 23:00", output_root=tmp_path,
+                                        case="ashley")
+    assert [Path(sf.local_path) for sf in staged] == [dest]
+    assert staged[0].lead_times == [5] and staged[0].remote_url is None
+
+
+def test_stage_gfs_soil_staged_fallback_still_logs_its_staleness(tmp_path, monkeypatch,
+                                                                 caplog):
+    # Only the 18Z analysis is on disk and nothing valid at init is reachable:
+    # taking the staged file must still flag that it is 5 h stale.
+    dest = tmp_path / "ashley" / "gfs_soil" / "gfs_2026042418_f00_pgrb20p25.grib2"
+    dest.parent.mkdir(parents=True)
+    dest.write_bytes(_VALID_GRIB)
+
+    def _offline(*args, **kwargs):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(wrf_staging, "Herbie", _offline)
+    monkeypatch.setenv("BRC_TOOLS_LOCK_DIR", str(tmp_path))
+    with caplog.at_level(logging.INFO, logger=wrf_staging.LOG.name):
+        staged = wrf_staging.stage_gfs_soil(init="2026-04-24 23:00",
+                                            output_root=tmp_path, case="ashley")
+    assert [Path(sf.local_path) for sf in staged] == [dest]
+    assert "5 h from WRF init" in caplog.text
+    assert "NOT ideal; record this in the gate evidence" in caplog.text
+
+
 def test_build_contract_gfs_only():
     m = build_manifest(
         case="pelican2013_gfs", region="uinta_basin_wide",
@@ -964,6 +1010,20 @@ def test_stage_hrrr_expected_leads_and_valid_times(tmp_path, fake_hrrr_herbie):
     assert Path(by_lead[12].local_path).name == "hrrr_2026022118_f12_nat.grib2"
 
 
+def test_stage_hrrr_threaded_downloads_keep_product_major_order(tmp_path, fake_hrrr_herbie):
+    kw = dict(init="2026-02-21 18:00", leads=[12, 13, 14], products=["nat", "sfc"],
+              case="ashley2026_seiche")
+    serial = stage_hrrr(output_root=tmp_path / "a", herbie_save_dir=tmp_path / "ca",
+                        download_workers=1, **kw)
+    threaded = stage_hrrr(output_root=tmp_path / "b", herbie_save_dir=tmp_path / "cb",
+                          download_workers=6, **kw)
+    order = [(sf.product, sf.lead_times[0]) for sf in serial]
+    assert order == [("nat", 12), ("nat", 13), ("nat", 14),
+                     ("sfc", 12), ("sfc", 13), ("sfc", 14)]
+    assert [(sf.product, sf.lead_times[0]) for sf in threaded] == order
+    assert all(Path(sf.local_path).exists() for sf in threaded)
+
+
 def test_stage_hrrr_skips_existing_cached_file(tmp_path, fake_hrrr_herbie):
     # A present, correct-size (valid-magic) file counts as already staged: no Herbie,
     # no download.
@@ -1094,3 +1154,56 @@ def test_live_nam_single_cycle(tmp_path):
     assert p.exists() and validate_cached_grib(p)
     assert staged[0].source == "nam_analysis"
     assert staged[0].size_bytes > 1_000_000  # a real NAM file, not a stub
+
+
+def test_download_reuses_valid_herbie_cache_file(tmp_path):
+    from brc_tools.nwp.wrf_staging import _download
+
+    class _H:
+        calls = 0
+
+        def __init__(self, path):
+            self.path = path
+
+        def get_localFilePath(self, search=None):
+            return self.path
+
+        def download(self, search=None):
+            type(self).calls += 1
+            self.path.write_bytes(_VALID_GRIB)
+            return self.path
+
+    cached = tmp_path / "subset_abc.grib2"
+    assert _download(_H(cached), search=":TMP:") == cached   # miss -> downloads
+    assert _H.calls == 1
+    assert _download(_H(cached), search=":TMP:") == cached   # hit -> reused
+    assert _H.calls == 1
+
+    cached.write_bytes(b"junk")                               # corrupt -> re-download
+    _download(_H(cached), search=":TMP:")
+    assert _H.calls == 2
+
+
+def test_parse_lead_handles_fcst_strings_and_bare_integers():
+    from brc_tools.nwp.wrf_staging import _parse_lead
+
+    assert _parse_lead("12 hour fcst") == 12
+    assert _parse_lead(" 6 ") == 6
+    assert _parse_lead(24) == 24
+    assert _parse_lead("anl") is None
+
+
+def test_lead_times_from_idx_matches_per_line_parse(tmp_path):
+    from brc_tools.nwp.wrf_staging import _lead_times_from_idx, _parse_lead
+
+    lines = [
+        "1:0:d=2013010100:TMP:2 m above ground:3 hour fcst:ENS=+1",
+        "2:5120:d=2013010100:APCP:surface:0-6 hour acc fcst:ENS=+1",
+        "3:9000:d=2013010100:HGT:surface:anl:",
+        "4:9900:d=2013010100:TMP:2 m above ground:126 hour fcst:",
+    ]
+    idx = tmp_path / "f.grib2.idx"
+    idx.write_text("\n".join(lines) + "\n")
+    expected = sorted({h for h in map(_parse_lead, lines) if h is not None})
+    assert _lead_times_from_idx(idx) == expected == [3, 6, 126]
+    assert _lead_times_from_idx(tmp_path / "missing.idx") == []
@@ -0,0 +1,125 @@
+"""The time-height engine's station loop, driven through ``main``.
+
+The engine is a script, so it is imported by path as in ``test_engine_families``.
+The tslist profiles are synthetic files in ``tmp_path`` and the renderer is
+replaced by a stub, so this covers the read-ahead and the skip bookkeeping, not
+the figure.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+HEADER = (
+    "spotter point              2  1 {prefix}  ( 40.411,-109.511) "
+    "( 208, 169) ( 40.414,-109.512) 1622.9 meters  2025-10-11_23:00:00"
+)
+
+
+@pytest.fixture(scope="module")
+def timeheight():
+    spec = importlib.util.spec_from_file_location("_eng_wrf_timeheight",
+                                                  SCRIPTS / "wrf_timeheight.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _write_profile(run_dir: Path, prefix: str, kind: str, n: int = 6, nlev: int = 5):
+    rows = []
+    for k in range(1, n + 1):
+        levels = [f"{(300.0 if kind == 'TH' else 1650.0) + 10.0 * j:.5f}"
+                  for j in range(nlev)]
+        rows.append(f"  {k * 0.5:.6f}  " + "  ".join(levels))
+    path = run_dir / f"{prefix}.d02.{kind}"
+    path.write_text("\n".join([HEADER.format(prefix=prefix)] + rows) + "\n")
+
+
+def test_main_prefetches_each_station_and_skips_a_missing_file(
+        timeheight, tmp_path, monkeypatch):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for kind in ("PH", "TH"):
+        _write_profile(run_dir, "SPOT", kind)
+    _write_profile(run_dir, "GONE", "TH")  # no .PH: the station is skipped
+    config = tmp_path / "case.toml"
+    config.write_text(
+        f'[case]\nlabel = "t"\nrun_dir = "{run_dir}"\n\n'
+        '[[timeheight]]\nkey = "spot"\nstation = "SPOT"\nfields = ["theta"]\n'
+        'stride_min = 0\n\n'
+        '[[timeheight]]\nkey = "gone"\nstation = "GONE"\nfields = ["theta"]\n'
+    )
+
+    reads, path_calls, drawn = [], [], []
+    real_read, real_paths = timeheight.read_station, timeheight._station_paths
+
+    def spy_read(spec, run_dir, paths=None):
+        reads.append((spec["key"], threading.current_thread() is threading.main_thread()))
+        return real_read(spec, run_dir, paths)
+
+    def spy_paths(spec, run_dir):
+        path_calls.append(spec["key"])
+        return real_paths(spec, run_dir)
+
+    def fake_plot(times, height, values, path, **kwargs):
+        drawn.append((Path(path).name, values.shape))
+        Path(path).write_bytes(b"png")
+
+    monkeypatch.setattr(timeheight, "read_station", spy_read)
+    monkeypatch.setattr(timeheight, "_station_paths", spy_paths)
+    monkeypatch.setattr(timeheight.th, "plot_time_height", fake_plot)
+    monkeypatch.setattr(sys, "argv", ["wrf_timeheight.py", "--config", str(config),
+                                      "--output-dir", str(tmp_path / "out")])
+
+    assert timeheight.main() == 0
+
+    # both stations were read ahead on the worker, and each path list built once
+    assert reads == [("spot", False), ("gone", False)]
+    assert sorted(path_calls) == ["gone", "spot"]
+    assert drawn == [("timeheight_theta_SPOT_d02.png", (6, 5))]
+    manifest = json.loads(next((tmp_path / "out").rglob("*.json")).read_text())
+    statuses = {(f["var"], f["status"]) for f in manifest["figures"]}
+    assert ("spot_theta", "rendered") in statuses
+    assert ("gone", "absent") in statuses
+
+
+def test_main_reports_a_station_less_entry_and_renders_the_rest(
+        timeheight, tmp_path, monkeypatch):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    for kind in ("PH", "TH"):
+        _write_profile(run_dir, "SPOT", kind)
+    config = tmp_path / "case.toml"
+    config.write_text(
+        f'[case]\nlabel = "t"\nrun_dir = "{run_dir}"\n\n'
+        '[[timeheight]]\nkey = "nostation"\nfields = ["theta"]\n\n'
+        '[[timeheight]]\nkey = "spot"\nstation = "SPOT"\nfields = ["theta"]\n'
+        'stride_min = 0\n'
+    )
+
+    drawn = []
+
+    def fake_plot(times, height, values, path, **kwargs):
+        drawn.append(Path(path).name)
+        Path(path).write_bytes(b"png")
+
+    monkeypatch.setattr(timeheight.th, "plot_time_height", fake_plot)
+    monkeypatch.setattr(sys, "argv", ["wrf_timeheight.py", "--config", str(config),
+                                      "--output-dir", str(tmp_path / "out")])
+
+    assert timeheight.main() == 1  # the bad entry is an error, not a crash
+
+    assert drawn == ["timeheight_theta_SPOT_d02.png"]
+    manifest = json.loads(next((tmp_path / "out").rglob("*.json")).read_text())
+    statuses = {(f["var"], f["status"]) for f in manifest["figures"]}
+    assert ("nostation", "error") in statuses
+    assert ("spot_theta", "rendered") in statuses
@@ -13,6 +13,7 @@ import numpy as np
 import pytest
 from _wrf_synthetic import make_synthetic_wrf
 
+from brc_tools.nwp import wrf_output as wo
 from brc_tools.nwp import wrf_tracers as wt
 
 
@@ -44,6 +45,21 @@ class TestDiscovery:
         ds["tr17_1"][:] = -1.0
         assert (wt.tracer_stack(ds) >= 0).all()
 
+    def test_a_float32_run_stacks_without_widening(self, ds):
+        ds32 = ds.assign({n: ds[n].astype(np.float32) for n in wt.tracer_variables(ds)})
+        stack = wt.tracer_stack(ds32)
+        assert stack.dtype == np.float32
+        np.testing.assert_allclose(stack, wt.tracer_stack(ds), rtol=1e-6)
+
+    def test_one_float64_tracer_widens_the_whole_stack(self, ds):
+        names = wt.tracer_variables(ds)
+        mixed = ds.assign({n: ds[n].astype(np.float32) for n in names[:-1]})
+        mixed[names[-1]] = ds[names[-1]].astype(np.float64) + 1e-9
+        stack = wt.tracer_stack(mixed)
+        assert stack.dtype == np.float64
+        np.testing.assert_array_equal(
+            stack[-1], np.maximum(wo._da(mixed, names[-1]).values, 0.0))
+
 
 class TestShares:
     def test_shares_sum_to_one_where_there_is_tagged_air(self, ds):